@@ -1,20 +1,50 @@
 """The Resideo Total Connect integration."""
 from __future__ import annotations
 
+from functools import partial
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
-
-from total_connect_client.client import TotalConnectClient
-from total_connect_client.exceptions import AuthenticationError
-
-from .const import AUTO_BYPASS, CONF_USERCODES
-from .coordinator import TotalConnectDataUpdateCoordinator
-
-PLATFORMS = [Platform.ALARM_CONTROL_PANEL, Platform.BINARY_SENSOR, Platform.BUTTON]
-
-type TotalConnectConfigEntry = ConfigEntry[TotalConnectDataUpdateCoordinator]
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    AUTO_BYPASS,
+    CONF_USERCODES,
+    DOMAIN,
+    ZONE_DIAGNOSTICS,
+    ZONE_DIAGNOSTICS_ENABLED,
+)
+from .coordinator import (
+    TotalConnectDataUpdateCoordinator,
+    TotalConnectRuntimeData,
+    TotalConnectZoneDetailsCoordinator,
+)
+from .restore import LastStateStore
+from .services import async_setup_services
+from .usage import ApiUsageTracker
+from .util import async_import_client, async_update_zone_diagnostics
+from .zone_statistics import ZoneStatisticsTracker
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+PLATFORMS = [
+    Platform.ALARM_CONTROL_PANEL,
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+    Platform.SENSOR,
+]
+
+type TotalConnectConfigEntry = ConfigEntry[TotalConnectRuntimeData]
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Total Connect integration."""
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(
@@ -33,20 +63,66 @@ async def async_setup_entry(
     temp_codes = conf[CONF_USERCODES]
     usercodes = {int(code): temp_codes[code] for code in temp_codes}
 
+    last_states = LastStateStore(hass, entry.entry_id)
+    await last_states.async_load()
+    # Show the last states while logging in and polling, the entities
+    # replace them once added
+    last_states.async_write_placeholders()
     try:
-        client = await hass.async_add_executor_job(
-            TotalConnectClient, username, password, usercodes, bypass
+        await async_import_client(hass)
+        from total_connect_client.client import TotalConnectClient
+        from total_connect_client.exceptions import AuthenticationError
+
+        usage = ApiUsageTracker(hass, entry.entry_id)
+        await usage.async_load()
+
+        try:
+            client = await hass.async_add_executor_job(
+                partial(
+                    TotalConnectClient,
+                    username,
+                    password,
+                    usercodes,
+                    bypass,
+                    load_details=False,
+                )
+            )
+        except AuthenticationError as exception:
+            raise ConfigEntryAuthFailed(
+                "Total Connect authentication failed during setup"
+            ) from exception
+        # Details are loaded once the client is instrumented, so they are counted
+        usage.instrument(client)
+        await hass.async_add_executor_job(client.load_details)
+
+        coordinator = TotalConnectDataUpdateCoordinator(hass, client, usage)
+        coordinator.async_apply_options(entry.options)
+        await coordinator.statistics.async_load()
+        await coordinator.async_config_entry_first_refresh()
+        entry.async_on_unload(
+            async_track_time_change(
+                hass, coordinator.async_reset_statistics, hour=0, minute=0, second=0
+            )
         )
-    except AuthenticationError as exception:
-        raise ConfigEntryAuthFailed(
-            "Total Connect authentication failed during setup"
-        ) from exception
-
-    coordinator = TotalConnectDataUpdateCoordinator(hass, client)
-    await coordinator.async_config_entry_first_refresh()
-
-    entry.runtime_data = coordinator
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        zone_details_coordinator = TotalConnectZoneDetailsCoordinator(hass, coordinator)
+        await zone_details_coordinator.async_config_entry_first_refresh()
+
+        entry.runtime_data = TotalConnectRuntimeData(
+            client,
+            coordinator,
+            zone_details_coordinator,
+            entry.options.get(ZONE_DIAGNOSTICS, ZONE_DIAGNOSTICS_ENABLED),
+            last_states,
+        )
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    finally:
+        # Saved states that no entity replaced, after a failure or of zones
+        # and partitions that are gone, must not look current
+        last_states.async_clear_placeholders()
+    entry.async_on_unload(
+        coordinator.async_add_listener(last_states.async_schedule_save)
+    )
+    last_states.async_schedule_save()
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
@@ -57,12 +133,30 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: TotalConnectConfigEntry
 ) -> bool:
     """Unload a config entry."""
+    # States are saved while the entities still have them
+    await entry.runtime_data.last_states.async_save()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: TotalConnectConfigEntry
+) -> None:
+    """Remove the stored data of a deleted config entry."""
+    await ApiUsageTracker(hass, entry.entry_id).async_remove()
+    await LastStateStore(hass, entry.entry_id).async_remove()
+    await ZoneStatisticsTracker(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, entry: TotalConnectConfigEntry) -> None:
     """Update listener."""
-    bypass = entry.options.get(AUTO_BYPASS, False)
-    client = entry.runtime_data.client
-    for location_id in client.locations:
-        client.locations[location_id].auto_bypass_low_battery = bypass
+    runtime_data = entry.runtime_data
+    zone_diagnostics = entry.options.get(ZONE_DIAGNOSTICS, ZONE_DIAGNOSTICS_ENABLED)
+    if zone_diagnostics != runtime_data.zone_diagnostics:
+        runtime_data.zone_diagnostics = zone_diagnostics
+        # The option decides which entities exist, they are removed and
+        # added without reloading
+        async_update_zone_diagnostics(hass, runtime_data.client, zone_diagnostics)
+        runtime_data.coordinator.async_add_missing_entities()
+    # Other options apply to the running coordinator, never reload the entry
+    # as that would repeat the login and topology fetch
+    runtime_data.coordinator.async_apply_options(entry.options)
@@ -1,7 +1,9 @@
 """Support for Resideo Total Connect alarm control panel entities."""
 from __future__ import annotations
 
-import logging
+import asyncio
+import time
+from typing import TYPE_CHECKING
 
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelEntity,
@@ -15,43 +17,69 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from total_connect_client import ArmingHelper
-from total_connect_client.exceptions import BadResultCodeError, UsercodeInvalid
-from total_connect_client.location import TotalConnectLocation
-
-from .const import CODE_REQUIRED, DOMAIN
+from .const import (
+    ARM_AWAY,
+    ARM_AWAY_INSTANT,
+    ARM_HOME,
+    ARM_HOME_INSTANT,
+    ARM_NIGHT,
+    DISARM,
+    DOMAIN,
+)
 from .coordinator import TotalConnectDataUpdateCoordinator
-from .entity import TotalConnectLocationEntity
-from .util import get_location_device_name
+from .entity import TotalConnectLocationEntity, async_add_location_entities
+from .interest import PARTITION
+from .log import COMMAND, SETUP, get_logger
+from .models import LocationSnapshot, PartitionSnapshot
+from .profiler import profiled
+from .retry import COMMAND_RETRY_POLICIES
+from .tracing import STAGE_CLOUD, STAGE_QUEUE, CommandTrace
+from .util import (
+    get_blocking_zones,
+    get_location_device_name,
+    is_command_confirmed,
+)
+
+if TYPE_CHECKING:
+    from total_connect_client import ArmingHelper
+    from total_connect_client.location import TotalConnectLocation
 
 SERVICE_ALARM_ARM_AWAY_INSTANT = "arm_away_instant"
 SERVICE_ALARM_ARM_HOME_INSTANT = "arm_home_instant"
 
-_LOGGER = logging.getLogger(__name__)
+_COMMAND_LOGGER = get_logger(COMMAND)
+_SETUP_LOGGER = get_logger(SETUP)
 
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up a Total Connect alarm control panel entity based on a config entry."""
-    coordinator = entry.runtime_data
-    code_required = entry.options.get(CODE_REQUIRED, False)
-    entities: list[TotalConnectAlarmControlPanelEntity] = []
+    coordinator = entry.runtime_data.coordinator
 
-    for location in coordinator.client.locations.values():
+    def location_entities(
+        location: TotalConnectLocation,
+    ) -> list[TotalConnectAlarmControlPanelEntity]:
+        """Return the alarm panels of the partitions of a location."""
+        entities: list[TotalConnectAlarmControlPanelEntity] = []
         for partition_id in location.partitions:
-            _LOGGER.debug(f"Found new device\n- name: {get_location_device_name(location)}\n- location_id: {location.location_id}\n- partition_id: {partition_id}")
+            _SETUP_LOGGER.debug(
+                "Found new device %s",
+                get_location_device_name(location),
+                location_id=location.location_id,
+                partition_id=partition_id,
+            )
 
             entities.append(
                 TotalConnectAlarmControlPanelEntity(
                     coordinator,
                     location,
                     partition_id,
-                    code_required,
                 )
             )
+        return entities
 
-    async_add_entities(entities)
+    async_add_location_entities(entry, async_add_entities, location_entities)
 
     # Set up services
     platform = entity_platform.async_get_current_platform()
@@ -83,10 +111,11 @@ class TotalConnectAlarmControlPanelEntity(TotalConnectLocationEntity, AlarmContr
         coordinator: TotalConnectDataUpdateCoordinator,
         location: TotalConnectLocation,
         partition_id: int,
-        require_code: bool,
     ) -> None:
         """Initialize the Total Connect alarm control panel entity."""
-        super().__init__(coordinator, location)
+        super().__init__(
+            coordinator, location, (PARTITION, location.location_id, int(partition_id))
+        )
         self._partition = self._location.partitions[partition_id]
         self._partition_id = int(partition_id)
 
@@ -103,11 +132,38 @@ class TotalConnectAlarmControlPanelEntity(TotalConnectLocationEntity, AlarmContr
             self._attr_translation_placeholders = {"partition_id": str(partition_id)}
             self._attr_unique_id = f"{location.location_id}_{partition_id}"
 
-        self._attr_code_arm_required = require_code
-        if require_code:
-            self._attr_code_format = CodeFormat.NUMBER
+    @property
+    def code_arm_required(self) -> bool:
+        """Return if the code is required for arm actions."""
+        return self.coordinator.code_required
+
+    @property
+    def code_format(self) -> CodeFormat | None:
+        """Return the code format."""
+        if self.coordinator.code_required:
+            return CodeFormat.NUMBER
+        return None
 
     @property
+    def location_id(self) -> int:
+        """Return the location ID of the partition."""
+        return self._location_id
+
+    @property
+    def available(self) -> bool:
+        """Return if the panel still reports the partition."""
+        return (
+            super().available
+            and self._partition_id in self.location_data.partitions
+        )
+
+    @property
+    def partition_data(self) -> PartitionSnapshot:
+        """Return the latest snapshot of the partition."""
+        return self.location_data.partitions[self._partition_id]
+
+    @property
+    @profiled("alarm_state")
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the state of the device."""
         # State attributes can be removed in 2025.3
@@ -116,28 +172,29 @@ class TotalConnectAlarmControlPanelEntity(TotalConnectLocationEntity, AlarmContr
 #            "triggered_zone": None,
         }
 
+        arming_state = self.partition_data.arming_state
         state: AlarmControlPanelState | None = None
-        if self._partition.arming_state.is_disarmed():
+        if arming_state.is_disarmed():
             state = AlarmControlPanelState.DISARMED
-        elif self._partition.arming_state.is_armed_night():
+        elif arming_state.is_armed_night():
             state = AlarmControlPanelState.ARMED_NIGHT
-        elif self._partition.arming_state.is_armed_home():
+        elif arming_state.is_armed_home():
             state = AlarmControlPanelState.ARMED_HOME
-        elif self._partition.arming_state.is_armed_away():
+        elif arming_state.is_armed_away():
             state = AlarmControlPanelState.ARMED_AWAY
-        elif self._partition.arming_state.is_armed_custom_bypass():
+        elif arming_state.is_armed_custom_bypass():
             state = AlarmControlPanelState.ARMED_CUSTOM_BYPASS
-        elif self._partition.arming_state.is_arming():
+        elif arming_state.is_arming():
             state = AlarmControlPanelState.ARMING
-        elif self._partition.arming_state.is_disarming():
+        elif arming_state.is_disarming():
             state = AlarmControlPanelState.DISARMING
-        elif self._partition.arming_state.is_triggered_police():
+        elif arming_state.is_triggered_police():
             state = AlarmControlPanelState.TRIGGERED
             attr["triggered_source"] = "Police/Medical"
-        elif self._partition.arming_state.is_triggered_fire():
+        elif arming_state.is_triggered_fire():
             state = AlarmControlPanelState.TRIGGERED
             attr["triggered_source"] = "Fire/Smoke"
-        elif self._partition.arming_state.is_triggered_gas():
+        elif arming_state.is_triggered_gas():
             state = AlarmControlPanelState.TRIGGERED
             attr["triggered_source"] = "Carbon Monoxide"
 
@@ -145,149 +202,214 @@ class TotalConnectAlarmControlPanelEntity(TotalConnectLocationEntity, AlarmContr
 
         return state
 
+    @property
+    def _arming_helper(self) -> ArmingHelper:
+        """Return an arming helper for the partition."""
+        from total_connect_client import ArmingHelper
+
+        return ArmingHelper(self._partition)
+
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
-        self._check_usercode(code)
-        try:
-            await self.hass.async_add_executor_job(self._disarm)
-        except UsercodeInvalid as error:
-            self.coordinator.config_entry.async_start_reauth(self.hass)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="disarm_invalid_code",
-            ) from error
-        except BadResultCodeError as error:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="disarm_failed",
-                translation_placeholders={"device": self.device.name},
-            ) from error
-        await self.coordinator.async_request_refresh()
+        self.check_usercode(code)
+        await self._async_run_command(DISARM)
 
+    @profiled("command.disarm")
     def _disarm(self) -> None:
         """Disarm synchronous."""
-        ArmingHelper(self._partition).disarm()
+        self._arming_helper.disarm()
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
-        self._check_usercode(code)
-        try:
-            await self.hass.async_add_executor_job(self._arm_home)
-        except UsercodeInvalid as error:
-            self.coordinator.config_entry.async_start_reauth(self.hass)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_home_invalid_code",
-            ) from error
-        except BadResultCodeError as error:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_home_failed",
-                translation_placeholders={"device": self.device.name},
-            ) from error
-        await self.coordinator.async_request_refresh()
+        self.check_usercode(code)
+        await self._async_run_command(ARM_HOME)
 
+    @profiled("command.arm_home")
     def _arm_home(self) -> None:
         """Arm home synchronous."""
-        ArmingHelper(self._partition).arm_stay()
+        self._arming_helper.arm_stay()
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
-        self._check_usercode(code)
-        try:
-            await self.hass.async_add_executor_job(self._arm_away)
-        except UsercodeInvalid as error:
-            self.coordinator.config_entry.async_start_reauth(self.hass)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_away_invalid_code",
-            ) from error
-        except BadResultCodeError as error:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_away_failed",
-                translation_placeholders={"device": self.device.name},
-            ) from error
-        await self.coordinator.async_request_refresh()
+        self.check_usercode(code)
+        await self._async_run_command(ARM_AWAY)
 
+    @profiled("command.arm_away")
     def _arm_away(self) -> None:
         """Arm away synchronous."""
-        ArmingHelper(self._partition).arm_away()
+        self._arming_helper.arm_away()
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
         """Send arm night command."""
-        self._check_usercode(code)
-        try:
-            await self.hass.async_add_executor_job(self._arm_night)
-        except UsercodeInvalid as error:
-            self.coordinator.config_entry.async_start_reauth(self.hass)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_night_invalid_code",
-            ) from error
-        except BadResultCodeError as error:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_night_failed",
-                translation_placeholders={"device": self.device.name},
-            ) from error
-        await self.coordinator.async_request_refresh()
+        self.check_usercode(code)
+        await self._async_run_command(ARM_NIGHT)
 
+    @profiled("command.arm_night")
     def _arm_night(self) -> None:
         """Arm night synchronous."""
-        ArmingHelper(self._partition).arm_stay_night()
+        self._arming_helper.arm_stay_night()
 
     async def async_alarm_arm_home_instant(self) -> None:
         """Send arm home instant command."""
-        try:
-            await self.hass.async_add_executor_job(self._arm_home_instant)
-        except UsercodeInvalid as error:
-            self.coordinator.config_entry.async_start_reauth(self.hass)
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_home_instant_invalid_code",
-            ) from error
-        except BadResultCodeError as error:
-            raise HomeAssistantError(
-                translation_domain=DOMAIN,
-                translation_key="arm_home_instant_failed",
-                translation_placeholders={"device": self.device.name},
-            ) from error
-        await self.coordinator.async_request_refresh()
+        await self._async_run_command(ARM_HOME_INSTANT)
 
+    @profiled("command.arm_home_instant")
     def _arm_home_instant(self):
         """Arm home instant synchronous."""
-        ArmingHelper(self._partition).arm_stay_instant()
+        self._arming_helper.arm_stay_instant()
 
     async def async_alarm_arm_away_instant(self) -> None:
         """Send arm away instant command."""
+        await self._async_run_command(ARM_AWAY_INSTANT)
+
+    @profiled("command.arm_away_instant")
+    def _arm_away_instant(self):
+        """Arm away instant synchronous."""
+        self._arming_helper.arm_away_instant()
+
+    async def _async_run_command(self, command: str) -> None:
+        """Execute a command and refresh the coordinator."""
+        await self.async_execute_command(command)
+        await self.coordinator.async_refresh_locations([self._location_id])
+
+    async def async_execute_command(self, command: str) -> None:
+        """Execute a command without refreshing the coordinator."""
+        if command != DISARM and self.coordinator.arm_precheck:
+            self.check_arm_ready(command)
+        tracer = self.coordinator.tracer
+        trace = tracer.start(
+            command, self._location_id, self._partition_id, self.entity_id
+        )
+        from total_connect_client.exceptions import (
+            BadResultCodeError,
+            ServiceUnavailable,
+            UsercodeInvalid,
+        )
+
         try:
-            await self.hass.async_add_executor_job(self._arm_away_instant)
+            await self._async_send_command(trace, command)
         except UsercodeInvalid as error:
             self.coordinator.config_entry.async_start_reauth(self.hass)
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
-                translation_key="arm_away_instant_invalid_code",
+                translation_key=f"{command}_invalid_code",
             ) from error
-        except BadResultCodeError as error:
+        except (BadResultCodeError, ServiceUnavailable) as error:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
-                translation_key="arm_away_instant_failed",
+                translation_key=f"{command}_failed",
                 translation_placeholders={"device": self.device.name},
             ) from error
-        await self.coordinator.async_request_refresh()
+        partition_id = self._partition_id
+        if command != DISARM:
+            self.coordinator.async_start_exit_delay(
+                self._location_id, partition_id, self.partition_data.exit_delay_timer
+            )
 
-    def _arm_away_instant(self):
-        """Arm away instant synchronous."""
-        ArmingHelper(self._partition).arm_away_instant()
+        def confirmed(location: LocationSnapshot) -> bool:
+            partition = location.partitions.get(partition_id)
+            return partition is not None and is_command_confirmed(
+                command, partition.arming_state
+            )
+
+        tracer.async_sent(trace, confirmed)
+
+    async def _async_send_command(self, trace: CommandTrace, command: str) -> None:
+        """Send a command, retrying while Total Connect is unavailable.
+
+        Attempts run in the executor and backoff waits on the event loop, so
+        a retried command does not hold an executor worker. Before sending
+        again the location is refreshed, a command that took effect even
+        though its response was lost is not sent twice.
+        """
+        from total_connect_client.exceptions import ServiceUnavailable
+
+        policy = COMMAND_RETRY_POLICIES[command]
+        # Commands map to the synchronous methods above, e.g. arm_home -> _arm_home
+        send = getattr(self, f"_{command}")
+
+        def run() -> None:
+            # The queue stage is the executor wait of the first attempt
+            if STAGE_QUEUE not in trace.stages:
+                trace.end_stage(STAGE_QUEUE)
+            send()
 
-    def _check_usercode(self, code):
+        deadline = time.monotonic() + policy.deadline
+        attempt = 0
+        try:
+            while True:
+                attempt += 1
+                try:
+                    if attempt == 1 or not await self._async_command_confirmed(
+                        command
+                    ):
+                        await self.hass.async_add_executor_job(run)
+                    break
+                except ServiceUnavailable as error:
+                    delay = policy.delay(attempt)
+                    if (
+                        attempt >= policy.attempts
+                        or time.monotonic() + delay > deadline
+                    ):
+                        raise
+                    _COMMAND_LOGGER.warning(
+                        "Retrying %s of %s in %.1f seconds: %s",
+                        command,
+                        self.entity_id,
+                        delay,
+                        error,
+                        location_id=self._location_id,
+                        partition_id=self._partition_id,
+                        operation=command,
+                    )
+                await asyncio.sleep(delay)
+        except Exception:
+            self.coordinator.tracer.async_failed(trace)
+            raise
+        trace.end_stage(STAGE_CLOUD)
+
+    async def _async_command_confirmed(self, command: str) -> bool:
+        """Refresh the location and return true if the command took effect."""
+        from total_connect_client.exceptions import ServiceUnavailable
+
+        await self.coordinator.async_refresh_locations([self._location_id])
+        if (
+            not self.coordinator.last_update_success
+            and (error := self.coordinator.last_exception) is not None
+        ):
+            # Retried like the command while Total Connect is unavailable
+            if isinstance(error.__cause__, ServiceUnavailable):
+                raise error.__cause__ from None
+            raise error
+        partition = self.location_data.partitions.get(self._partition_id)
+        return partition is not None and is_command_confirmed(
+            command, partition.arming_state
+        )
+
+    def check_usercode(self, code: str | None) -> None:
         """Check if the run-time entered code matches configured code."""
         if (
-            self._attr_code_arm_required
+            self.coordinator.code_required
             and self.coordinator.client.usercodes[self._location.location_id] != code
         ):
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="invalid_pin",
             )
+
+    def check_arm_ready(self, command: str) -> None:
+        """Reject an arm command that the latest zone states say will fail."""
+        if blocking := get_blocking_zones(
+            command,
+            self.location_data,
+            self._partition_id,
+            self._location.auto_bypass_low_battery,
+        ):
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="arm_blocked",
+                translation_placeholders={
+                    "device": self.device.name,
+                    "zones": ", ".join(sorted(zone.description for zone in blocking)),
+                },
+            )
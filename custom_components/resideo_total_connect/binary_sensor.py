@@ -2,8 +2,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
-import logging
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -14,13 +14,23 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+import homeassistant.util.dt as dt_util
 
-from total_connect_client.location import TotalConnectLocation
-from total_connect_client.zone import TotalConnectZone
-
+from .const import ZONE_DIAGNOSTICS_ATTRIBUTES, ZONE_DIAGNOSTICS_ENABLED
 from .coordinator import TotalConnectDataUpdateCoordinator
-from .entity import TotalConnectLocationEntity, TotalConnectZoneEntity
-from .util import get_security_zone_device_class
+from .entity import (
+    TotalConnectLocationEntity,
+    TotalConnectZoneEntity,
+    async_add_location_entities,
+)
+from .log import SETUP, get_logger
+from .models import LocationSnapshot, ZoneSnapshot
+from .profiler import profiled
+from .zone_statistics import ZoneStatistics
+
+if TYPE_CHECKING:
+    from total_connect_client.location import TotalConnectLocation
+    from total_connect_client.zone import TotalConnectZone
 
 BYPASS = "bypass"
 LOW_BATTERY = "low_battery"
@@ -28,34 +38,34 @@ TAMPER = "tamper"
 POWER = "power"
 ZONE = "zone"
 
-_LOGGER = logging.getLogger(__name__)
+_SETUP_LOGGER = get_logger(SETUP)
 
 @dataclass(frozen=True, kw_only=True)
 class TotalConnectBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Class to describe a Total Connect binary sensor entity."""
 
-    is_on_fn: Callable[[TotalConnectLocation], bool]
+    is_on_fn: Callable[[LocationSnapshot], bool]
 
 BINARY_SENSORS: list[TotalConnectBinarySensorEntityDescription] = [
     TotalConnectBinarySensorEntityDescription(
         key=LOW_BATTERY,
         device_class=BinarySensorDeviceClass.BATTERY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        is_on_fn=lambda location: location.is_low_battery(),
+        is_on_fn=lambda location: location.is_low_battery,
     ),
     TotalConnectBinarySensorEntityDescription(
         key=TAMPER,
         translation_key="tamper",
         device_class=BinarySensorDeviceClass.TAMPER,
         entity_category=EntityCategory.DIAGNOSTIC,
-        is_on_fn=lambda location: location.is_cover_tampered(),
+        is_on_fn=lambda location: location.is_cover_tampered,
     ),
     TotalConnectBinarySensorEntityDescription(
         key=POWER,
         translation_key="power",
         device_class=BinarySensorDeviceClass.POWER,
         entity_category=EntityCategory.DIAGNOSTIC,
-        is_on_fn=lambda location: not location.is_ac_loss(),
+        is_on_fn=lambda location: not location.is_ac_loss,
     ),
     TotalConnectBinarySensorEntityDescription(
         key="smoke",
@@ -80,28 +90,29 @@ BINARY_SENSORS: list[TotalConnectBinarySensorEntityDescription] = [
 class TotalConnectZoneBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Class to describe a Total Connect binary sensor entity."""
 
-    device_class_fn: Callable[[TotalConnectZone], BinarySensorDeviceClass] | None = None
-    is_on_fn: Callable[[TotalConnectZone], bool]
+    attributes_fn: Callable[[ZoneSnapshot], dict[str, Any]] | None = None
+    device_class_fn: Callable[[ZoneSnapshot], BinarySensorDeviceClass] | None = None
+    is_on_fn: Callable[[ZoneSnapshot], bool]
 
 ZONE_BINARY_SENSORS: list[TotalConnectZoneBinarySensorEntityDescription] = [
     TotalConnectZoneBinarySensorEntityDescription(
         key=BYPASS,
         translation_key="bypass",
         entity_category=EntityCategory.DIAGNOSTIC,
-        is_on_fn=lambda zone: zone.is_bypassed(),
+        is_on_fn=lambda zone: zone.is_bypassed,
     ),
     TotalConnectZoneBinarySensorEntityDescription(
         key=LOW_BATTERY,
         device_class=BinarySensorDeviceClass.BATTERY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        is_on_fn=lambda zone: zone.is_low_battery(),
+        is_on_fn=lambda zone: zone.is_low_battery,
     ),
     TotalConnectZoneBinarySensorEntityDescription(
         key=TAMPER,
         translation_key="tamper",
         device_class=BinarySensorDeviceClass.TAMPER,
         entity_category=EntityCategory.DIAGNOSTIC,
-        is_on_fn=lambda zone: zone.is_tampered(),
+        is_on_fn=lambda zone: zone.is_tampered,
     ),
 ]
 
@@ -110,10 +121,16 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up a Total Connect binary sensor entity based on a config entry."""
-    coordinator = entry.runtime_data
-    entities: list[TotalConnectBinarySensorEntity | TotalConnectZoneBinarySensorEntity] = []
+    coordinator = entry.runtime_data.coordinator
 
-    for location in coordinator.client.locations.values():
+    def location_entities(
+        location: TotalConnectLocation,
+    ) -> list[TotalConnectBinarySensorEntity | TotalConnectZoneBinarySensorEntity]:
+        """Return the entities of a location and its zones."""
+        zone_diagnostics = entry.runtime_data.zone_diagnostics
+        entities: list[
+            TotalConnectBinarySensorEntity | TotalConnectZoneBinarySensorEntity
+        ] = []
         for description in BINARY_SENSORS:
             entities.append(
                 TotalConnectBinarySensorEntity(
@@ -123,7 +140,15 @@ async def async_setup_entry(
                 )
             )
         for zone in location.zones.values():
-            _LOGGER.debug(f"Found new zone\n- name: {zone.description}\n- location_id: {location.location_id}\n- partition_id: {zone.partition}\n- zone_id: {zone.zoneid}")
+            _SETUP_LOGGER.debug(
+                "Found new zone %s",
+                zone.description,
+                location_id=location.location_id,
+                partition_id=zone.partition,
+                zone_id=zone.zoneid,
+            )
+            # Button zones have no diagnostics to report
+            diagnostics = not zone.is_type_button()
             entities.append(
                 TotalConnectZoneBinarySensorEntity(
                     coordinator,
@@ -132,13 +157,20 @@ async def async_setup_entry(
                     TotalConnectZoneBinarySensorEntityDescription(
                         key=ZONE,
                         name=None,
-                        device_class_fn=get_security_zone_device_class,
-                        is_on_fn=lambda zone: zone.is_faulted() or zone.is_triggered(),
+                        attributes_fn=(
+                            _zone_diagnostic_attributes if diagnostics else None
+                        ),
+                        device_class_fn=lambda zone: zone.device_class,
+                        is_on_fn=lambda zone: zone.is_faulted or zone.is_triggered,
                     ),
                 )
             )
-            if not zone.is_type_button():
+            if diagnostics and zone_diagnostics != ZONE_DIAGNOSTICS_ATTRIBUTES:
                 for description in ZONE_BINARY_SENSORS:
+                    if zone_diagnostics != ZONE_DIAGNOSTICS_ENABLED:
+                        description = replace(
+                            description, entity_registry_enabled_default=False
+                        )
                     entities.append(
                         TotalConnectZoneBinarySensorEntity(
                             coordinator,
@@ -147,8 +179,30 @@ async def async_setup_entry(
                             description,
                         )
                     )
+        return entities
+
+    async_add_location_entities(entry, async_add_entities, location_entities)
+
 
-    async_add_entities(entities)
+def _zone_diagnostic_attributes(zone: ZoneSnapshot) -> dict[str, Any]:
+    """Return the zone diagnostics reported as attributes of the zone."""
+    return {
+        "bypassed": zone.is_bypassed,
+        "low_battery": zone.is_low_battery,
+        "tampered": zone.is_tampered,
+    }
+
+
+def _zone_statistic_attributes(statistics: ZoneStatistics) -> dict[str, Any]:
+    """Return the zone statistics reported as attributes of the zone.
+
+    The open time is as of the last state written, it does not tick while
+    the zone stays open.
+    """
+    return {
+        "open_time": round(statistics.open_time(dt_util.utcnow())),
+        "openings": statistics.openings,
+    }
 
 
 class TotalConnectBinarySensorEntity(TotalConnectLocationEntity, BinarySensorEntity):
@@ -168,9 +222,10 @@ class TotalConnectBinarySensorEntity(TotalConnectLocationEntity, BinarySensorEnt
         self._attr_unique_id = f"{location.location_id}_{entity_description.key}"
 
     @property
+    @profiled("is_on")
     def is_on(self) -> bool:
         """Return the state of the entity."""
-        return self.entity_description.is_on_fn(self._location)
+        return self.entity_description.is_on_fn(self.location_data)
 
 
 class TotalConnectZoneBinarySensorEntity(TotalConnectZoneEntity, BinarySensorEntity):
@@ -190,13 +245,41 @@ class TotalConnectZoneBinarySensorEntity(TotalConnectZoneEntity, BinarySensorEnt
         self.entity_description = entity_description
 
     @property
+    def available(self) -> bool:
+        """Return if the panel still reports the zone."""
+        return super().available and self.zone_exists
+
+    @property
+    @profiled("is_on")
     def is_on(self) -> bool:
         """Return the state of the entity."""
-        return self.entity_description.is_on_fn(self._zone)
+        return self.entity_description.is_on_fn(self.zone_data)
 
     @property
+    @profiled("device_class")
     def device_class(self) -> BinarySensorDeviceClass | None:
         """Return the class of this zone."""
-        if self.entity_description.device_class_fn:
-            return self.entity_description.device_class_fn(self._zone)
+        # Until a removed zone's entity is gone, it has no data
+        if self.entity_description.device_class_fn and self.zone_exists:
+            return self.entity_description.device_class_fn(self.zone_data)
         return super().device_class
+
+    @property
+    @profiled("extra_state_attributes")
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the zone diagnostics and statistics, if not separate entities."""
+        # The option can change while the entity exists
+        if (
+            not self.entity_description.attributes_fn
+            or self.coordinator.config_entry.runtime_data.zone_diagnostics
+            != ZONE_DIAGNOSTICS_ATTRIBUTES
+        ):
+            return None
+        attributes = self.entity_description.attributes_fn(self.zone_data)
+        if (
+            statistics := self.coordinator.statistics.get(
+                self._location_id, self._zone_id
+            )
+        ) is not None:
+            attributes |= _zone_statistic_attributes(statistics)
+        return attributes
@@ -3,21 +3,30 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-import logging
-
-from total_connect_client.location import TotalConnectLocation
-from total_connect_client.zone import TotalConnectZone
+from typing import TYPE_CHECKING
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import DOMAIN, ZONE_DIAGNOSTICS_ENABLED
 from .coordinator import TotalConnectDataUpdateCoordinator
-from .entity import TotalConnectLocationEntity, TotalConnectZoneEntity
+from .entity import (
+    TotalConnectLocationEntity,
+    TotalConnectZoneEntity,
+    async_add_location_entities,
+)
+from .log import SETUP, get_logger
+from .profiler import profiled
 
-_LOGGER = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from total_connect_client.location import TotalConnectLocation
+    from total_connect_client.zone import TotalConnectZone
+
+_SETUP_LOGGER = get_logger(SETUP)
 
 @dataclass(frozen=True, kw_only=True)
 class TotalConnectButtonEntityDescription(ButtonEntityDescription):
@@ -45,10 +54,14 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up a Total Connect button entity based on a config entry."""
-    coordinator = entry.runtime_data
-    entities: list[TotalConnectButtonEntity | TotalConnectZoneButtonEntity] = []
+    coordinator = entry.runtime_data.coordinator
 
-    for location_id, location in coordinator.client.locations.items():
+    def location_entities(
+        location: TotalConnectLocation,
+    ) -> list[TotalConnectButtonEntity | TotalConnectZoneButtonEntity]:
+        """Return the buttons of a location and its zones."""
+        zone_diagnostics = entry.runtime_data.zone_diagnostics
+        entities: list[TotalConnectButtonEntity | TotalConnectZoneButtonEntity] = []
         for description in BUTTONS:
             entities.append(
                 TotalConnectButtonEntity(
@@ -58,7 +71,13 @@ async def async_setup_entry(
                 )
             )
         for zone in location.zones.values():
-            _LOGGER.debug(f"Found new zone\n- name: {zone.description}\n- location_id: {location.location_id}\n- partition_id: {zone.partition}\n- zone_id: {zone.zoneid}")
+            _SETUP_LOGGER.debug(
+                "Found new zone %s",
+                zone.description,
+                location_id=location.location_id,
+                partition_id=zone.partition,
+                zone_id=zone.zoneid,
+            )
             if zone.can_be_bypassed:
                 entities.append(
                     TotalConnectZoneButtonEntity(
@@ -68,12 +87,16 @@ async def async_setup_entry(
                         TotalConnectButtonEntityDescription(
                             key="bypass",
                             translation_key="bypass",
+                            entity_registry_enabled_default=(
+                                zone_diagnostics == ZONE_DIAGNOSTICS_ENABLED
+                            ),
                             press_fn=lambda zone: zone.bypass(),
                         ),
                     )
                 )
+        return entities
 
-    async_add_entities(entities)
+    async_add_location_entities(entry, async_add_entities, location_entities)
 
 
 class TotalConnectButtonEntity(TotalConnectLocationEntity, ButtonEntity):
@@ -92,6 +115,29 @@ class TotalConnectButtonEntity(TotalConnectLocationEntity, ButtonEntity):
         self.entity_description = entity_description
         self._attr_unique_id = f"{location.location_id}_{entity_description.key}"
 
+    async def async_press(self) -> None:
+        """Press the button."""
+        tracer = self.coordinator.tracer
+        trace = tracer.start(
+            self.entity_description.key, self._location_id, entity_id=self.entity_id
+        )
+        from total_connect_client.exceptions import TotalConnectError
+
+        try:
+            await self.async_traced_executor_job(trace, self.press)
+        except TotalConnectError as error:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key=f"{self.entity_description.key}_failed",
+                translation_placeholders={"device": self.device.name},
+            ) from error
+        else:
+            tracer.async_sent(trace)
+        finally:
+            # A failed press may still have changed the panel
+            await self.coordinator.async_refresh_locations([self._location_id])
+
+    @profiled("command.press")
     def press(self) -> None:
         """Press the button."""
         self.entity_description.press_fn(self._location)
@@ -113,6 +159,29 @@ class TotalConnectZoneButtonEntity(TotalConnectZoneEntity, ButtonEntity):
         super().__init__(coordinator, location, zone, entity_description.key)
         self.entity_description = entity_description
 
+    async def async_press(self) -> None:
+        """Press the button."""
+        tracer = self.coordinator.tracer
+        trace = tracer.start(
+            self.entity_description.key, self._location_id, entity_id=self.entity_id
+        )
+        from total_connect_client.exceptions import TotalConnectError
+
+        try:
+            await self.async_traced_executor_job(trace, self.press)
+        except TotalConnectError as error:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key=f"{self.entity_description.key}_failed",
+                translation_placeholders={"device": self._zone.description},
+            ) from error
+        else:
+            tracer.async_sent(trace)
+        finally:
+            # A failed press may still have changed the panel
+            await self.coordinator.async_refresh_locations([self._location_id])
+
+    @profiled("command.press")
     def press(self) -> None:
         """Press the button."""
         self.entity_description.press_fn(self._zone)
@@ -2,26 +2,59 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+import logging
 from typing import TYPE_CHECKING, Any
 
-from total_connect_client.client import TotalConnectClient
-from total_connect_client.exceptions import AuthenticationError
 import voluptuous as vol
 
 from homeassistant.config_entries import (
     ConfigEntry,
+    ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.const import CONF_LOCATION, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import (
+    CONF_LOCATION,
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_USERNAME,
+)
 from homeassistant.core import callback
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 from homeassistant.helpers.typing import VolDictType
 
-from .const import AUTO_BYPASS, CODE_REQUIRED, CONF_USERCODES, DOMAIN
+from .const import (
+    ARM_PRECHECK,
+    AUTO_BYPASS,
+    CODE_REQUIRED,
+    CONF_USERCODES,
+    DAILY_API_BUDGET,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EXPORT_ACTIVITY,
+    LOCATION_PRIORITIES,
+    PRIORITY_NORMAL,
+    TRACE_EVENTS,
+    ZONE_DIAGNOSTICS,
+    ZONE_DIAGNOSTICS_ATTRIBUTES,
+    ZONE_DIAGNOSTICS_DISABLED,
+    ZONE_DIAGNOSTICS_ENABLED,
+)
+from .polling import PRIORITIES
+from .util import async_import_client
+
+if TYPE_CHECKING:
+    from total_connect_client.client import TotalConnectClient
 
 PASSWORD_DATA_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): str})
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class TotalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
     """Total Connect config flow."""
@@ -50,6 +83,10 @@ class TotalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(username)
             self._abort_if_unique_id_configured()
 
+            await async_import_client(self.hass)
+            from total_connect_client.client import TotalConnectClient
+            from total_connect_client.exceptions import AuthenticationError
+
             try:
                 client = await self.hass.async_add_executor_job(
                     TotalConnectClient, username, password, None
@@ -155,24 +192,47 @@ class TotalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
                 data_schema=PASSWORD_DATA_SCHEMA,
             )
 
+        existing_entry = await self.async_set_unique_id(self.username)
+        if TYPE_CHECKING:
+            assert existing_entry is not None
+        # A loaded entry keeps its client, coordinators and entities,
+        # only the credentials of the running client are swapped
+        loaded = existing_entry.state is ConfigEntryState.LOADED
+
+        await async_import_client(self.hass)
+        from total_connect_client.client import TotalConnectClient
+        from total_connect_client.exceptions import (
+            AuthenticationError,
+            ServiceUnavailable,
+        )
+
         try:
-            await self.hass.async_add_executor_job(
-                TotalConnectClient,
-                self.username,
-                user_input[CONF_PASSWORD],
-                self.usercodes,
-            )
+            if loaded:
+                await self.hass.async_add_executor_job(
+                    existing_entry.runtime_data.coordinator.sync_update_credentials,
+                    user_input[CONF_PASSWORD],
+                )
+            else:
+                await self.hass.async_add_executor_job(
+                    TotalConnectClient,
+                    self.username,
+                    user_input[CONF_PASSWORD],
+                    self.usercodes,
+                )
         except AuthenticationError:
             errors["base"] = "invalid_auth"
+        except ServiceUnavailable:
+            errors["base"] = "cannot_connect"
+        except Exception:
+            _LOGGER.exception("Unexpected exception during reauthentication")
+            errors["base"] = "unknown"
+        if errors:
             return self.async_show_form(
                 step_id="reauth_confirm",
                 errors=errors,
                 data_schema=PASSWORD_DATA_SCHEMA,
             )
 
-        existing_entry = await self.async_set_unique_id(self.username)
-        if TYPE_CHECKING:
-            assert existing_entry is not None
         new_entry = {
             CONF_USERNAME: self.username,
             CONF_PASSWORD: user_input[CONF_PASSWORD],
@@ -180,9 +240,17 @@ class TotalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
         }
         self.hass.config_entries.async_update_entry(existing_entry, data=new_entry)
 
-        self.hass.async_create_task(
-            self.hass.config_entries.async_reload(existing_entry.entry_id)
-        )
+        if loaded:
+            # Polling stops after an authentication failure, refreshing restarts it
+            runtime_data = existing_entry.runtime_data
+            self.hass.async_create_task(runtime_data.coordinator.async_refresh_all())
+            self.hass.async_create_task(
+                runtime_data.zone_details_coordinator.async_request_refresh()
+            )
+        else:
+            self.hass.async_create_task(
+                self.hass.config_entries.async_reload(existing_entry.entry_id)
+            )
 
         return self.async_abort(reason="reauth_successful")
 
@@ -198,17 +266,34 @@ class TotalConnectConfigFlow(ConfigFlow, domain=DOMAIN):
 class TotalConnectOptionsFlowHandler(OptionsFlow):
     """TotalConnect options flow handler."""
 
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self.options: dict[str, Any] = {}
+
     async def async_step_init(
-        self, user_input: dict[str, bool] | None = None
+        self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage the options."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            self.options = {
+                **user_input,
+                LOCATION_PRIORITIES: self.config_entry.options.get(
+                    LOCATION_PRIORITIES, {}
+                ),
+            }
+            # Locations are only known while the entry is loaded
+            if self.config_entry.state is ConfigEntryState.LOADED:
+                return await self.async_step_polling()
+            return self.async_create_entry(title="", data=self.options)
 
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
                 {
+                    vol.Required(
+                        ARM_PRECHECK,
+                        default=self.config_entry.options.get(ARM_PRECHECK, False),
+                    ): bool,
                     vol.Required(
                         AUTO_BYPASS,
                         default=self.config_entry.options.get(AUTO_BYPASS, False),
@@ -217,6 +302,75 @@ class TotalConnectOptionsFlowHandler(OptionsFlow):
                         CODE_REQUIRED,
                         default=self.config_entry.options.get(CODE_REQUIRED, False),
                     ): bool,
+                    vol.Required(
+                        CONF_SCAN_INTERVAL,
+                        default=self.config_entry.options.get(
+                            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                    vol.Required(
+                        DAILY_API_BUDGET,
+                        default=self.config_entry.options.get(DAILY_API_BUDGET, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Required(
+                        EXPORT_ACTIVITY,
+                        default=self.config_entry.options.get(EXPORT_ACTIVITY, False),
+                    ): bool,
+                    vol.Required(
+                        TRACE_EVENTS,
+                        default=self.config_entry.options.get(TRACE_EVENTS, False),
+                    ): bool,
+                    vol.Required(
+                        ZONE_DIAGNOSTICS,
+                        default=self.config_entry.options.get(
+                            ZONE_DIAGNOSTICS, ZONE_DIAGNOSTICS_ENABLED
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[
+                                ZONE_DIAGNOSTICS_ENABLED,
+                                ZONE_DIAGNOSTICS_DISABLED,
+                                ZONE_DIAGNOSTICS_ATTRIBUTES,
+                            ],
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=ZONE_DIAGNOSTICS,
+                        )
+                    ),
                 }
             ),
         )
+
+    async def async_step_polling(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the polling priority of each location."""
+        if user_input is not None:
+            self.options[LOCATION_PRIORITIES] = user_input
+            return self.async_create_entry(title="", data=self.options)
+
+        locations = self.config_entry.runtime_data.client.locations
+        priorities = self.options[LOCATION_PRIORITIES]
+        return self.async_show_form(
+            step_id="polling",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        str(location_id),
+                        default=priorities.get(str(location_id), PRIORITY_NORMAL),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=list(PRIORITIES),
+                            mode=SelectSelectorMode.DROPDOWN,
+                            translation_key=LOCATION_PRIORITIES,
+                        )
+                    )
+                    for location_id in locations
+                }
+            ),
+            description_placeholders={
+                "locations": "\n".join(
+                    f"{location_id}: {location.location_name}"
+                    for location_id, location in locations.items()
+                )
+            },
+        )
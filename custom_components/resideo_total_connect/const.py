@@ -3,12 +3,36 @@ from __future__ import annotations
 
 from homeassistant.const import ATTR_MODEL
 
+ARM_AWAY = "arm_away"
+ARM_AWAY_INSTANT = "arm_away_instant"
+ARM_HOME = "arm_home"
+ARM_HOME_INSTANT = "arm_home_instant"
+ARM_NIGHT = "arm_night"
+ARM_PRECHECK = "arm_precheck"
 ATTR_ZONES = "zones"
 AUTO_BYPASS = "auto_bypass_low_battery"
 CODE_REQUIRED = "code_required"
 CONF_USERCODES = "usercodes"
+DAILY_API_BUDGET = "daily_api_budget"
 DEFAULT_MANUFACTURER = "Resideo"
+DEFAULT_SCAN_INTERVAL = 30
+DISARM = "disarm"
 DOMAIN = "resideo_total_connect"
+EXPORT_ACTIVITY = "export_activity"
+LOCATION_PRIORITIES = "location_priorities"
+TRACE_EVENTS = "trace_events"
+ZONE_DIAGNOSTICS = "zone_diagnostics"
+
+# Values of the zone diagnostics option
+ZONE_DIAGNOSTICS_ATTRIBUTES = "attributes"
+ZONE_DIAGNOSTICS_DISABLED = "disabled"
+ZONE_DIAGNOSTICS_ENABLED = "enabled"
+
+# Polling priorities of locations
+PRIORITY_HIGH = "high"
+PRIORITY_LOW = "low"
+PRIORITY_NORMAL = "normal"
+PRIORITY_ON_DEMAND = "on_demand"
 
 LOCATION_ZONE_DEVICE_INFO = {
     1037428: {
@@ -1,48 +1,539 @@
 """Data update coordinator class for Resideo Total Connect entities."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import json
 import logging
-
-from total_connect_client.client import TotalConnectClient
-from total_connect_client.exceptions import (
-    AuthenticationError,
-    ServiceUnavailable,
-    TotalConnectError,
-)
+import threading
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
+from .const import (
+    ARM_PRECHECK,
+    AUTO_BYPASS,
+    CODE_REQUIRED,
+    DAILY_API_BUDGET,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    EXPORT_ACTIVITY,
+    LOCATION_PRIORITIES,
+    TRACE_EVENTS,
+)
+from .exit_delay import ExitDelayTracker
+from .exporter import ActivityExporter
+from .fixture import FixtureBuilder
+from .interest import LOCATION, PARTITION, ZONE, InterestIndex, InterestKey
+from .log import REFRESH, TOPOLOGY, get_logger
+from .models import SnapshotDiff, TotalConnectSnapshot, ZoneDetailsSnapshot
+from .polling import PollScheduler
+from .profiler import TotalConnectProfiler, profiled
+from .restore import LastStateStore
+from .summary import ZoneSummaryTracker
+from .tracing import CommandTracer
+from .usage import ApiUsageTracker
+from .util import async_remove_partition_entities, async_remove_zone_entities
+from .zone_statistics import ZoneStatisticsTracker
+
+if TYPE_CHECKING:
+    from total_connect_client.client import TotalConnectClient
+    from total_connect_client.location import TotalConnectLocation
 
-SCAN_INTERVAL = timedelta(seconds=30)
+# Private parsing methods of TotalConnectLocation that polls call with
+# the status they fetched, as get_panel_meta_data discards it. The manifest
+# pins total-connect-client exactly, the methods are checked for at setup
+# in case another version is installed.
+LOCATION_PARSERS = ("_update_status", "_update_partitions", "_update_zones")
+# Fields of a status payload that LOCATION_PARSERS read. Others, such as
+# PanelStatus.LastUpdatedTimestampTicks, change on every poll.
+PANEL_STATUS_FIELDS = (
+    "IsInACLoss",
+    "IsInLowBattery",
+    "IsCoverTampered",
+    "ConfigurationSequenceNumber",
+)
+PARTITION_STATUS_FIELDS = ("PartitionID", "ArmingState")
+ZONE_STATUS_FIELDS = (
+    "ZoneID",
+    "ZoneDescription",
+    "PartitionId",
+    "PartitionID",
+    "ZoneStatus",
+    "CanBeBypassed",
+    "ZoneTypeId",
+    "Batterylevel",
+    "Signalstrength",
+    "zoneAdditionalInfo",
+)
+# Polls a zone or partition must be missing from before it is removed
+TOPOLOGY_REMOVE_POLLS = 3
+ZONE_DETAILS_SCAN_INTERVAL = timedelta(hours=1)
 _LOGGER = logging.getLogger(__name__)
+_REFRESH_LOGGER = get_logger(REFRESH)
+_TOPOLOGY_LOGGER = get_logger(TOPOLOGY)
 
 
-class TotalConnectDataUpdateCoordinator(DataUpdateCoordinator[None]):
+def client_has_parsers() -> bool:
+    """Return if the installed client has the location parsers polls call."""
+    from total_connect_client.location import TotalConnectLocation
+
+    if all(hasattr(TotalConnectLocation, name) for name in LOCATION_PARSERS):
+        return True
+    _LOGGER.warning(
+        "The installed total-connect-client lacks %s, unchanged statuses are "
+        "parsed again and zones removed at the panel are kept",
+        ", ".join(LOCATION_PARSERS),
+    )
+    return False
+
+
+def payload_fingerprint(payload: Mapping[str, Any]) -> int:
+    """Return a fingerprint of the fields of a status payload that are parsed.
+
+    Payloads that only differ in fields the client does not parse, such as
+    the time of the response, have the same fingerprint.
+    """
+    status = payload.get("PanelStatus") or {}
+    return hash(
+        json.dumps(
+            [
+                payload.get("ArmingState"),
+                [status.get(field) for field in PANEL_STATUS_FIELDS],
+                [
+                    [partition.get(field) for field in PARTITION_STATUS_FIELDS]
+                    for partition in status.get("Partitions") or ()
+                ],
+                [
+                    [zone.get(field) for field in ZONE_STATUS_FIELDS]
+                    for zone in status.get("Zones") or ()
+                ],
+            ]
+        )
+    )
+
+
+class TotalConnectDataUpdateCoordinator(DataUpdateCoordinator[TotalConnectSnapshot]):
     """Class to fetch data from Total Connect."""
 
     config_entry: ConfigEntry
 
-    def __init__(self, hass: HomeAssistant, client: TotalConnectClient) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: TotalConnectClient,
+        usage: ApiUsageTracker,
+    ) -> None:
         """Initialize."""
         self.client = client
+        self.client_lock = threading.Lock()
+        self.profiler = TotalConnectProfiler()
+        self.exit_delays = ExitDelayTracker()
+        self.exporter: ActivityExporter | None = None
+        self.fixture = FixtureBuilder()
+        self.interest = InterestIndex()
+        self.polling = PollScheduler()
+        self.summary = ZoneSummaryTracker()
+        self.tracer = CommandTracer(hass)
+        self.usage = usage
+        self.arm_precheck = False
+        self.code_required = False
+        self._refresh_lock = asyncio.Lock()
+        self._pending_locations: set[int] = set()
+        self._pending_refresh: asyncio.Future[None] | None = None
+        self._changed: set[InterestKey] | None = None
+        self._poll_all = False
+        self._fingerprints: dict[int, int] = {}
+        self._has_parsers = client_has_parsers()
+        self._missing: Counter[tuple[str, int, int]] = Counter()
+        self._poll_listeners: list[CALLBACK_TYPE] = []
+        self._topology_listeners: list[Callable[[set[int]], None]] = []
         super().__init__(
-            hass, logger=_LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL
+            hass,
+            logger=_LOGGER,
+            name=DOMAIN,
+            update_interval=self.polling.interval,
+            # A poll that changed nothing returns the previous snapshot
+            always_update=False,
+        )
+        self.statistics = ZoneStatisticsTracker(
+            hass, self.config_entry.entry_id, self.interest.zones
+        )
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply config entry options to the running client and entities."""
+        bypass = options.get(AUTO_BYPASS, False)
+        self.client.auto_bypass_low_battery = bypass
+        for location in self.client.locations.values():
+            location.auto_bypass_low_battery = bypass
+        self.arm_precheck = options.get(ARM_PRECHECK, False)
+        self.code_required = options.get(CODE_REQUIRED, False)
+        self.tracer.fire_events = options.get(TRACE_EVENTS, False)
+        self._async_apply_export(options.get(EXPORT_ACTIVITY, False))
+        self.usage.budget = options.get(DAILY_API_BUDGET, 0)
+        # The new schedule is used from the next scheduled refresh
+        self.polling.configure(
+            timedelta(seconds=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)),
+            options.get(LOCATION_PRIORITIES, {}),
         )
+        self._async_update_interval()
+        # The client applies options such as auto bypass while parsing
+        self._fingerprints.clear()
+        self._changed = None
+        if self.data is not None:
+            # Entities such as the alarm panel derive attributes from options
+            self.async_update_listeners()
+
+    @callback
+    def _async_apply_export(self, enabled: bool) -> None:
+        """Start or stop the activity exporter."""
+        if enabled and self.exporter is None:
+            self.exporter = ActivityExporter(
+                self.hass,
+                self.hass.config.path(f"{DOMAIN}_activity"),
+                self.config_entry.entry_id,
+            )
+            self.exporter.async_start()
+        elif not enabled and self.exporter is not None:
+            self.config_entry.async_create_background_task(
+                self.hass, self.exporter.async_stop(), f"{DOMAIN} stop export"
+            )
+            self.exporter = None
+
+    @callback
+    def _async_update_interval(self) -> None:
+        """Tick at the shortest poll period, stretched when the budget runs low."""
+        tick, calls_per_tick = self.polling.tick(self.client.locations)
+        self.update_interval = self.usage.poll_interval(tick, calls_per_tick)
+        self.polling.stretch = self.update_interval / tick
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexing the key in the context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        if context is None:
+            return remove_listener
+        self.interest.add(context)
+
+        @callback
+        def remove_interest() -> None:
+            remove_listener()
+            self.interest.remove(context)
+
+        return remove_interest
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners following what changed in the last refresh.
+
+        Listeners without a context, such as location entities, are always
+        updated.
+        """
+        changed = self._changed
+        self._changed = None
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or context in changed:
+                update_callback()
 
-    async def _async_update_data(self) -> None:
+    @callback
+    def async_add_poll_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for every poll, including those that changed no location."""
+        self._poll_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._poll_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_topology_listener(
+        self, update_callback: Callable[[set[int]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for zones and partitions added after the first refresh.
+
+        The callback is passed the ids of the locations that changed.
+        """
+        self._topology_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._topology_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_missing_entities(self) -> None:
+        """Have the platforms add the entities of every location they lack."""
+        for update_callback in list(self._topology_listeners):
+            update_callback(set(self.client.locations))
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call and write the remaining activity."""
+        await super().async_shutdown()
+        if self.exporter is not None:
+            await self.exporter.async_stop()
+            self.exporter = None
+
+    async def _async_update_data(self) -> TotalConnectSnapshot:
         """Update data."""
-        await self.hass.async_add_executor_job(self.sync_update_data)
+        # Listeners are all updated after a failure
+        self._changed = None
+        poll_all, self._poll_all = self._poll_all, False
+        location_ids: set[int] | None = None
+        if self.data is not None and not poll_all:
+            # The first refresh polls every location, later ones those due
+            location_ids = self.polling.due(self.client.locations, self.update_interval)
+            if not location_ids:
+                return self.data
+        async with self._refresh_lock:
+            started = time.monotonic()
+            snapshot = await self.hass.async_add_executor_job(
+                self.sync_update_data, location_ids
+            )
+        # Scheduled polls are spaced out to fit the budget
+        self._async_update_interval()
+        self.polling.polled(
+            self.client.locations if location_ids is None else location_ids, started
+        )
+        self._async_process_snapshot(snapshot)
+        return snapshot
+
+    async def async_refresh_all(self) -> None:
+        """Poll every location now, whether or not the schedule says it is due.
+
+        async_refresh only polls the locations that are due, so right after
+        a poll it does nothing.
+        """
+        self._poll_all = True
+        await self.async_refresh()
 
-    def sync_update_data(self) -> None:
-        """Fetch synchronous data from Total Connect."""
+    async def async_refresh_locations(self, location_ids: Iterable[int]) -> None:
+        """Refresh some locations, sharing a single poll with concurrent callers.
+
+        A poll that is already running may have fetched the panel before the
+        caller's command completed, so callers join the next poll instead. It
+        starts once the running poll finishes and covers every location
+        requested in the meantime. Failures are not raised, as callers have
+        already completed their command, but go through the coordinator's
+        error handling as for a failed poll.
+        """
+        self._pending_locations.update(location_ids)
+        if (future := self._pending_refresh) is None:
+            future = self._pending_refresh = self.hass.loop.create_future()
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_refresh_pending(future),
+                f"{DOMAIN} refresh locations",
+            )
+        await asyncio.shield(future)
+
+    async def _async_refresh_pending(self, future: asyncio.Future[None]) -> None:
+        """Poll the pending locations and publish the new snapshot."""
         try:
-            for location_id in self.client.locations:
-                self.client.locations[location_id].get_panel_meta_data()
+            async with self._refresh_lock:
+                location_ids = self._pending_locations
+                self._pending_locations = set()
+                self._pending_refresh = None
+                started = time.monotonic()
+                try:
+                    snapshot = await self.hass.async_add_executor_job(
+                        self.sync_update_data, location_ids
+                    )
+                except (ConfigEntryAuthFailed, UpdateFailed) as exception:
+                    _REFRESH_LOGGER.debug(
+                        "Refresh of locations %s failed: %s",
+                        location_ids,
+                        exception,
+                        operation="refresh_locations",
+                    )
+                    if isinstance(exception, ConfigEntryAuthFailed):
+                        # Like a failed poll, stop polling until reauth
+                        self._async_unsub_refresh()
+                        self.config_entry.async_start_reauth(self.hass)
+                    # Entities go unavailable until a poll succeeds
+                    self._changed = None
+                    self.async_set_update_error(exception)
+                else:
+                    self.polling.polled(location_ids, started)
+                    self._async_process_snapshot(snapshot)
+                    # An unchanged snapshot still ends a failure
+                    if snapshot is not self.data or not self.last_update_success:
+                        self.async_set_updated_data(snapshot)
+        finally:
+            future.set_result(None)
+
+    @callback
+    def _async_process_snapshot(self, snapshot: TotalConnectSnapshot) -> None:
+        """Update derived state from the changes in a new snapshot."""
+        self.usage.async_schedule_save()
+        for update_callback in list(self._poll_listeners):
+            update_callback()
+        # Commands that changed nothing are confirmed by any poll
+        self.tracer.async_process_snapshot(snapshot)
+        if snapshot is self.data:
+            return
+        self._changed = None
+        # Only zones that enabled entities follow are compared, unless
+        # the activity of every zone is exported
+        diff = SnapshotDiff.between(
+            self.data,
+            snapshot,
+            self.interest.zones if self.exporter is None else None,
+        )
+        for location_id, old_zone, new_zone in diff.zones:
+            _REFRESH_LOGGER.debug(
+                "Zone %s changed: %s",
+                (new_zone or old_zone).description,
+                new_zone,
+                location_id=location_id,
+                zone_id=(new_zone or old_zone).zone_id,
+            )
+        for location_id, old_partition, new_partition in diff.partitions:
+            _REFRESH_LOGGER.debug(
+                "Partition changed: %s",
+                new_partition,
+                location_id=location_id,
+                partition_id=(new_partition or old_partition).partition_id,
+            )
+        self.summary.apply(diff)
+        self.statistics.async_apply(diff)
+        self.exit_delays.async_sync(snapshot)
+        if self.exporter is not None:
+            self.exporter.async_record(diff)
+        if self.data is None:
+            return
+        self._async_update_topology(diff)
+        # Entities come back after a failure, update them all
+        if self.last_update_success:
+            self._changed = {
+                *(
+                    (ZONE, location_id, (new or old).zone_id)
+                    for location_id, old, new in diff.zones
+                ),
+                *(
+                    (PARTITION, location_id, (new or old).partition_id)
+                    for location_id, old, new in diff.partitions
+                ),
+                *((PARTITION, *key) for key in self.exit_delays.changed),
+                *((LOCATION, scope[0]) for scope in self.summary.changed),
+            }
+
+    @callback
+    def async_start_exit_delay(
+        self, location_id: int, partition_id: int, delay: int | None
+    ) -> None:
+        """Start the exit delay countdown of a partition and show it now.
+
+        The refresh after the command may return the same snapshot, so the
+        entities of the partition are updated right away.
+        """
+        if not self.exit_delays.async_start(location_id, partition_id, delay):
+            return
+        key = (PARTITION, location_id, partition_id)
+        for update_callback, context in list(self._listeners.values()):
+            if context == key:
+                update_callback()
+
+    @callback
+    def async_reset_statistics(self, now: datetime) -> None:
+        """Start a new period of zone statistics, at midnight.
+
+        Location entities, which are always updated, include the API usage
+        sensors, so they show the new day without waiting for a poll.
+        """
+        changed = self.statistics.async_reset(now)
+        if self.data is None:
+            return
+        self._changed = {(ZONE, *key) for key in changed}
+        self.async_update_listeners()
+
+    @callback
+    def _async_update_topology(self, diff: SnapshotDiff) -> None:
+        """Add entities of new zones and partitions, remove those of deleted ones."""
+        entry_id = self.config_entry.entry_id
+        added: set[int] = set()
+        for location_id, old_zone, new_zone in diff.zones:
+            if old_zone is None:
+                _TOPOLOGY_LOGGER.info(
+                    "Zone %s added",
+                    new_zone.description,
+                    location_id=location_id,
+                    zone_id=new_zone.zone_id,
+                )
+                added.add(location_id)
+            elif new_zone is None:
+                _TOPOLOGY_LOGGER.info(
+                    "Zone %s removed",
+                    old_zone.description,
+                    location_id=location_id,
+                    zone_id=old_zone.zone_id,
+                )
+                async_remove_zone_entities(
+                    self.hass, entry_id, location_id, old_zone.zone_id
+                )
+        for location_id, old_partition, new_partition in diff.partitions:
+            if old_partition is None:
+                _TOPOLOGY_LOGGER.info(
+                    "Partition added",
+                    location_id=location_id,
+                    partition_id=new_partition.partition_id,
+                )
+                added.add(location_id)
+            elif new_partition is None:
+                _TOPOLOGY_LOGGER.info(
+                    "Partition removed",
+                    location_id=location_id,
+                    partition_id=old_partition.partition_id,
+                )
+                async_remove_partition_entities(
+                    self.hass, location_id, old_partition.partition_id
+                )
+        if added:
+            for update_callback in list(self._topology_listeners):
+                update_callback(added)
+
+    @profiled("sync_update_data")
+    def sync_update_data(
+        self, location_ids: Collection[int] | None = None
+    ) -> TotalConnectSnapshot:
+        """Fetch synchronous data from Total Connect and snapshot it.
+
+        If location_ids is given, only those locations are polled. Locations
+        whose status is unchanged keep their previous snapshot, and if none
+        changed the previous snapshot is returned.
+        """
+        from total_connect_client.exceptions import (
+            AuthenticationError,
+            ServiceUnavailable,
+            TotalConnectError,
+        )
+
+        try:
+            with self.client_lock:
+                changed = [
+                    location_id
+                    for location_id, location in self.client.locations.items()
+                    if (location_ids is None or location_id in location_ids)
+                    and self._sync_update_location(location)
+                ]
+                if self.data is not None and not changed:
+                    return self.data
+                return TotalConnectSnapshot.from_client(
+                    self.client, self.data, changed
+                )
         except AuthenticationError as exception:
             # should only encounter if password changes during operation
             raise ConfigEntryAuthFailed(
@@ -57,3 +548,201 @@ class TotalConnectDataUpdateCoordinator(DataUpdateCoordinator[None]):
             raise UpdateFailed(exception) from exception
         except ValueError as exception:
             raise UpdateFailed("Unknown state from Total Connect") from exception
+
+    def _sync_update_location(self, location: TotalConnectLocation) -> bool:
+        """Poll the status of a location and return if it changed.
+
+        Like get_panel_meta_data, which adds zones it has not seen but never
+        removes any and ignores partitions it has not seen. Here details are
+        loaded for new zones and partitions, and those missing from the
+        status for a few polls in a row are removed. Zone and partition
+        objects the client already had are kept, as entities hold on to them.
+
+        A status identical to the last one parsed is not parsed again, unless
+        zones or partitions are pending removal and the poll must count.
+        Clients without the parsers in LOCATION_PARSERS are polled with
+        get_panel_meta_data instead.
+        """
+        from total_connect_client.const import make_http_endpoint
+
+        started = time.monotonic()
+        if not self._has_parsers:
+            location.get_panel_meta_data()
+            return True
+        result = self.client.http_request(
+            endpoint=make_http_endpoint(
+                f"api/v3/locations/{location.location_id}/partitions/fullStatus"
+            ),
+            method="GET",
+        )
+        self.client.raise_for_resultcode(result)
+        fingerprint = payload_fingerprint(result)
+        if self._fingerprints.get(location.location_id) == fingerprint and not any(
+            key[1] == location.location_id for key in self._missing
+        ):
+            _REFRESH_LOGGER.debug(
+                "Status unchanged",
+                location_id=location.location_id,
+                operation="full_status",
+                duration=time.monotonic() - started,
+            )
+            return False
+        location._update_status(result)  # noqa: SLF001
+        status = result["PanelStatus"]
+
+        partition_ids = {
+            partition["PartitionID"]
+            for partition in status["Partitions"]
+            if "PartitionID" in partition
+        }
+        removed = self._sync_missing(
+            location, "partition", location.partitions, partition_ids
+        )
+        if removed or partition_ids - location.partitions.keys():
+            known = dict(location.partitions)
+            location.get_partition_details()
+            location.partitions.update(known)
+            for partition_id in removed:
+                del location.partitions[partition_id]
+        location._update_partitions(status["Partitions"])  # noqa: SLF001
+
+        known = dict(location.zones)
+        location._update_zones(status["Zones"])  # noqa: SLF001
+        zone_ids = {zone["ZoneID"] for zone in status["Zones"]}
+        if location.zones.keys() - known.keys():
+            location.get_zone_details()
+            location.zones.update(known)
+            # Zone details may list zones the status does not report
+            for zone_id in location.zones.keys() - known.keys() - zone_ids:
+                del location.zones[zone_id]
+        for zone_id in self._sync_missing(location, "zone", known, zone_ids):
+            del location.zones[zone_id]
+        self._fingerprints[location.location_id] = fingerprint
+        _REFRESH_LOGGER.debug(
+            "Status changed, %s zones and %s partitions",
+            len(location.zones),
+            len(location.partitions),
+            location_id=location.location_id,
+            operation="full_status",
+            duration=time.monotonic() - started,
+        )
+        return True
+
+    def _sync_missing(
+        self,
+        location: TotalConnectLocation,
+        kind: str,
+        known: Collection[int],
+        reported: Collection[int],
+    ) -> list[int]:
+        """Count polls that known ids are missing from, return those to remove."""
+        removed = []
+        for item_id in known:
+            key = (kind, location.location_id, item_id)
+            if item_id in reported:
+                self._missing.pop(key, None)
+                continue
+            self._missing[key] += 1
+            if self._missing[key] >= TOPOLOGY_REMOVE_POLLS:
+                del self._missing[key]
+                removed.append(item_id)
+        return removed
+
+    def sync_update_credentials(self, password: str) -> None:
+        """Log the running client in with a new password.
+
+        The previous password is restored unless the login succeeds.
+        """
+        with self.client_lock:
+            previous = (self.client.password, self.client._invalid_credentials)  # noqa: SLF001
+            self.client.password = password
+            self.client._invalid_credentials = False  # noqa: SLF001
+            try:
+                self.client.authenticate()
+            except BaseException:
+                self.client.password, self.client._invalid_credentials = previous  # noqa: SLF001
+                raise
+
+
+ZoneDetailsData = Mapping[int, Mapping[int, ZoneDetailsSnapshot]]
+
+
+class TotalConnectZoneDetailsCoordinator(DataUpdateCoordinator[ZoneDetailsData]):
+    """Class to fetch slow-changing zone details from Total Connect."""
+
+    config_entry: ConfigEntry
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: TotalConnectDataUpdateCoordinator
+    ) -> None:
+        """Initialize."""
+        self.client = coordinator.client
+        self.client_lock = coordinator.client_lock
+        super().__init__(
+            hass,
+            logger=_LOGGER,
+            name=f"{DOMAIN}_zone_details",
+            update_interval=ZONE_DETAILS_SCAN_INTERVAL,
+        )
+        coordinator.async_add_topology_listener(self._async_topology_changed)
+
+    @callback
+    def _async_topology_changed(self, location_ids: set[int]) -> None:
+        """Snapshot the details of added zones, loaded along with them."""
+        self.config_entry.async_create_background_task(
+            self.hass, self._async_snapshot(), f"{DOMAIN} zone details snapshot"
+        )
+
+    async def _async_snapshot(self) -> None:
+        """Publish the zone details the client has, without fetching them."""
+        self.async_set_updated_data(
+            await self.hass.async_add_executor_job(self.sync_update_data, False)
+        )
+
+    async def _async_update_data(self) -> ZoneDetailsData:
+        """Update data."""
+        # The client loaded zone details during login, skip the first fetch
+        return await self.hass.async_add_executor_job(
+            self.sync_update_data, self.data is not None
+        )
+
+    def sync_update_data(self, fetch: bool) -> ZoneDetailsData:
+        """Fetch synchronous zone details from Total Connect and snapshot them."""
+        from total_connect_client.exceptions import (
+            AuthenticationError,
+            TotalConnectError,
+        )
+
+        try:
+            with self.client_lock:
+                if fetch:
+                    for location in self.client.locations.values():
+                        location.get_zone_details()
+                return MappingProxyType(
+                    {
+                        location_id: MappingProxyType(
+                            {
+                                zone_id: ZoneDetailsSnapshot.from_zone(zone)
+                                for zone_id, zone in location.zones.items()
+                            }
+                        )
+                        for location_id, location in self.client.locations.items()
+                    }
+                )
+        except AuthenticationError as exception:
+            raise ConfigEntryAuthFailed(
+                "Total Connect authentication failed during operation."
+            ) from exception
+        except TotalConnectError as exception:
+            raise UpdateFailed(exception) from exception
+
+
+@dataclass
+class TotalConnectRuntimeData:
+    """Runtime data for a Total Connect config entry."""
+
+    client: TotalConnectClient
+    coordinator: TotalConnectDataUpdateCoordinator
+    zone_details_coordinator: TotalConnectZoneDetailsCoordinator
+    zone_diagnostics: str
+    last_states: LastStateStore
@@ -107,4 +107,18 @@ async def async_get_config_entry_diagnostics(
 
         data["locations"].append(new_location)
 
+    coordinator = config_entry.runtime_data.coordinator
+    data["command_traces"] = coordinator.tracer.as_dict()
+    data["profile"] = coordinator.profiler.last_summary
+    data["activity_export"] = (
+        coordinator.exporter.as_dict() if coordinator.exporter is not None else None
+    )
+    data["api_usage"] = {
+        **coordinator.usage.as_dict(),
+        "poll_interval": coordinator.update_interval.total_seconds(),
+    }
+    data["interest"] = coordinator.interest.as_dict()
+    data["polling"] = coordinator.polling.as_dict(coordinator.client.locations)
+    data["zone_statistics"] = coordinator.statistics.as_dict()
+
     return async_redact_data(data, TO_REDACT)
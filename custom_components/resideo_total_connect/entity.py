@@ -1,14 +1,23 @@
 """Base class for Resideo Total Connect entities."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
+from homeassistant.helpers import entity_platform
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from total_connect_client.location import TotalConnectLocation
-from total_connect_client.zone import TotalConnectZone
-
 from .const import DOMAIN
 from .coordinator import TotalConnectDataUpdateCoordinator
+from .interest import ZONE, InterestKey
+from .models import LocationSnapshot, ZoneSnapshot
+from .profiler import TotalConnectProfiler
+from .tracing import STAGE_CLOUD, STAGE_QUEUE, CommandTrace
 from .util import (
     get_location_device_manufacturer,
     get_location_device_model,
@@ -17,11 +26,80 @@ from .util import (
     get_zone_device_model,
 )
 
+if TYPE_CHECKING:
+    from total_connect_client.location import TotalConnectLocation
+    from total_connect_client.zone import TotalConnectZone
+
+
+@callback
+def async_add_location_entities(
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    entities_fn: Callable[[TotalConnectLocation], Iterable[Entity]],
+) -> None:
+    """Add the entities of every location, and of zones and partitions added later.
+
+    When zones or partitions are added to a location, entities_fn is called
+    for it again and only the entities the platform does not have are added.
+    """
+    coordinator: TotalConnectDataUpdateCoordinator = entry.runtime_data.coordinator
+    platform = entity_platform.async_get_current_platform()
+
+    @callback
+    def async_add_locations(location_ids: Iterable[int]) -> None:
+        unique_ids = {entity.unique_id for entity in platform.entities.values()}
+        async_add_entities(
+            [
+                entity
+                for location_id in location_ids
+                for entity in entities_fn(coordinator.client.locations[location_id])
+                if entity.unique_id not in unique_ids
+            ]
+        )
+
+    async_add_locations(coordinator.client.locations)
+    entry.async_on_unload(
+        coordinator.async_add_topology_listener(async_add_locations)
+    )
+
 
 class TotalConnectEntity(CoordinatorEntity[TotalConnectDataUpdateCoordinator]):
     """Representation of a Total Connect entity."""
 
     _attr_has_entity_name = True
+    _location_id: int
+
+    async def async_update(self) -> None:
+        """Poll the entity's location, when asked to update the entity."""
+        # Zone details are not polled per location
+        if not isinstance(self.coordinator, TotalConnectDataUpdateCoordinator):
+            await super().async_update()
+            return
+        # Scheduled polls skip on demand locations, and others until due
+        if not self.enabled:
+            return
+        await self.coordinator.async_refresh_locations([self._location_id])
+
+    @property
+    def profiler(self) -> TotalConnectProfiler:
+        """Return the profiler for the hot paths of this entity."""
+        return self.coordinator.profiler
+
+    async def async_traced_executor_job(
+        self, trace: CommandTrace, func: Callable[[], None]
+    ) -> None:
+        """Run a command in the executor, tracing its queue and cloud stages."""
+
+        def run() -> None:
+            trace.end_stage(STAGE_QUEUE)
+            func()
+            trace.end_stage(STAGE_CLOUD)
+
+        try:
+            await self.hass.async_add_executor_job(run)
+        except Exception:
+            self.coordinator.tracer.async_failed(trace)
+            raise
 
 
 class TotalConnectLocationEntity(TotalConnectEntity):
@@ -31,10 +109,16 @@ class TotalConnectLocationEntity(TotalConnectEntity):
         self,
         coordinator: TotalConnectDataUpdateCoordinator,
         location: TotalConnectLocation,
+        context: InterestKey | None = None,
     ) -> None:
-        """Initialize the Total Connect location entity."""
-        super().__init__(coordinator)
+        """Initialize the Total Connect location entity.
+
+        context is the partition or location the entity follows, if not
+        only the location itself.
+        """
+        super().__init__(coordinator, context)
         self._location = location
+        self._location_id = location.location_id
         self.device = device = location.devices[location.security_device_id]
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, device.serial_number)},
@@ -44,6 +128,11 @@ class TotalConnectLocationEntity(TotalConnectEntity):
             serial_number=device.serial_number,
         )
 
+    @property
+    def location_data(self) -> LocationSnapshot:
+        """Return the latest snapshot of the location."""
+        return self.coordinator.data.locations[self._location_id]
+
 
 class TotalConnectZoneEntity(TotalConnectEntity):
     """Representation of a Total Connect zone entity."""
@@ -56,9 +145,10 @@ class TotalConnectZoneEntity(TotalConnectEntity):
         key: str,
     ) -> None:
         """Initialize the Total Connect zone entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, (ZONE, location.location_id, zone.zoneid))
         self._location_id = location.location_id
         self._zone = zone
+        self._zone_id = zone.zoneid
         self._attr_unique_id = f"{location.location_id}_{zone.zoneid}_{key}"
         identifier = zone.sensor_serial_number or f"zone_{zone.zoneid}"
         self._attr_device_info = DeviceInfo(
@@ -69,3 +159,13 @@ class TotalConnectZoneEntity(TotalConnectEntity):
             serial_number=zone.sensor_serial_number,
             via_device=(DOMAIN, location.devices[location.security_device_id].serial_number),
         )
+
+    @property
+    def zone_exists(self) -> bool:
+        """Return if the latest snapshot has the zone."""
+        return self._zone_id in self.coordinator.data.locations[self._location_id].zones
+
+    @property
+    def zone_data(self) -> ZoneSnapshot:
+        """Return the latest snapshot of the zone."""
+        return self.coordinator.data.locations[self._location_id].zones[self._zone_id]
@@ -0,0 +1,81 @@
+"""Locally computed exit delay countdowns for Resideo Total Connect."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+
+from homeassistant.core import callback
+import homeassistant.util.dt as dt_util
+
+from .models import TotalConnectSnapshot
+
+PartitionKey = tuple[int, int]
+
+# A countdown started by a command survives refreshes that do not show the
+# partition arming yet for this long
+COMMAND_GRACE = timedelta(seconds=15)
+
+
+class ExitDelayTracker:
+    """Track when the exit delay of each arming partition ends.
+
+    The exit delay length is the partition's exit_delay_timer. A countdown
+    starts when an arm command is accepted, or when a refresh first shows
+    the partition arming, and is dropped once a refresh shows it is no
+    longer arming. Entities compute the remaining time locally.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._countdowns: dict[PartitionKey, tuple[datetime, datetime]] = {}
+        self.changed: set[PartitionKey] = set()
+
+    def ends_at(self, location_id: int, partition_id: int) -> datetime | None:
+        """Return when the exit delay of a partition ends, if counting down."""
+        if (countdown := self._countdowns.get((location_id, partition_id))) is None:
+            return None
+        return countdown[1]
+
+    def remaining(self, location_id: int, partition_id: int) -> int:
+        """Return the whole seconds left in the exit delay of a partition."""
+        if (ends_at := self.ends_at(location_id, partition_id)) is None:
+            return 0
+        return max(math.ceil((ends_at - dt_util.utcnow()).total_seconds()), 0)
+
+    @callback
+    def async_start(
+        self, location_id: int, partition_id: int, delay: int | None
+    ) -> bool:
+        """Start a countdown after an arm command was accepted.
+
+        Return if a countdown started, it is then the only change.
+        """
+        if not delay:
+            return False
+        now = dt_util.utcnow()
+        key = (location_id, partition_id)
+        self._countdowns[key] = (now, now + timedelta(seconds=delay))
+        self.changed = {key}
+        return True
+
+    @callback
+    def async_sync(self, snapshot: TotalConnectSnapshot) -> set[PartitionKey]:
+        """Re-sync countdowns with a refresh and return the changed partitions."""
+        now = dt_util.utcnow()
+        changed: set[PartitionKey] = set()
+        for location_id, location in snapshot.locations.items():
+            for partition_id, partition in location.partitions.items():
+                key = (location_id, partition_id)
+                countdown = self._countdowns.get(key)
+                if partition.arming_state.is_arming():
+                    if countdown is None and partition.exit_delay_timer:
+                        self._countdowns[key] = (
+                            now,
+                            now + timedelta(seconds=partition.exit_delay_timer),
+                        )
+                        changed.add(key)
+                elif countdown is not None and now - countdown[0] > COMMAND_GRACE:
+                    del self._countdowns[key]
+                    changed.add(key)
+        self.changed = changed
+        return changed
@@ -0,0 +1,200 @@
+"""Streaming export of zone and partition activity for Resideo Total Connect."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+import gzip
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+
+from .models import PartitionSnapshot, SnapshotDiff, ZoneSnapshot
+
+BATCH_SIZE = 500  # records that trigger a write before the interval
+FLUSH_INTERVAL = timedelta(seconds=10)
+MAX_BUFFER = 10000  # records held in memory while a write is running
+MAX_FILE_BYTES = 10 * 1024 * 1024  # compressed size before the file rotates
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ActivityExporter:
+    """Append zone and partition transitions to compressed JSONL files.
+
+    Records are buffered on the event loop and written in batches by the
+    executor, one batch at a time. Each batch is appended to the file as a
+    new gzip member, so files are never rewritten and can be read with
+    zcat. When the buffer is full because the disk falls behind, new
+    records are dropped and counted.
+    """
+
+    def __init__(self, hass: HomeAssistant, directory: str, name: str) -> None:
+        """Initialize the exporter."""
+        self.hass = hass
+        self.directory = directory
+        self.name = name
+        self.dropped = 0
+        self.written = 0
+        self.write_errors = 0
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._write_task: asyncio.Task[None] | None = None
+        self._unsub_interval: CALLBACK_TYPE | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+
+    @property
+    def path(self) -> str:
+        """Return the path of the file being appended to."""
+        return os.path.join(self.directory, f"{self.name}.jsonl.gz")
+
+    @callback
+    def async_start(self) -> None:
+        """Start writing batches on an interval."""
+        self._unsub_interval = async_track_time_interval(
+            self.hass, self._async_flush, FLUSH_INTERVAL
+        )
+        self._unsub_stop = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the interval and write the remaining records."""
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        while self._buffer or self._write_task is not None:
+            self._async_flush()
+            if (task := self._write_task) is not None:
+                await task
+                if self._write_task is task:
+                    self._write_task = None
+
+    async def _async_handle_stop(self, event: Event) -> None:
+        """Write the remaining records when Home Assistant stops."""
+        self._unsub_stop = None
+        await self.async_stop()
+
+    @callback
+    def async_record(self, diff: SnapshotDiff) -> None:
+        """Buffer a record for each zone and partition transition."""
+        time = dt_util.utcnow().isoformat()
+        for location_id, old_zone, new_zone in diff.zones:
+            zone = new_zone or old_zone
+            assert zone is not None
+            self._async_append(
+                {
+                    "time": time,
+                    "type": "zone",
+                    "location_id": location_id,
+                    "partition_id": zone.partition_id,
+                    "zone_id": zone.zone_id,
+                    "description": zone.description,
+                    "from": _zone_state(old_zone),
+                    "to": _zone_state(new_zone),
+                }
+            )
+        for location_id, old_partition, new_partition in diff.partitions:
+            partition = new_partition or old_partition
+            assert partition is not None
+            self._async_append(
+                {
+                    "time": time,
+                    "type": "partition",
+                    "location_id": location_id,
+                    "partition_id": partition.partition_id,
+                    "from": _partition_state(old_partition),
+                    "to": _partition_state(new_partition),
+                }
+            )
+        if len(self._buffer) >= BATCH_SIZE:
+            self._async_flush()
+
+    @callback
+    def _async_append(self, record: dict[str, Any]) -> None:
+        """Buffer a record, or count it as dropped if the buffer is full."""
+        if len(self._buffer) >= MAX_BUFFER:
+            self.dropped += 1
+            return
+        self._buffer.append(record)
+
+    @callback
+    def _async_flush(self, now: datetime | None = None) -> None:
+        """Start writing the buffered records unless a write is running."""
+        if self._write_task is not None or not self._buffer:
+            return
+        self._write_task = self.hass.async_create_background_task(
+            self._async_write(), f"{self.name} activity export"
+        )
+        self._write_task.add_done_callback(self._async_write_done)
+
+    @callback
+    def _async_write_done(self, task: asyncio.Task[None]) -> None:
+        """Allow the next batch to be written."""
+        self._write_task = None
+
+    async def _async_write(self) -> None:
+        """Write the buffered records in the executor."""
+        batch = list(self._buffer)
+        self._buffer.clear()
+        try:
+            await self.hass.async_add_executor_job(self._write, batch)
+        except OSError as exception:
+            self.write_errors += 1
+            self.dropped += len(batch)
+            _LOGGER.error("Failed to write activity to %s: %s", self.path, exception)
+        else:
+            self.written += len(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        """Append records to the file, rotating it when it grows too large."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path
+        if os.path.exists(path) and os.path.getsize(path) >= MAX_FILE_BYTES:
+            timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+            os.rename(
+                path, os.path.join(self.directory, f"{self.name}.{timestamp}.jsonl.gz")
+            )
+        with gzip.open(path, "at", encoding="utf-8") as file:
+            file.writelines(
+                json.dumps(record, separators=(",", ":")) + "\n" for record in batch
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the exporter counters."""
+        return {
+            "path": self.path,
+            "buffered": len(self._buffer),
+            "written": self.written,
+            "dropped": self.dropped,
+            "write_errors": self.write_errors,
+        }
+
+
+def _zone_state(zone: ZoneSnapshot | None) -> dict[str, Any] | None:
+    """Return the exported state of a zone."""
+    if zone is None:
+        return None
+    return {
+        "status": zone.status,
+        "bypassed": zone.is_bypassed,
+        "faulted": zone.is_faulted,
+        "triggered": zone.is_triggered,
+        "tampered": zone.is_tampered,
+        "low_battery": zone.is_low_battery,
+    }
+
+
+def _partition_state(partition: PartitionSnapshot | None) -> str | None:
+    """Return the exported arming state of a partition."""
+    if partition is None:
+        return None
+    return partition.arming_state.name
@@ -0,0 +1,101 @@
+"""Compact fixture export of the Total Connect account shape."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .models import LocationSnapshot, TotalConnectSnapshot, ZoneDetailsSnapshot
+
+FIXTURE_VERSION = 1
+
+# Zones are exported as rows in this field order to keep large accounts small
+ZONE_FIELDS = (
+    "zone_id",
+    "partition_id",
+    "description",
+    "status",
+    "zone_type_id",
+    "can_be_bypassed",
+    "battery_level",
+    "signal_strength",
+)
+
+
+class FixtureBuilder:
+    """Build a versioned fixture from coordinator snapshots.
+
+    Each location is encoded once and reused for as long as its snapshot
+    and zone details are unchanged, so repeated exports only encode the
+    locations that changed since the last one.
+
+    Fixtures are meant to be shared, so location ids are replaced with
+    their position among the account's locations, and zone descriptions
+    and partition names with placeholders built from their ids.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the builder."""
+        self._locations: dict[int, tuple[object, object, dict[str, Any]]] = {}
+
+    def build(
+        self,
+        snapshot: TotalConnectSnapshot,
+        zone_details: Mapping[int, Mapping[int, ZoneDetailsSnapshot]],
+    ) -> dict[str, Any]:
+        """Return the fixture for a snapshot."""
+        locations: list[dict[str, Any]] = []
+        cache: dict[int, tuple[object, object, dict[str, Any]]] = {}
+        for placeholder, (location_id, location) in enumerate(
+            sorted(snapshot.locations.items()), 1
+        ):
+            details = zone_details.get(location_id, {})
+            cached = self._locations.get(location_id)
+            if cached is not None and cached[0] is location and cached[1] is details:
+                encoded = cached[2]
+            else:
+                encoded = _encode_location(location, details)
+            cache[location_id] = (location, details, encoded)
+            locations.append({"location_id": placeholder, **encoded})
+        self._locations = cache
+        return {
+            "version": FIXTURE_VERSION,
+            "zone_fields": list(ZONE_FIELDS),
+            "locations": locations,
+        }
+
+
+def _encode_location(
+    location: LocationSnapshot, zone_details: Mapping[int, ZoneDetailsSnapshot]
+) -> dict[str, Any]:
+    """Encode a location snapshot and its zone details."""
+    zones: list[list[Any]] = []
+    for zone in location.zones.values():
+        details = zone_details.get(zone.zone_id)
+        zones.append(
+            [
+                zone.zone_id,
+                zone.partition_id,
+                f"Zone {zone.zone_id}",
+                zone.status,
+                zone.zone_type_id,
+                zone.can_be_bypassed,
+                details.battery_level if details is not None else None,
+                details.signal_strength if details is not None else None,
+            ]
+        )
+    return {
+        "arming_state": location.arming_state.value,
+        "ac_loss": location.is_ac_loss,
+        "low_battery": location.is_low_battery,
+        "cover_tampered": location.is_cover_tampered,
+        "partitions": [
+            {
+                "partition_id": partition.partition_id,
+                "name": f"Partition {partition.partition_id}",
+                "arming_state": partition.arming_state.value,
+                "exit_delay_timer": partition.exit_delay_timer,
+            }
+            for partition in location.partitions.values()
+        ],
+        "zones": zones,
+    }
@@ -0,0 +1,62 @@
+"""Index of the zones and partitions that Resideo Total Connect entities follow."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Collection
+from typing import Any
+
+LOCATION = "location"
+PARTITION = "partition"
+ZONE = "zone"
+
+# (LOCATION, location_id), (PARTITION, location_id, partition_id) or
+# (ZONE, location_id, zone_id)
+InterestKey = tuple[Any, ...]
+
+
+class InterestIndex:
+    """Count the entities interested in each zone, partition and location.
+
+    Entities register the key they follow as the context of their
+    coordinator listener. Only enabled entities are added and listen, and
+    disabling one in the entity registry removes it, so the index follows
+    the registry. Interest in a location covers all of its zones, as zone
+    summaries need.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._keys: Counter[InterestKey] = Counter()
+        self._zones: dict[int, set[int]] = {}
+
+    def add(self, key: InterestKey) -> None:
+        """Register an entity's interest in a key."""
+        self._keys[key] += 1
+        if key[0] == ZONE and self._keys[key] == 1:
+            self._zones.setdefault(key[1], set()).add(key[2])
+
+    def remove(self, key: InterestKey) -> None:
+        """Unregister an entity's interest in a key."""
+        self._keys[key] -= 1
+        if self._keys[key] > 0:
+            return
+        del self._keys[key]
+        if key[0] == ZONE:
+            self._zones[key[1]].discard(key[2])
+
+    def zones(self, location_id: int) -> Collection[int] | None:
+        """Return the zones of interest at a location, or None for all."""
+        if (LOCATION, location_id) in self._keys:
+            return None
+        return self._zones.get(location_id, set())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the index for diagnostics."""
+        return {
+            "locations": sorted(key[1] for key in self._keys if key[0] == LOCATION),
+            "partitions": sorted(key[1:] for key in self._keys if key[0] == PARTITION),
+            "zones": {
+                location_id: sorted(zone_ids)
+                for location_id, zone_ids in self._zones.items()
+            },
+        }
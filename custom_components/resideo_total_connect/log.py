@@ -0,0 +1,162 @@
+"""Structured logging for the Resideo Total Connect integration.
+
+Each subsystem logs to a child of the integration's logger, for example
+custom_components.resideo_total_connect.refresh, so its level can be set
+on its own with the logger integration. Messages and their context are
+only formatted when a handler emits them. The debug_logging service turns
+on debug messages of some subsystems for a while, optionally for a single
+location and sampled, so following one location during an incident does
+not flood the log.
+"""
+from __future__ import annotations
+
+from collections.abc import Collection
+from datetime import datetime
+from itertools import count
+import logging
+from typing import Any, TypedDict, Unpack
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+COMMAND = "command"
+REFRESH = "refresh"
+SETUP = "setup"
+TOPOLOGY = "topology"
+SUBSYSTEMS = (COMMAND, REFRESH, SETUP, TOPOLOGY)
+
+
+class LogContext(TypedDict, total=False):
+    """Context of a message, appended to it and passed to handlers."""
+
+    location_id: int | None
+    partition_id: int | None
+    zone_id: int | None
+    operation: str | None
+    duration: float | None
+
+
+class _LazyMessage:
+    """A message and its context, formatted when a handler emits it."""
+
+    __slots__ = ("args", "context", "msg")
+
+    def __init__(
+        self, msg: str, args: tuple[Any, ...], context: dict[str, Any]
+    ) -> None:
+        """Initialize the message."""
+        self.msg = msg
+        self.args = args
+        self.context = context
+
+    def __str__(self) -> str:
+        """Return the formatted message followed by its context."""
+        message = self.msg % self.args if self.args else self.msg
+        context = " ".join(
+            f"{key}={value * 1000:.1f}ms" if key == "duration" else f"{key}={value}"
+            for key, value in self.context.items()
+            if value is not None
+        )
+        return f"{message} [{context}]" if context else message
+
+
+class TotalConnectLogger:
+    """Logger of a subsystem, with context and filtered debug messages.
+
+    Context is location_id, partition_id, zone_id, operation and duration
+    in seconds. It is appended to the message and passed to handlers as
+    the total_connect attribute of the record. Debug messages of other
+    locations than those followed are dropped, and only one in sample of
+    the others is logged.
+    """
+
+    def __init__(self, subsystem: str) -> None:
+        """Initialize the logger."""
+        self.subsystem = subsystem
+        self.logger = logging.getLogger(f"{__package__}.{subsystem}")
+        self.location_ids: Collection[int] | None = None
+        self.sample = 1
+        self._counter = count()
+        self._previous_level: int | None = None
+        self._unsub_restore: CALLBACK_TYPE | None = None
+
+    def debug(self, msg: str, *args: Any, **context: Unpack[LogContext]) -> None:
+        """Log a debug message, if enabled, followed and sampled."""
+        self._log(logging.DEBUG, msg, args, context)
+
+    def info(self, msg: str, *args: Any, **context: Unpack[LogContext]) -> None:
+        """Log an info message."""
+        self._log(logging.INFO, msg, args, context)
+
+    def warning(self, msg: str, *args: Any, **context: Unpack[LogContext]) -> None:
+        """Log a warning message."""
+        self._log(logging.WARNING, msg, args, context)
+
+    def _log(
+        self, level: int, msg: str, args: tuple[Any, ...], context: LogContext
+    ) -> None:
+        """Log a message with its context, if enabled."""
+        if not self.logger.isEnabledFor(level):
+            return
+        if level == logging.DEBUG:
+            location_id = context.get("location_id")
+            if (
+                self.location_ids is not None
+                and location_id is not None
+                and location_id not in self.location_ids
+            ):
+                return
+            if self.sample > 1 and next(self._counter) % self.sample:
+                return
+        record_context = {key: context.get(key) for key in LogContext.__annotations__}
+        self.logger.log(
+            level,
+            _LazyMessage(msg, args, record_context),
+            extra={"total_connect": record_context},
+            # Report the caller of debug, info or warning
+            stacklevel=3,
+        )
+
+    @callback
+    def async_enable_debug(
+        self,
+        hass: HomeAssistant,
+        location_ids: Collection[int] | None,
+        sample: int,
+        duration: float,
+    ) -> None:
+        """Log debug messages for duration seconds, then restore the level."""
+        self._async_restore()
+        self._previous_level = self.logger.level
+        self.logger.setLevel(logging.DEBUG)
+        self.location_ids = location_ids
+        self.sample = sample
+        self._unsub_restore = async_call_later(hass, duration, self._async_expired)
+
+    @callback
+    def _async_expired(self, now: datetime) -> None:
+        """End debug logging once its duration elapsed."""
+        self._unsub_restore = None
+        self._async_restore()
+
+    @callback
+    def _async_restore(self) -> None:
+        """End debug logging started by async_enable_debug, if any."""
+        if self._unsub_restore is not None:
+            self._unsub_restore()
+            self._unsub_restore = None
+        if self._previous_level is None:
+            return
+        self.logger.setLevel(self._previous_level)
+        self._previous_level = None
+        self.location_ids = None
+        self.sample = 1
+        self._counter = count()
+
+
+_LOGGERS = {subsystem: TotalConnectLogger(subsystem) for subsystem in SUBSYSTEMS}
+
+
+def get_logger(subsystem: str) -> TotalConnectLogger:
+    """Return the logger of a subsystem."""
+    return _LOGGERS[subsystem]
@@ -0,0 +1,234 @@
+"""Data models for the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TypeVar
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+
+from .util import get_security_zone_device_class
+
+if TYPE_CHECKING:
+    from total_connect_client import ArmingState, TotalConnectClient
+    from total_connect_client.location import TotalConnectLocation
+    from total_connect_client.partition import TotalConnectPartition
+    from total_connect_client.zone import TotalConnectZone
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneSnapshot:
+    """Immutable state of a Total Connect zone."""
+
+    zone_id: int
+    partition_id: int | None
+    description: str
+    status: int
+    zone_type_id: int | None
+    can_be_bypassed: bool
+    is_bypassed: bool
+    is_faulted: bool
+    is_triggered: bool
+    is_tampered: bool
+    is_low_battery: bool
+    is_button: bool
+    device_class: BinarySensorDeviceClass
+
+    @classmethod
+    def from_zone(cls, zone: TotalConnectZone) -> ZoneSnapshot:
+        """Build a snapshot from a client zone."""
+        return cls(
+            zone_id=zone.zoneid,
+            partition_id=zone.partition,
+            description=zone.description,
+            status=int(zone.status),
+            zone_type_id=getattr(zone.zone_type_id, "value", zone.zone_type_id),
+            can_be_bypassed=bool(zone.can_be_bypassed),
+            is_bypassed=zone.is_bypassed(),
+            is_faulted=zone.is_faulted(),
+            is_triggered=zone.is_triggered(),
+            is_tampered=zone.is_tampered(),
+            is_low_battery=zone.is_low_battery(),
+            is_button=zone.is_type_button(),
+            device_class=get_security_zone_device_class(zone),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionSnapshot:
+    """Immutable state of a Total Connect partition."""
+
+    partition_id: int
+    name: str | None
+    arming_state: ArmingState
+    exit_delay_timer: int | None
+
+    @classmethod
+    def from_partition(cls, partition: TotalConnectPartition) -> PartitionSnapshot:
+        """Build a snapshot from a client partition."""
+        return cls(
+            partition_id=int(partition.partitionid),
+            name=partition.name,
+            arming_state=partition.arming_state,
+            exit_delay_timer=partition.exit_delay_timer,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LocationSnapshot:
+    """Immutable state of a Total Connect location."""
+
+    location_id: int
+    arming_state: ArmingState
+    is_ac_loss: bool
+    is_low_battery: bool
+    is_cover_tampered: bool
+    partitions: Mapping[int, PartitionSnapshot]
+    zones: Mapping[int, ZoneSnapshot]
+
+    @classmethod
+    def from_location(cls, location: TotalConnectLocation) -> LocationSnapshot:
+        """Build a snapshot from a client location."""
+        return cls(
+            location_id=location.location_id,
+            arming_state=location.arming_state,
+            is_ac_loss=location.is_ac_loss(),
+            is_low_battery=location.is_low_battery(),
+            is_cover_tampered=location.is_cover_tampered(),
+            partitions=MappingProxyType(
+                {
+                    int(partition_id): PartitionSnapshot.from_partition(partition)
+                    for partition_id, partition in location.partitions.items()
+                }
+            ),
+            zones=MappingProxyType(
+                {
+                    zone_id: ZoneSnapshot.from_zone(zone)
+                    for zone_id, zone in location.zones.items()
+                }
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TotalConnectSnapshot:
+    """Immutable state of all Total Connect locations, built once per refresh."""
+
+    locations: Mapping[int, LocationSnapshot]
+
+    @classmethod
+    def from_client(
+        cls,
+        client: TotalConnectClient,
+        previous: TotalConnectSnapshot | None = None,
+        location_ids: Collection[int] | None = None,
+    ) -> TotalConnectSnapshot:
+        """Build a snapshot from the client.
+
+        If location_ids is given, other locations are shared with previous.
+        """
+        locations: dict[int, LocationSnapshot] = {}
+        for location_id, location in client.locations.items():
+            if (
+                location_ids is not None
+                and location_id not in location_ids
+                and previous is not None
+                and (location_snapshot := previous.locations.get(location_id))
+                is not None
+            ):
+                locations[location_id] = location_snapshot
+            else:
+                locations[location_id] = LocationSnapshot.from_location(location)
+        return cls(locations=MappingProxyType(locations))
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotDiff:
+    """Zones and partitions that changed between two snapshots.
+
+    Each change is a (location_id, previous, current) tuple, where previous is
+    None for additions and current is None for removals. Zones added or
+    removed are always reported, changes only for the zones of interest.
+    """
+
+    zones: tuple[tuple[int, ZoneSnapshot | None, ZoneSnapshot | None], ...]
+    partitions: tuple[
+        tuple[int, PartitionSnapshot | None, PartitionSnapshot | None], ...
+    ]
+
+    @classmethod
+    def between(
+        cls,
+        previous: TotalConnectSnapshot | None,
+        current: TotalConnectSnapshot,
+        zones_of_interest: Callable[[int], Collection[int] | None] | None = None,
+    ) -> SnapshotDiff:
+        """Return the changes from previous to current.
+
+        zones_of_interest returns the zones to compare at a location, or
+        None to compare all of them.
+        """
+        zones: list[tuple[int, ZoneSnapshot | None, ZoneSnapshot | None]] = []
+        partitions: list[
+            tuple[int, PartitionSnapshot | None, PartitionSnapshot | None]
+        ] = []
+        previous_locations = previous.locations if previous is not None else {}
+        for location_id in previous_locations.keys() | current.locations.keys():
+            old = previous_locations.get(location_id)
+            new = current.locations.get(location_id)
+            if old is new:
+                continue
+            _diff_mapping(
+                location_id,
+                old.zones if old is not None else {},
+                new.zones if new is not None else {},
+                zones,
+                zones_of_interest(location_id) if zones_of_interest else None,
+            )
+            _diff_mapping(
+                location_id,
+                old.partitions if old is not None else {},
+                new.partitions if new is not None else {},
+                partitions,
+            )
+        return cls(zones=tuple(zones), partitions=tuple(partitions))
+
+
+def _diff_mapping(
+    location_id: int,
+    old: Mapping[int, _T],
+    new: Mapping[int, _T],
+    changes: list[tuple[int, _T | None, _T | None]],
+    keys: Collection[int] | None = None,
+) -> None:
+    """Append the changed items between two mappings, or of some keys."""
+    if keys is None:
+        keys = new.keys()
+    else:
+        keys = {key for key in keys if key in new} | (new.keys() - old.keys())
+    for key in keys:
+        if (previous := old.get(key)) != (value := new[key]):
+            changes.append((location_id, previous, value))
+    for key in old.keys() - new.keys():
+        changes.append((location_id, old[key], None))
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneDetailsSnapshot:
+    """Immutable slow-changing details of a Total Connect zone."""
+
+    zone_id: int
+    battery_level: int | None
+    signal_strength: int | None
+
+    @classmethod
+    def from_zone(cls, zone: TotalConnectZone) -> ZoneDetailsSnapshot:
+        """Build a snapshot from a client zone."""
+        return cls(
+            zone_id=zone.zoneid,
+            battery_level=zone.battery_level,
+            signal_strength=zone.signal_strength,
+        )
@@ -0,0 +1,115 @@
+"""Per-location polling schedule for Resideo Total Connect."""
+from __future__ import annotations
+
+from collections.abc import Collection, Mapping
+from datetime import timedelta
+import time
+from typing import Any
+
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    PRIORITY_ON_DEMAND,
+)
+
+# Poll period of each priority, as a multiple of the polling interval.
+# On demand locations are only polled by commands and refresh requests.
+PRIORITY_FACTORS = {
+    PRIORITY_HIGH: 0.5,
+    PRIORITY_NORMAL: 1,
+    PRIORITY_LOW: 5,
+}
+PRIORITIES = (PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW, PRIORITY_ON_DEMAND)
+# High priority locations are not polled more often than this
+MIN_POLL_PERIOD = timedelta(seconds=10)
+
+
+class PollScheduler:
+    """Decide which locations each scheduled poll fetches.
+
+    Each location is polled once per period of its priority. The
+    coordinator ticks at the shortest period, and a tick only polls the
+    locations that are due, so lower priority locations cost no API call
+    on most ticks. When the API budget stretches the tick, every period is
+    stretched alike. Polls of a location on demand reset its period.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self.interval = timedelta(seconds=DEFAULT_SCAN_INTERVAL)
+        self.priorities: dict[int, str] = {}
+        self.stretch = 1.0
+        self._next_polls: dict[int, float] = {}
+
+    def configure(self, interval: timedelta, priorities: Mapping[str, str]) -> None:
+        """Set the polling interval and the priorities from the options."""
+        self.interval = interval
+        self.priorities = {
+            int(location_id): priority for location_id, priority in priorities.items()
+        }
+        # Locations whose priority went up should not wait for a long period
+        self._next_polls.clear()
+
+    def priority(self, location_id: int) -> str:
+        """Return the polling priority of a location."""
+        return self.priorities.get(location_id, PRIORITY_NORMAL)
+
+    def periods(self, location_ids: Collection[int]) -> dict[int, timedelta]:
+        """Return the poll period of each scheduled location, unstretched."""
+        return {
+            location_id: max(
+                self.interval * PRIORITY_FACTORS[priority], MIN_POLL_PERIOD
+            )
+            for location_id in location_ids
+            if (priority := self.priority(location_id)) in PRIORITY_FACTORS
+        }
+
+    def tick(self, location_ids: Collection[int]) -> tuple[timedelta, float]:
+        """Return the tick and the locations polled per tick on average."""
+        if not (periods := self.periods(location_ids)):
+            return self.interval, 0
+        tick = min(periods.values())
+        return tick, sum(tick / period for period in periods.values())
+
+    def due(self, location_ids: Collection[int], tick: timedelta) -> set[int]:
+        """Return the scheduled locations to poll now."""
+        # Ticks are not exact, a location due within half a tick is polled
+        # now rather than a whole tick late
+        deadline = time.monotonic() + tick.total_seconds() / 2
+        return {
+            location_id
+            for location_id in self.periods(location_ids)
+            if self._next_polls.get(location_id, 0) <= deadline
+        }
+
+    def polled(self, location_ids: Collection[int], started: float) -> None:
+        """Schedule the next poll of locations polled from started."""
+        periods = self.periods(location_ids)
+        for location_id in location_ids:
+            if (period := periods.get(location_id)) is not None:
+                self._next_polls[location_id] = (
+                    started + period.total_seconds() * self.stretch
+                )
+
+    def as_dict(self, location_ids: Collection[int]) -> dict[str, Any]:
+        """Return the schedule for diagnostics."""
+        now = time.monotonic()
+        periods = self.periods(location_ids)
+        return {
+            location_id: {
+                "priority": self.priority(location_id),
+                "period": (
+                    periods[location_id].total_seconds() * self.stretch
+                    if location_id in periods
+                    else None
+                ),
+                "next_poll_in": (
+                    max(self._next_polls[location_id] - now, 0)
+                    if location_id in self._next_polls
+                    else None
+                ),
+            }
+            for location_id in location_ids
+        }
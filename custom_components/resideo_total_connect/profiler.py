@@ -0,0 +1,226 @@
+"""Profiler for the Resideo Total Connect integration's hot paths."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import cProfile
+from dataclasses import dataclass
+from datetime import datetime
+from functools import wraps
+import logging
+import threading
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def profiled(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a method so it is profiled while its profiler is active.
+
+    The decorated object must expose a `profiler` attribute.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            profiler: TotalConnectProfiler = self.profiler
+            if not profiler.active:
+                return func(self, *args, **kwargs)
+            return profiler.runcall(name, func, self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@dataclass(slots=True)
+class CallTiming:
+    """Wall time of the calls of a name."""
+
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def add(self, elapsed: float) -> None:
+        """Record a call."""
+        self.count += 1
+        self.total += elapsed
+        self.maximum = max(self.maximum, elapsed)
+
+
+class TotalConnectProfiler:
+    """Collect cProfile data and timings for a bounded window.
+
+    A single profile accumulates every profiled call of the window, and
+    timings are aggregated per name, so memory does not grow with calls.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self.active = False
+        self.last_summary: dict[str, Any] | None = None
+        self._lock = threading.Lock()
+        self._cprofile_lock = threading.Lock()
+        self._profile: cProfile.Profile | None = None
+        self._profiled = 0
+        self._timings: dict[str, CallTiming] = {}
+        self._skipped = 0
+
+    def start(self) -> None:
+        """Start collecting."""
+        with self._lock:
+            self._profile = cProfile.Profile()
+            self._profiled = 0
+            self._timings = {}
+            self._skipped = 0
+            self.active = True
+
+    def stop(self) -> tuple[cProfile.Profile | None, dict[str, CallTiming], int]:
+        """Stop collecting and return what was collected.
+
+        The profile is None if no call was profiled. A profiled call in
+        progress is waited for, so this must not run in the event loop.
+        """
+        with self._cprofile_lock, self._lock:
+            self.active = False
+            profile = self._profile if self._profiled else None
+            self._profile = None
+            return profile, self._timings, self._skipped
+
+    def runcall(
+        self, name: str, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        """Run func under cProfile and record its wall time."""
+        # cProfile can only be active once per interpreter, so concurrent
+        # calls from the event loop and executor threads are timed only.
+        profile: cProfile.Profile | None = None
+        if self._cprofile_lock.acquire(blocking=False):
+            if (profile := self._profile) is not None:
+                try:
+                    profile.enable()
+                except ValueError:
+                    # Another profiling tool (e.g. the profiler integration)
+                    # is active
+                    profile = None
+            if profile is None:
+                self._cprofile_lock.release()
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile is not None:
+                profile.disable()
+                self._cprofile_lock.release()
+            with self._lock:
+                if self.active:
+                    self._timings.setdefault(name, CallTiming()).add(elapsed)
+                    if profile is not None:
+                        self._profiled += 1
+                    else:
+                        self._skipped += 1
+
+    @callback
+    def async_start(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        duration: float,
+        top_n: int,
+        path_prefix: str,
+    ) -> None:
+        """Profile for duration seconds, then write the results in the background."""
+        if self.active:
+            raise RuntimeError("Profiler is already running")
+        self.start()
+        entry.async_create_background_task(
+            hass,
+            self._async_finish(hass, dt_util.utcnow(), duration, top_n, path_prefix),
+            f"{DOMAIN} profile",
+        )
+
+    async def _async_finish(
+        self,
+        hass: HomeAssistant,
+        started: datetime,
+        duration: float,
+        top_n: int,
+        path_prefix: str,
+    ) -> None:
+        """Stop profiling after duration seconds and write the results."""
+        try:
+            await asyncio.sleep(duration)
+        except asyncio.CancelledError:
+            # The entry is unloading, discard what was collected
+            with self._lock:
+                self.active = False
+                self._profile = None
+            raise
+        profile, timings, skipped = await hass.async_add_executor_job(self.stop)
+
+        summary = await hass.async_add_executor_job(
+            _write_results, profile, timings, skipped, top_n, path_prefix
+        )
+        summary["started"] = started.isoformat()
+        summary["duration"] = duration
+        self.last_summary = summary
+        _LOGGER.info("Wrote Total Connect profile to %s", summary["profile_file"])
+
+
+def _write_results(
+    profile: cProfile.Profile | None,
+    timings: dict[str, CallTiming],
+    skipped: int,
+    top_n: int,
+    path_prefix: str,
+) -> dict[str, Any]:
+    """Write the profile and a top-N summary, return the summary."""
+    # pstats is only needed here, it is imported in the executor on first use
+    import io
+    import pstats
+
+    profile_file = f"{path_prefix}.prof"
+    summary_file = f"{path_prefix}.txt"
+
+    stream = io.StringIO()
+    if profile is not None:
+        stats = pstats.Stats(profile, stream=stream)
+        stats.dump_stats(profile_file)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+    else:
+        profile_file = None
+        stream.write("No profiled calls during the window.\n")
+
+    calls: dict[str, dict[str, float]] = {}
+    for name, timing in sorted(timings.items()):
+        calls[name] = {
+            "count": timing.count,
+            "total": round(timing.total, 6),
+            "mean": round(timing.total / timing.count, 6),
+            "max": round(timing.maximum, 6),
+        }
+
+    with open(summary_file, "w", encoding="utf-8") as file:
+        for name, timing in calls.items():
+            file.write(
+                f"{name}: count={timing['count']} total={timing['total']}s "
+                f"mean={timing['mean']}s max={timing['max']}s\n"
+            )
+        file.write(f"timed only (profiler busy): {skipped}\n\n")
+        file.write(stream.getvalue())
+
+    return {
+        "profile_file": profile_file,
+        "summary_file": summary_file,
+        "calls": calls,
+        "timed_only": skipped,
+        "top": stream.getvalue(),
+    }
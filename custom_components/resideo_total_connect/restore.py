@@ -0,0 +1,112 @@
+"""Last known entity states of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.const import ATTR_RESTORED, STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+SAVE_DELAY = 300
+STORAGE_VERSION = 1
+
+
+class LastStateStore:
+    """Save the states of a config entry's entities and restore them at setup.
+
+    Entities wrap the client's locations and zones, so they are only added
+    after login, loading the topology and the first refresh. Meanwhile the
+    last states saved are shown in their place, marked as restored like
+    the placeholders Home Assistant writes for entities not added yet.
+    Entities replace them with live states once added. States are saved
+    shortly after refreshes that changed something, and pending saves are
+    written when Home Assistant stops or the entry is unloaded.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self._entry_id = entry_id
+        self._states: dict[str, list[Any]] = {}
+        self._placeholders: list[str] = []
+        self._save_pending = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.last_states"
+        )
+
+    async def async_load(self) -> None:
+        """Load the states saved last."""
+        if (data := await self._store.async_load()) is not None:
+            self._states = data["states"]
+
+    async def async_remove(self) -> None:
+        """Remove the saved states."""
+        await self._store.async_remove()
+
+    @callback
+    def async_write_placeholders(self) -> None:
+        """Show the saved states of enabled entities that have no state yet."""
+        registry = er.async_get(self._hass)
+        for entity_id, (state, attributes) in self._states.items():
+            entry = registry.async_get(entity_id)
+            if (
+                entry is None
+                or entry.config_entry_id != self._entry_id
+                or entry.disabled
+            ):
+                continue
+            current = self._hass.states.get(entity_id)
+            if current is not None and ATTR_RESTORED not in current.attributes:
+                continue
+            self._hass.states.async_set(
+                entity_id, state, {**attributes, ATTR_RESTORED: True}
+            )
+            self._placeholders.append(entity_id)
+        # Only needed until the entities are added
+        self._states = {}
+
+    @callback
+    def async_clear_placeholders(self) -> None:
+        """Make the saved states no entity replaced unavailable."""
+        registry = er.async_get(self._hass)
+        for entity_id in self._placeholders:
+            state = self._hass.states.get(entity_id)
+            if state is None or ATTR_RESTORED not in state.attributes:
+                continue
+            if (entry := registry.async_get(entity_id)) is not None:
+                entry.write_unavailable_state(self._hass)
+            else:
+                self._hass.states.async_remove(entity_id)
+        self._placeholders = []
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the states after a delay, coalescing frequent changes."""
+        # Delaying again would postpone a pending save with every refresh
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Save the states now if a save is pending, before entities go away."""
+        if self._save_pending:
+            await self._store.async_save(self._data_to_save())
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._save_pending = False
+        registry = er.async_get(self._hass)
+        states: dict[str, list[Any]] = {}
+        for entry in er.async_entries_for_config_entry(registry, self._entry_id):
+            state = self._hass.states.get(entry.entity_id)
+            if (
+                state is None
+                or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+                or ATTR_RESTORED in state.attributes
+            ):
+                continue
+            states[entry.entity_id] = [state.state, dict(state.attributes)]
+        return {"states": states}
@@ -0,0 +1,50 @@
+"""Retry policies for Resideo Total Connect panel commands."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+
+from .const import (
+    ARM_AWAY,
+    ARM_AWAY_INSTANT,
+    ARM_HOME,
+    ARM_HOME_INSTANT,
+    ARM_NIGHT,
+    DISARM,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """Bounded retries of a command with jittered exponential backoff.
+
+    The client already retries each request a few times before it raises
+    ServiceUnavailable, so attempts here are few and far apart. The
+    deadline bounds when a new attempt may start, counted from the first,
+    an attempt in progress is never interrupted.
+    """
+
+    attempts: int
+    deadline: float
+    base_delay: float
+    max_delay: float
+
+    def delay(self, attempt: int) -> float:
+        """Return the seconds to wait after a failed attempt."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        # Half the delay is jittered so concurrent retries spread out
+        return delay / 2 + random.uniform(0, delay / 2)
+
+
+# A failed disarm is the most costly, it is retried longer than arming
+ARM_RETRY = RetryPolicy(attempts=2, deadline=60, base_delay=2, max_delay=10)
+DISARM_RETRY = RetryPolicy(attempts=3, deadline=90, base_delay=2, max_delay=10)
+
+COMMAND_RETRY_POLICIES: dict[str, RetryPolicy] = {
+    ARM_AWAY: ARM_RETRY,
+    ARM_AWAY_INSTANT: ARM_RETRY,
+    ARM_HOME: ARM_RETRY,
+    ARM_HOME_INSTANT: ARM_RETRY,
+    ARM_NIGHT: ARM_RETRY,
+    DISARM: DISARM_RETRY,
+}
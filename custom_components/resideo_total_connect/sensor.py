@@ -0,0 +1,596 @@
+"""Support for Resideo Total Connect sensor entities."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
+
+from .const import ZONE_DIAGNOSTICS_ATTRIBUTES
+from .coordinator import (
+    TotalConnectDataUpdateCoordinator,
+    TotalConnectZoneDetailsCoordinator,
+)
+from .entity import (
+    TotalConnectLocationEntity,
+    TotalConnectZoneEntity,
+    async_add_location_entities,
+)
+from .interest import LOCATION, PARTITION
+from .models import ZoneDetailsSnapshot
+from .summary import BYPASSED, LOW_BATTERY, OPEN, TAMPERED
+from .zone_statistics import ZoneStatistics
+
+if TYPE_CHECKING:
+    from total_connect_client.location import TotalConnectLocation
+    from total_connect_client.zone import TotalConnectZone
+
+EXIT_DELAY_TICK = timedelta(seconds=1)
+# Zones report battery and signal as a level of 0 to 5 bars, not as a
+# percentage or in dBm
+ZONE_LEVEL_MAX = 5
+ZONE_STATISTIC_TICK = timedelta(minutes=1)
+
+_LOGGER = logging.getLogger(__name__)
+
+@dataclass(frozen=True, kw_only=True)
+class TotalConnectAccountSensorEntityDescription(SensorEntityDescription):
+    """Class to describe a Total Connect account sensor entity."""
+
+    value_fn: Callable[[TotalConnectDataUpdateCoordinator], int]
+    attributes_fn: (
+        Callable[[TotalConnectDataUpdateCoordinator], dict[str, Any]] | None
+    ) = None
+
+@dataclass(frozen=True, kw_only=True)
+class TotalConnectZoneSensorEntityDescription(SensorEntityDescription):
+    """Class to describe a Total Connect zone sensor entity."""
+
+    value_fn: Callable[[ZoneDetailsSnapshot], int | None]
+
+@dataclass(frozen=True, kw_only=True)
+class TotalConnectZoneStatisticSensorEntityDescription(SensorEntityDescription):
+    """Class to describe a Total Connect zone statistic sensor entity."""
+
+    value_fn: Callable[[ZoneStatistics, datetime], float | int]
+    attributes_fn: Callable[[ZoneStatistics, datetime], dict[str, Any]] | None = None
+    # The value grows while the zone is open
+    ticks_while_open: bool = False
+
+@dataclass(frozen=True, kw_only=True)
+class TotalConnectZoneSummarySensorEntityDescription(SensorEntityDescription):
+    """Class to describe a Total Connect zone summary sensor entity."""
+
+    kind: str
+    list_zones: bool = False
+
+ZONE_SUMMARY_SENSORS: list[TotalConnectZoneSummarySensorEntityDescription] = [
+    TotalConnectZoneSummarySensorEntityDescription(
+        key="open_zones",
+        translation_key="open_zones",
+        state_class=SensorStateClass.MEASUREMENT,
+        kind=OPEN,
+        list_zones=True,
+    ),
+    TotalConnectZoneSummarySensorEntityDescription(
+        key="bypassed_zones",
+        translation_key="bypassed_zones",
+        state_class=SensorStateClass.MEASUREMENT,
+        kind=BYPASSED,
+    ),
+    TotalConnectZoneSummarySensorEntityDescription(
+        key="tampered_zones",
+        translation_key="tampered_zones",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        kind=TAMPERED,
+    ),
+    TotalConnectZoneSummarySensorEntityDescription(
+        key="low_battery_zones",
+        translation_key="low_battery_zones",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.MEASUREMENT,
+        kind=LOW_BATTERY,
+    ),
+]
+
+ACCOUNT_SENSORS: list[TotalConnectAccountSensorEntityDescription] = [
+    TotalConnectAccountSensorEntityDescription(
+        key="api_calls",
+        translation_key="api_calls",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda coordinator: coordinator.usage.total,
+        attributes_fn=lambda coordinator: {
+            "operations": coordinator.usage.by_operation(),
+            "locations": coordinator.usage.by_location(),
+            "budget_remaining": coordinator.usage.budget_remaining,
+        },
+    ),
+    TotalConnectAccountSensorEntityDescription(
+        key="poll_interval",
+        translation_key="poll_interval",
+        device_class=SensorDeviceClass.DURATION,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        value_fn=lambda coordinator: int(coordinator.update_interval.total_seconds()),
+    ),
+]
+
+EXIT_DELAY_SENSOR = SensorEntityDescription(
+    key="exit_delay",
+    translation_key="exit_delay",
+    device_class=SensorDeviceClass.DURATION,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+)
+
+ZONE_SENSORS: list[TotalConnectZoneSensorEntityDescription] = [
+    TotalConnectZoneSensorEntityDescription(
+        key="battery_level",
+        translation_key="battery_level",
+        device_class=SensorDeviceClass.BATTERY,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda details: _level_percentage(details.battery_level),
+    ),
+    # Not the signal strength device class, which is in dB or dBm
+    TotalConnectZoneSensorEntityDescription(
+        key="signal_strength",
+        translation_key="signal_strength",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda details: _level_percentage(details.signal_strength),
+    ),
+]
+
+def _level_percentage(level: int | None) -> int | None:
+    """Return a zone's level of 0 to 5 bars as a percentage."""
+    if level is None:
+        return None
+    return round(level * 100 / ZONE_LEVEL_MAX)
+
+
+# Optional, they are disabled by default. With the zone diagnostics option
+# set to attributes, they are attributes of the zone's binary sensor instead.
+ZONE_STATISTIC_SENSORS: list[TotalConnectZoneStatisticSensorEntityDescription] = [
+    TotalConnectZoneStatisticSensorEntityDescription(
+        key="open_time",
+        translation_key="open_time",
+        device_class=SensorDeviceClass.DURATION,
+        entity_registry_enabled_default=False,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.TOTAL,
+        suggested_unit_of_measurement=UnitOfTime.MINUTES,
+        value_fn=lambda statistics, now: round(statistics.open_time(now)),
+        attributes_fn=lambda statistics, now: {
+            "closed_time": round(statistics.closed_time(now)),
+        },
+        ticks_while_open=True,
+    ),
+    TotalConnectZoneStatisticSensorEntityDescription(
+        key="openings",
+        translation_key="openings",
+        entity_registry_enabled_default=False,
+        state_class=SensorStateClass.TOTAL,
+        value_fn=lambda statistics, now: statistics.openings,
+    ),
+]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up a Total Connect sensor entity based on a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    zone_details_coordinator = entry.runtime_data.zone_details_coordinator
+
+    # Account wide sensors belong to the panel of the first location
+    first_location = next(iter(coordinator.client.locations.values()))
+    async_add_entities(
+        [
+            TotalConnectAccountSensorEntity(coordinator, first_location, description)
+            for description in ACCOUNT_SENSORS
+        ]
+    )
+
+    def location_entities(
+        location: TotalConnectLocation,
+    ) -> list[
+        TotalConnectExitDelaySensorEntity
+        | TotalConnectZoneSummarySensorEntity
+        | TotalConnectZoneSensorEntity
+        | TotalConnectZoneStatisticSensorEntity
+    ]:
+        """Return the sensors of a location, its partitions and zones."""
+        statistic_sensors = (
+            entry.runtime_data.zone_diagnostics != ZONE_DIAGNOSTICS_ATTRIBUTES
+        )
+        entities: list[
+            TotalConnectExitDelaySensorEntity
+            | TotalConnectZoneSummarySensorEntity
+            | TotalConnectZoneSensorEntity
+            | TotalConnectZoneStatisticSensorEntity
+        ] = []
+        # Partition summaries only differ from the location summary
+        # when the location has more than one partition
+        partition_ids: list[int | None] = [None]
+        if len(location.partitions) > 1:
+            partition_ids.extend(int(partition_id) for partition_id in location.partitions)
+        for partition_id in partition_ids:
+            for description in ZONE_SUMMARY_SENSORS:
+                entities.append(
+                    TotalConnectZoneSummarySensorEntity(
+                        coordinator,
+                        location,
+                        partition_id,
+                        description,
+                    )
+                )
+        for partition_id in location.partitions:
+            entities.append(
+                TotalConnectExitDelaySensorEntity(
+                    coordinator,
+                    location,
+                    int(partition_id),
+                    len(location.partitions) > 1,
+                )
+            )
+        for zone in location.zones.values():
+            if statistic_sensors:
+                entities.extend(
+                    TotalConnectZoneStatisticSensorEntity(
+                        coordinator, location, zone, description
+                    )
+                    for description in ZONE_STATISTIC_SENSORS
+                )
+            details = ZoneDetailsSnapshot.from_zone(zone)
+            for description in ZONE_SENSORS:
+                # Wired zones report no value (or -1) for battery and signal
+                value = description.value_fn(details)
+                if value is None or value < 0:
+                    continue
+                entities.append(
+                    TotalConnectZoneSensorEntity(
+                        zone_details_coordinator,
+                        location,
+                        zone,
+                        description,
+                    )
+                )
+        return entities
+
+    async_add_location_entities(entry, async_add_entities, location_entities)
+
+
+class TotalConnectAccountSensorEntity(TotalConnectLocationEntity, SensorEntity):
+    """Representation of a Total Connect account sensor entity."""
+
+    entity_description: TotalConnectAccountSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: TotalConnectDataUpdateCoordinator,
+        location: TotalConnectLocation,
+        entity_description: TotalConnectAccountSensorEntityDescription,
+    ) -> None:
+        """Initialize the Total Connect account sensor entity."""
+        super().__init__(coordinator, location)
+        self.entity_description = entity_description
+        self._attr_unique_id = f"{location.location_id}_{entity_description.key}"
+        self._last_written: tuple[bool, int] | None = None
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the entity."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the breakdown of the state."""
+        if (attributes_fn := self.entity_description.attributes_fn) is None:
+            return None
+        return attributes_fn(self.coordinator)
+
+    async def async_added_to_hass(self) -> None:
+        """Also update after polls that changed no location."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_poll_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The attributes only change along with the value
+        written = (self.available, self.native_value)
+        if written == self._last_written:
+            return
+        self._last_written = written
+        super()._handle_coordinator_update()
+
+
+class TotalConnectZoneSummarySensorEntity(TotalConnectLocationEntity, SensorEntity):
+    """Representation of a Total Connect zone summary sensor entity."""
+
+    entity_description: TotalConnectZoneSummarySensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: TotalConnectDataUpdateCoordinator,
+        location: TotalConnectLocation,
+        partition_id: int | None,
+        entity_description: TotalConnectZoneSummarySensorEntityDescription,
+    ) -> None:
+        """Initialize the Total Connect zone summary sensor entity."""
+        # Summaries follow every zone of the location
+        super().__init__(coordinator, location, (LOCATION, location.location_id))
+        self.entity_description = entity_description
+        self._scope = (location.location_id, partition_id)
+        self._last_available = True
+        if partition_id is None:
+            self._attr_unique_id = f"{location.location_id}_{entity_description.key}"
+        else:
+            self._attr_translation_key = f"partition_{entity_description.translation_key}"
+            self._attr_translation_placeholders = {"partition_id": str(partition_id)}
+            self._attr_unique_id = (
+                f"{location.location_id}_{partition_id}_{entity_description.key}"
+            )
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the entity."""
+        return self.coordinator.summary.get(*self._scope).count(
+            self.entity_description.kind
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, list[str]] | None:
+        """Return the zones counted by the entity."""
+        if not self.entity_description.list_zones:
+            return None
+        return {
+            "zones": self.coordinator.summary.get(*self._scope).descriptions(
+                self.entity_description.kind
+            )
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Summaries are maintained incrementally, only write when ours changed
+        if (
+            self.available == self._last_available
+            and self._scope not in self.coordinator.summary.changed
+        ):
+            return
+        self._last_available = self.available
+        super()._handle_coordinator_update()
+
+
+class TotalConnectExitDelaySensorEntity(TotalConnectLocationEntity, SensorEntity):
+    """Representation of a Total Connect exit delay countdown sensor entity."""
+
+    entity_description = EXIT_DELAY_SENSOR
+
+    def __init__(
+        self,
+        coordinator: TotalConnectDataUpdateCoordinator,
+        location: TotalConnectLocation,
+        partition_id: int,
+        multiple_partitions: bool,
+    ) -> None:
+        """Initialize the Total Connect exit delay sensor entity."""
+        super().__init__(
+            coordinator, location, (PARTITION, location.location_id, partition_id)
+        )
+        self._partition_key = (location.location_id, partition_id)
+        self._last_available = True
+        self._unsub_tick: CALLBACK_TYPE | None = None
+        self._attr_unique_id = (
+            f"{location.location_id}_{partition_id}_{EXIT_DELAY_SENSOR.key}"
+        )
+        if multiple_partitions:
+            self._attr_translation_key = f"partition_{EXIT_DELAY_SENSOR.translation_key}"
+            self._attr_translation_placeholders = {"partition_id": str(partition_id)}
+
+    @property
+    def native_value(self) -> int:
+        """Return the state of the entity."""
+        return self.coordinator.exit_delays.remaining(*self._partition_key)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return when the exit delay ends."""
+        ends_at: datetime | None = self.coordinator.exit_delays.ends_at(
+            *self._partition_key
+        )
+        return {"ends_at": ends_at.isoformat() if ends_at is not None else None}
+
+    async def async_added_to_hass(self) -> None:
+        """Start ticking if a countdown is already running."""
+        await super().async_added_to_hass()
+        self._async_update_tick()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop ticking."""
+        await super().async_will_remove_from_hass()
+        self._async_stop_tick()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The countdown only changes when a refresh starts or ends it
+        if (
+            self.available == self._last_available
+            and self._partition_key not in self.coordinator.exit_delays.changed
+        ):
+            return
+        self._last_available = self.available
+        self._async_update_tick()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_tick(self) -> None:
+        """Tick every second while the countdown is running."""
+        if self.native_value and self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, EXIT_DELAY_TICK
+            )
+        elif not self.native_value:
+            self._async_stop_tick()
+
+    @callback
+    def _async_stop_tick(self) -> None:
+        """Stop ticking."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Write the remaining time, stop once the countdown reaches zero."""
+        self._async_update_tick()
+        self.async_write_ha_state()
+
+
+class TotalConnectZoneSensorEntity(TotalConnectZoneEntity, SensorEntity):
+    """Representation of a Total Connect zone sensor entity."""
+
+    coordinator: TotalConnectZoneDetailsCoordinator
+    entity_description: TotalConnectZoneSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: TotalConnectZoneDetailsCoordinator,
+        location: TotalConnectLocation,
+        zone: TotalConnectZone,
+        entity_description: TotalConnectZoneSensorEntityDescription,
+    ) -> None:
+        """Initialize the Total Connect zone sensor entity."""
+        super().__init__(coordinator, location, zone, entity_description.key)
+        self.entity_description = entity_description
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the state of the entity."""
+        details = self.coordinator.data.get(self._location_id, {}).get(self._zone_id)
+        if details is None:
+            return None
+        return self.entity_description.value_fn(details)
+
+
+class TotalConnectZoneStatisticSensorEntity(TotalConnectZoneEntity, SensorEntity):
+    """Representation of a Total Connect zone statistic sensor entity."""
+
+    entity_description: TotalConnectZoneStatisticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: TotalConnectDataUpdateCoordinator,
+        location: TotalConnectLocation,
+        zone: TotalConnectZone,
+        entity_description: TotalConnectZoneStatisticSensorEntityDescription,
+    ) -> None:
+        """Initialize the Total Connect zone statistic sensor entity."""
+        super().__init__(coordinator, location, zone, entity_description.key)
+        self.entity_description = entity_description
+        self._zone_key = (location.location_id, zone.zoneid)
+        self._last_available = True
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return if the zone is tracked."""
+        return super().available and self.statistics is not None
+
+    @property
+    def statistics(self) -> ZoneStatistics | None:
+        """Return the statistics of the zone in the current period."""
+        return self.coordinator.statistics.get(*self._zone_key)
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the state of the entity."""
+        if (statistics := self.statistics) is None:
+            return None
+        return self.entity_description.value_fn(statistics, dt_util.utcnow())
+
+    @property
+    def last_reset(self) -> datetime:
+        """Return when the current period started."""
+        return self.coordinator.statistics.period_start
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the other statistics of the zone."""
+        if (
+            attributes_fn := self.entity_description.attributes_fn
+        ) is None or (statistics := self.statistics) is None:
+            return None
+        return attributes_fn(statistics, dt_util.utcnow())
+
+    async def async_added_to_hass(self) -> None:
+        """Start ticking if the zone is already open."""
+        await super().async_added_to_hass()
+        self._async_update_tick()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop ticking."""
+        await super().async_will_remove_from_hass()
+        self._async_stop_tick()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Statistics only change when the zone opens or closes, or at midnight
+        if (
+            self.available == self._last_available
+            and self._zone_key not in self.coordinator.statistics.changed
+        ):
+            return
+        self._last_available = self.available
+        self._async_update_tick()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_tick(self) -> None:
+        """Tick while the zone is open, if the value grows meanwhile."""
+        is_open = (
+            self.entity_description.ticks_while_open
+            and (statistics := self.statistics) is not None
+            and statistics.is_open
+        )
+        if is_open and self._unsub_tick is None:
+            self._unsub_tick = async_track_time_interval(
+                self.hass, self._async_tick, ZONE_STATISTIC_TICK
+            )
+        elif not is_open:
+            self._async_stop_tick()
+
+    @callback
+    def _async_stop_tick(self) -> None:
+        """Stop ticking."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Write the time the zone has been open so far."""
+        self.async_write_ha_state()
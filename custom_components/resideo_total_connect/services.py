@@ -0,0 +1,321 @@
+"""Services for the Resideo Total Connect integration."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_CODE, Platform
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.service import (
+    async_extract_referenced_entity_ids,
+    async_register_admin_service,
+)
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    ARM_AWAY,
+    ARM_AWAY_INSTANT,
+    ARM_HOME,
+    ARM_HOME_INSTANT,
+    ARM_NIGHT,
+    DISARM,
+    DOMAIN,
+)
+from .diagnostics import TO_REDACT
+from .log import SUBSYSTEMS, get_logger
+
+if TYPE_CHECKING:
+    from .alarm_control_panel import TotalConnectAlarmControlPanelEntity
+    from .coordinator import TotalConnectDataUpdateCoordinator
+
+ATTR_DURATION = "duration"
+ATTR_LOCATION_ID = "location_id"
+ATTR_MODE = "mode"
+ATTR_SAMPLE = "sample"
+ATTR_SUBSYSTEMS = "subsystems"
+ATTR_TOP_N = "top_n"
+
+SERVICE_ARM_PARTITIONS = "arm_partitions"
+SERVICE_DEBUG_LOGGING = "debug_logging"
+SERVICE_DISARM_PARTITIONS = "disarm_partitions"
+SERVICE_EXPORT_FIXTURE = "export_fixture"
+SERVICE_PROFILE = "profile"
+
+_LOGGER = logging.getLogger(__name__)
+
+ARM_MODES = {
+    "away": ARM_AWAY,
+    "away_instant": ARM_AWAY_INSTANT,
+    "home": ARM_HOME,
+    "home_instant": ARM_HOME_INSTANT,
+    "night": ARM_NIGHT,
+}
+
+ARM_PARTITIONS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Required(ATTR_MODE): vol.In(ARM_MODES),
+        vol.Optional(ATTR_CODE): cv.string,
+    }
+)
+
+DISARM_PARTITIONS_SCHEMA = cv.make_entity_service_schema(
+    {
+        vol.Optional(ATTR_CODE): cv.string,
+    }
+)
+
+DEBUG_LOGGING_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SUBSYSTEMS, default=list(SUBSYSTEMS)): vol.All(
+            cv.ensure_list, [vol.In(SUBSYSTEMS)]
+        ),
+        vol.Optional(ATTR_LOCATION_ID): vol.Coerce(int),
+        vol.Optional(ATTR_SAMPLE, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional(ATTR_DURATION, default=300): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional(ATTR_TOP_N, default=30): vol.All(
+            cv.positive_int, vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up the Total Connect services."""
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the integration's hot paths for a bounded window."""
+        entries = _async_get_loaded_entries(hass)
+        if any(entry.runtime_data.coordinator.profiler.active for entry in entries):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="profiler_running",
+            )
+
+        # The results are written once the window ends, the call returns now
+        timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+        for entry in entries:
+            entry.runtime_data.coordinator.profiler.async_start(
+                hass,
+                entry,
+                call.data[ATTR_DURATION],
+                call.data[ATTR_TOP_N],
+                hass.config.path(f"{DOMAIN}_profile_{entry.entry_id}_{timestamp}"),
+            )
+
+    async def async_debug_logging(call: ServiceCall) -> None:
+        """Log debug messages of some subsystems for a bounded window."""
+        location_id = call.data.get(ATTR_LOCATION_ID)
+        for subsystem in call.data[ATTR_SUBSYSTEMS]:
+            get_logger(subsystem).async_enable_debug(
+                hass,
+                {location_id} if location_id is not None else None,
+                call.data[ATTR_SAMPLE],
+                call.data[ATTR_DURATION],
+            )
+
+    async def async_export_fixture(call: ServiceCall) -> None:
+        """Write a fixture of each loaded account's shape and state."""
+        for entry in _async_get_loaded_entries(hass):
+            runtime_data = entry.runtime_data
+            fixture = async_redact_data(
+                runtime_data.coordinator.fixture.build(
+                    runtime_data.coordinator.data,
+                    runtime_data.zone_details_coordinator.data,
+                ),
+                TO_REDACT,
+            )
+            timestamp = dt_util.utcnow().strftime("%Y%m%d%H%M%S")
+            await hass.async_add_executor_job(
+                _write_json,
+                hass.config.path(f"{DOMAIN}_fixture_{entry.entry_id}_{timestamp}.json"),
+                fixture,
+            )
+
+    async def async_partition_command(call: ServiceCall) -> ServiceResponse:
+        """Arm or disarm partitions across locations with one refresh."""
+        if call.service == SERVICE_ARM_PARTITIONS:
+            command = ARM_MODES[call.data[ATTR_MODE]]
+        else:
+            command = DISARM
+        entities = _async_get_panel_entities(hass, call)
+        code = call.data.get(ATTR_CODE)
+        for entity in entities:
+            entity.check_usercode(code)
+
+        # Commands run concurrently across locations, in order within a location
+        locations: dict[
+            tuple[str, int], list[TotalConnectAlarmControlPanelEntity]
+        ] = {}
+        for entity in entities:
+            key = (entity.coordinator.config_entry.entry_id, entity.location_id)
+            locations.setdefault(key, []).append(entity)
+
+        results: dict[str, dict[str, Any]] = {}
+
+        async def async_run_location(
+            location_entities: list[TotalConnectAlarmControlPanelEntity],
+        ) -> None:
+            for entity in location_entities:
+                # Any failure is reported for its partition, the others
+                # still run and are refreshed
+                try:
+                    await entity.async_execute_command(command)
+                except HomeAssistantError as error:
+                    results[entity.entity_id] = _failure(error)
+                except Exception:
+                    _LOGGER.exception(
+                        "Unexpected error running %s on %s", command, entity.entity_id
+                    )
+                    results[entity.entity_id] = _failure(
+                        HomeAssistantError(
+                            translation_domain=DOMAIN,
+                            translation_key=f"{command}_failed",
+                            translation_placeholders={"device": entity.device.name},
+                        )
+                    )
+                else:
+                    results[entity.entity_id] = {"success": True}
+
+        refreshes: dict[TotalConnectDataUpdateCoordinator, set[int]] = {}
+        for entity in entities:
+            refreshes.setdefault(entity.coordinator, set()).add(entity.location_id)
+        try:
+            await asyncio.gather(
+                *(async_run_location(location) for location in locations.values())
+            )
+        finally:
+            await asyncio.gather(
+                *(
+                    coordinator.async_refresh_locations(location_ids)
+                    for coordinator, location_ids in refreshes.items()
+                ),
+                return_exceptions=True,
+            )
+
+        if call.return_response:
+            return {"results": results}
+        if failed := [
+            entity_id for entity_id, result in results.items() if not result["success"]
+        ]:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="partition_command_failed",
+                translation_placeholders={"entities": ", ".join(failed)},
+            )
+        return None
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ARM_PARTITIONS,
+        async_partition_command,
+        schema=ARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DISARM_PARTITIONS,
+        async_partition_command,
+        schema=DISARM_PARTITIONS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_EXPORT_FIXTURE,
+        async_export_fixture,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_DEBUG_LOGGING,
+        async_debug_logging,
+        schema=DEBUG_LOGGING_SCHEMA,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+    )
+
+
+def _async_get_loaded_entries(hass: HomeAssistant) -> list[ConfigEntry]:
+    """Return the loaded config entries, raise if there are none."""
+    entries = hass.config_entries.async_loaded_entries(DOMAIN)
+    if not entries:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="not_loaded",
+        )
+    return entries
+
+
+def _async_get_panel_entities(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[TotalConnectAlarmControlPanelEntity]:
+    """Return the Total Connect alarm control panel entities targeted by call."""
+    selected = async_extract_referenced_entity_ids(hass, call)
+    entity_ids = selected.referenced | selected.indirectly_referenced
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.domain == Platform.ALARM_CONTROL_PANEL
+        for entity_id, entity in platform.entities.items()
+        if entity_id in entity_ids
+    ]
+    if not entities:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="no_partitions",
+        )
+    return entities
+
+
+def _failure(error: HomeAssistantError) -> dict[str, Any]:
+    """Return the result of a partition command that failed.
+
+    The error is the translation key of the message, which callers can
+    branch on, and the message is the one the alarm panel service shows.
+    """
+    return {
+        "success": False,
+        "error": error.translation_key,
+        "message": str(error),
+    }
+
+
+def _write_json(path: str, data: dict[str, Any]) -> None:
+    """Write compact JSON to a file."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, separators=(",", ":"))
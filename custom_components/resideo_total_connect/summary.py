@@ -0,0 +1,85 @@
+"""Incrementally maintained zone summaries for Resideo Total Connect."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from .models import SnapshotDiff, ZoneSnapshot
+
+SummaryScope = tuple[int, int | None]
+
+OPEN = "open"
+BYPASSED = "bypassed"
+TAMPERED = "tampered"
+LOW_BATTERY = "low_battery"
+
+SUMMARY_PREDICATES: dict[str, Callable[[ZoneSnapshot], bool]] = {
+    OPEN: lambda zone: zone.is_faulted or zone.is_triggered,
+    BYPASSED: lambda zone: zone.is_bypassed,
+    TAMPERED: lambda zone: zone.is_tampered,
+    LOW_BATTERY: lambda zone: zone.is_low_battery,
+}
+
+
+class ZoneSummary:
+    """Zones matching each summary kind within a location or partition."""
+
+    __slots__ = ("zones",)
+
+    def __init__(self) -> None:
+        """Initialize the summary."""
+        self.zones: dict[str, dict[int, str]] = {
+            kind: {} for kind in SUMMARY_PREDICATES
+        }
+
+    def count(self, kind: str) -> int:
+        """Return the number of zones matching kind."""
+        return len(self.zones[kind])
+
+    def descriptions(self, kind: str) -> list[str]:
+        """Return the sorted descriptions of the zones matching kind."""
+        return sorted(self.zones[kind].values())
+
+
+class ZoneSummaryTracker:
+    """Maintain per-location and per-partition zone summaries from diffs.
+
+    A location scope is (location_id, None) and a partition scope is
+    (location_id, partition_id). Only zones that changed in a refresh are
+    visited, so the cost of a refresh scales with the changes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._summaries: dict[SummaryScope, ZoneSummary] = {}
+        self.changed: set[SummaryScope] = set()
+
+    def get(self, location_id: int, partition_id: int | None = None) -> ZoneSummary:
+        """Return the summary of a location or one of its partitions."""
+        if (summary := self._summaries.get((location_id, partition_id))) is None:
+            summary = self._summaries[(location_id, partition_id)] = ZoneSummary()
+        return summary
+
+    def apply(self, diff: SnapshotDiff) -> set[SummaryScope]:
+        """Apply zone changes and return the scopes whose summary changed."""
+        changed: set[SummaryScope] = set()
+        for location_id, old, new in diff.zones:
+            for kind, predicate in SUMMARY_PREDICATES.items():
+                was = old is not None and predicate(old)
+                now = new is not None and predicate(new)
+                moved = (
+                    old is not None
+                    and new is not None
+                    and old.partition_id != new.partition_id
+                )
+                if was and (not now or moved or old.description != new.description):
+                    for scope in ((location_id, None), (location_id, old.partition_id)):
+                        self.get(*scope).zones[kind].pop(old.zone_id, None)
+                        changed.add(scope)
+                if now:
+                    for scope in ((location_id, None), (location_id, new.partition_id)):
+                        zones = self.get(*scope).zones[kind]
+                        if zones.get(new.zone_id) != new.description:
+                            zones[new.zone_id] = new.description
+                            changed.add(scope)
+        self.changed = changed
+        return changed
@@ -0,0 +1,194 @@
+"""Command latency tracing for the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable
+import math
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .log import COMMAND, get_logger
+from .models import LocationSnapshot, TotalConnectSnapshot
+
+EVENT_COMMAND_TRACE = f"{DOMAIN}_command_trace"
+
+CONFIRM_TIMEOUT = 300  # seconds to wait for the panel to report a command
+MAX_SAMPLES = 200  # samples kept per command type and stage
+
+OUTCOME_CONFIRMED = "confirmed"
+OUTCOME_FAILED = "failed"
+OUTCOME_UNCONFIRMED = "unconfirmed"
+
+STAGE_CLOUD = "cloud"
+STAGE_CONFIRM = "confirm"
+STAGE_QUEUE = "queue"
+STAGE_TOTAL = "total"
+
+_COMMAND_LOGGER = get_logger(COMMAND)
+
+
+class CommandTrace:
+    """Stage timings of a single command.
+
+    Stages are sequential: queue is the executor wait, cloud is the Total
+    Connect call and confirm is the wait until a refresh shows the result.
+    """
+
+    __slots__ = (
+        "command",
+        "entity_id",
+        "location_id",
+        "partition_id",
+        "stages",
+        "started",
+        "_mark",
+    )
+
+    def __init__(
+        self,
+        command: str,
+        location_id: int,
+        partition_id: int | None,
+        entity_id: str | None,
+    ) -> None:
+        """Initialize the trace."""
+        self.command = command
+        self.location_id = location_id
+        self.partition_id = partition_id
+        self.entity_id = entity_id
+        self.stages: dict[str, float] = {}
+        self.started = self._mark = time.monotonic()
+
+    def end_stage(self, stage: str) -> None:
+        """End a stage at the current time, the next stage starts now."""
+        now = time.monotonic()
+        self.stages[stage] = now - self._mark
+        self._mark = now
+
+
+class CommandTracer:
+    """Collect command traces and compute per-command latency percentiles."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracer."""
+        self.hass = hass
+        self.fire_events = False
+        self._samples: defaultdict[str, defaultdict[str, deque[float]]] = defaultdict(
+            lambda: defaultdict(lambda: deque(maxlen=MAX_SAMPLES))
+        )
+        self._outcomes: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self._pending: list[
+            tuple[CommandTrace, Callable[[LocationSnapshot], bool] | None]
+        ] = []
+
+    def start(
+        self,
+        command: str,
+        location_id: int,
+        partition_id: int | None = None,
+        entity_id: str | None = None,
+    ) -> CommandTrace:
+        """Start tracing a command."""
+        return CommandTrace(command, location_id, partition_id, entity_id)
+
+    @callback
+    def async_failed(self, trace: CommandTrace) -> None:
+        """Finish a command that failed."""
+        self._async_finish(trace, OUTCOME_FAILED)
+
+    @callback
+    def async_sent(
+        self,
+        trace: CommandTrace,
+        confirmed: Callable[[LocationSnapshot], bool] | None = None,
+    ) -> None:
+        """Wait for a refresh where confirmed is true, or any refresh if None."""
+        self._pending.append((trace, confirmed))
+
+    @callback
+    def async_process_snapshot(self, snapshot: TotalConnectSnapshot) -> None:
+        """Finish the pending commands confirmed by a new snapshot."""
+        if not self._pending:
+            return
+        now = time.monotonic()
+        pending = []
+        for trace, confirmed in self._pending:
+            location = snapshot.locations.get(trace.location_id)
+            if location is not None and (confirmed is None or confirmed(location)):
+                trace.end_stage(STAGE_CONFIRM)
+                self._async_finish(trace, OUTCOME_CONFIRMED)
+            elif now - trace.started > CONFIRM_TIMEOUT:
+                self._async_finish(trace, OUTCOME_UNCONFIRMED)
+            else:
+                pending.append((trace, confirmed))
+        self._pending = pending
+
+    @callback
+    def _async_finish(self, trace: CommandTrace, outcome: str) -> None:
+        """Record the stages of a finished command."""
+        samples = self._samples[trace.command]
+        for stage, duration in trace.stages.items():
+            samples[stage].append(duration)
+        total = time.monotonic() - trace.started
+        if outcome == OUTCOME_CONFIRMED:
+            samples[STAGE_TOTAL].append(total)
+        self._outcomes[trace.command][outcome] += 1
+        _COMMAND_LOGGER.debug(
+            "Command %s of %s %s",
+            trace.command,
+            trace.entity_id,
+            outcome,
+            location_id=trace.location_id,
+            partition_id=trace.partition_id,
+            operation=trace.command,
+            duration=total,
+        )
+
+        if self.fire_events:
+            self.hass.bus.async_fire(
+                EVENT_COMMAND_TRACE,
+                {
+                    "command": trace.command,
+                    "entity_id": trace.entity_id,
+                    "location_id": trace.location_id,
+                    "partition_id": trace.partition_id,
+                    "outcome": outcome,
+                    "stages": {
+                        stage: round(duration, 3)
+                        for stage, duration in trace.stages.items()
+                    },
+                },
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the outcomes and stage percentiles per command."""
+        return {
+            command: {
+                "outcomes": dict(self._outcomes[command]),
+                "stages": {
+                    stage: _percentiles(durations)
+                    for stage, durations in stages.items()
+                },
+            }
+            for command, stages in self._samples.items()
+        }
+
+
+def _percentiles(durations: deque[float]) -> dict[str, float | int]:
+    """Return nearest-rank percentiles of durations in seconds."""
+    ordered = sorted(durations)
+
+    def rank(percentile: int) -> float:
+        index = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+        return round(ordered[index], 3)
+
+    return {
+        "count": len(ordered),
+        "p50": rank(50),
+        "p90": rank(90),
+        "p99": rank(99),
+        "max": round(ordered[-1], 3),
+    }
@@ -0,0 +1,250 @@
+"""API call accounting for the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable
+from datetime import date, timedelta
+import re
+import threading
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from total_connect_client.client import TotalConnectClient
+
+ACCOUNT = "account"  # calls that are not made for a location
+AUTH_CONFIG = "auth_config"
+BUDGET_RESERVE = 0.1  # share of the budget kept for commands
+HISTORY_DAYS = 7
+LOGIN = "login"
+MAX_POLL_INTERVAL = timedelta(hours=1)
+SAVE_DELAY = 60
+STORAGE_VERSION = 1
+
+# Operations are named after the endpoint called, matched in this order
+OPERATIONS = (
+    (re.compile(r"/partitions/fullStatus$"), "full_status"),
+    (re.compile(r"/partitions/zones/0$"), "zone_details"),
+    (re.compile(r"/partitions/config$"), "partition_details"),
+    (re.compile(r"/partitions/arm$"), "arm"),
+    (re.compile(r"/partitions/disArm$"), "disarm"),
+    (re.compile(r"/clearBypass$"), "clear_bypass"),
+    (re.compile(r"/bypass$"), "bypass"),
+    (re.compile(r"/validateUser/"), "validate_usercode"),
+    (re.compile(r"/authentication/sessiondetails$"), "session_details"),
+    (re.compile(r"/authentication/logout$"), "logout"),
+)
+LOCATION = re.compile(r"/locations/(\d+)")
+
+
+def classify(endpoint: str) -> tuple[str, str]:
+    """Return the operation and location key of an endpoint."""
+    operation = next(
+        (name for pattern, name in OPERATIONS if pattern.search(endpoint)), "other"
+    )
+    match = LOCATION.search(endpoint)
+    return operation, match.group(1) if match else ACCOUNT
+
+
+class ApiUsageTracker:
+    """Count the Total Connect API calls of the day by operation and location.
+
+    Calls are counted from the executor threads that make them. The counts
+    of the day are saved to storage shortly after they change and restored
+    on startup, earlier days are kept as totals for a week. A new day starts
+    with the first call or read after midnight.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self.budget = 0
+        self.history: list[dict[str, Any]] = []
+        self._day = dt_util.now().date()
+        self._calls: dict[str, Counter[str]] = {}
+        self._lock = threading.Lock()
+        self._save_pending = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.usage"
+        )
+
+    async def async_load(self) -> None:
+        """Restore the counts saved earlier today."""
+        if (data := await self._store.async_load()) is None:
+            return
+        self.history = data["history"]
+        calls = {key: Counter(value) for key, value in data["calls"].items()}
+        with self._lock:
+            if date.fromisoformat(data["date"]) == self._day:
+                self._calls = calls
+            else:
+                self._archive(date.fromisoformat(data["date"]), calls)
+
+    async def async_remove(self) -> None:
+        """Remove the saved counts."""
+        await self._store.async_remove()
+
+    def instrument(self, client: TotalConnectClient) -> None:
+        """Count the calls the client makes from now on.
+
+        The client logs in and loads its session details while it is
+        constructed, those calls are counted here. A login is a request for
+        the API configuration and one for a token. Requests the client sends
+        again after a temporary error or a new login are counted as
+        <operation>_retry, from its private _request_with_retries, which
+        total-connect-client is pinned for. Transport retries of the API
+        configuration request by its HTTP adapter are not counted.
+        """
+        http_request = client.http_request
+        authenticate = client.authenticate
+        request_with_retries = client._request_with_retries  # noqa: SLF001
+        max_attempts = client.MAX_RETRY_ATTEMPTS
+
+        def counted_http_request(
+            endpoint: str,
+            method: str,
+            params: dict[str, Any] | None = None,
+            data: dict[str, Any] | None = None,
+        ) -> dict[str, Any]:
+            self.record(*classify(endpoint))
+            return http_request(endpoint, method, params, data)
+
+        def counted_request_with_retries(
+            do_request: Callable[[], dict[str, Any]],
+            request_description: str,
+            attempts_remaining: int = max_attempts,
+        ) -> dict[str, Any]:
+            # The first attempt is counted by http_request, the client calls
+            # this again for each retry. Descriptions are "<method> <endpoint>"
+            # followed by the arguments.
+            if attempts_remaining < max_attempts:
+                operation, location = classify(request_description.split(" ")[1])
+                self.record(f"{operation}_retry", location)
+            return request_with_retries(
+                do_request, request_description, attempts_remaining
+            )
+
+        def counted_authenticate() -> None:
+            self.record(AUTH_CONFIG)
+            self.record(LOGIN)
+            authenticate()
+
+        client.http_request = counted_http_request  # type: ignore[method-assign]
+        client._request_with_retries = (  # type: ignore[method-assign] # noqa: SLF001
+            counted_request_with_retries
+        )
+        client.authenticate = counted_authenticate  # type: ignore[method-assign]
+        self.record(AUTH_CONFIG)
+        self.record(LOGIN)
+        self.record("session_details")
+
+    def record(self, operation: str, location: str = ACCOUNT) -> None:
+        """Count a call, from any thread."""
+        with self._lock:
+            self._roll_over()
+            self._calls.setdefault(location, Counter())[operation] += 1
+
+    def _roll_over(self) -> None:
+        """Start a new day if the day changed, with the lock held."""
+        if (today := dt_util.now().date()) != self._day:
+            self._archive(self._day, self._calls)
+            self._day = today
+            self._calls = {}
+
+    def _archive(self, day: date, calls: dict[str, Counter[str]]) -> None:
+        """Keep the totals of a past day."""
+        operations: Counter[str] = Counter()
+        for counts in calls.values():
+            operations.update(counts)
+        self.history = [
+            {
+                "date": day.isoformat(),
+                "calls": operations.total(),
+                "operations": dict(operations),
+            },
+            *self.history,
+        ][:HISTORY_DAYS]
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the counts after a delay, coalescing frequent changes."""
+        # Delaying again would postpone a pending save with every poll
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._save_pending = False
+        with self._lock:
+            self._roll_over()
+            return {
+                "date": self._day.isoformat(),
+                "calls": {key: dict(value) for key, value in self._calls.items()},
+                "history": self.history,
+            }
+
+    @property
+    def total(self) -> int:
+        """Return the number of calls today."""
+        with self._lock:
+            self._roll_over()
+            return sum(counts.total() for counts in self._calls.values())
+
+    def by_operation(self) -> dict[str, int]:
+        """Return the calls today by operation."""
+        operations: Counter[str] = Counter()
+        with self._lock:
+            self._roll_over()
+            for counts in self._calls.values():
+                operations.update(counts)
+        return dict(operations)
+
+    def by_location(self) -> dict[str, int]:
+        """Return the calls today by location, or account for the others."""
+        with self._lock:
+            self._roll_over()
+            return {key: counts.total() for key, counts in self._calls.items()}
+
+    @property
+    def budget_remaining(self) -> int | None:
+        """Return the calls left in today's budget, if there is one."""
+        if not self.budget:
+            return None
+        return max(self.budget - self.total, 0)
+
+    def poll_interval(self, interval: timedelta, calls_per_poll: float) -> timedelta:
+        """Return the poll interval that keeps the day within the budget.
+
+        Polls may use the budget minus a reserve for commands. When polling
+        at interval would exceed it before midnight, the interval is
+        stretched to spread the calls left over the rest of the day, up to
+        MAX_POLL_INTERVAL so the panel state never gets too old.
+        """
+        if not self.budget:
+            return interval
+        now = dt_util.now()
+        left = self.budget * (1 - BUDGET_RESERVE) - self.total
+        if left <= 0:
+            return max(interval, MAX_POLL_INTERVAL)
+        seconds_left = (
+            dt_util.start_of_local_day(now.date() + timedelta(days=1)) - now
+        ).total_seconds()
+        needed = timedelta(seconds=seconds_left * calls_per_poll / left)
+        return max(interval, min(needed, MAX_POLL_INTERVAL))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts for diagnostics."""
+        with self._lock:
+            self._roll_over()
+            calls = {key: dict(value) for key, value in self._calls.items()}
+        return {
+            "date": self._day.isoformat(),
+            "budget": self.budget,
+            "calls": calls,
+            "history": self.history,
+        }
@@ -1,18 +1,233 @@
 """Utilities for the Resideo Total Connect integration."""
 from __future__ import annotations
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.const import ATTR_MANUFACTURER, ATTR_MODEL
+from functools import cache
+from typing import TYPE_CHECKING
 
-from total_connect_client.location import TotalConnectLocation
-from total_connect_client.zone import TotalConnectZone
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.const import ATTR_MANUFACTURER, ATTR_MODEL, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.importlib import async_import_module
 
 from .const import (
+    ARM_AWAY,
+    ARM_AWAY_INSTANT,
+    ARM_HOME,
+    ARM_HOME_INSTANT,
+    ARM_NIGHT,
     ATTR_ZONES,
     DEFAULT_MANUFACTURER,
+    DISARM,
+    DOMAIN,
     LOCATION_ZONE_DEVICE_INFO,
+    ZONE_DIAGNOSTICS_ATTRIBUTES,
+    ZONE_DIAGNOSTICS_ENABLED,
 )
 
+if TYPE_CHECKING:
+    from total_connect_client import ArmingState
+    from total_connect_client.client import TotalConnectClient
+    from total_connect_client.location import TotalConnectLocation
+    from total_connect_client.zone import TotalConnectZone
+
+    from .models import LocationSnapshot, ZoneSnapshot
+
+
+async def async_import_client(hass: HomeAssistant) -> None:
+    """Import total_connect_client in the import executor.
+
+    The client and its dependencies are slow to import, so they are imported
+    when a client is first needed rather than with the integration.
+    """
+    await async_import_module(hass, "total_connect_client")
+
+
+# Zone entities covered by the zone diagnostics option, by platform and key
+ZONE_DIAGNOSTIC_ENTITIES = (
+    (Platform.BINARY_SENSOR, "bypass"),
+    (Platform.BINARY_SENSOR, "low_battery"),
+    (Platform.BINARY_SENSOR, "tamper"),
+    (Platform.BUTTON, "bypass"),
+)
+# Zone sensors that become attributes of the zone with the option
+ZONE_STATISTIC_ENTITIES = (
+    (Platform.SENSOR, "open_time"),
+    (Platform.SENSOR, "openings"),
+)
+
+
+@callback
+def async_update_zone_diagnostics(
+    hass: HomeAssistant, client: TotalConnectClient, mode: str
+) -> None:
+    """Apply a new zone diagnostics option to the registered zone entities.
+
+    Diagnostic binary sensors and statistic sensors are removed when their
+    state moves to the zone's attributes, and other entities are disabled. Entities the
+    integration disabled are removed rather than enabled again, as Home
+    Assistant reloads the config entry of entities enabled in the registry.
+    The platforms then add the entities the option calls for.
+    """
+    registry = er.async_get(hass)
+    for location in client.locations.values():
+        for zone in location.zones.values():
+            for domain, key in ZONE_DIAGNOSTIC_ENTITIES:
+                entity_id = registry.async_get_entity_id(
+                    domain, DOMAIN, f"{location.location_id}_{zone.zoneid}_{key}"
+                )
+                if entity_id is None:
+                    continue
+                disabled_by = registry.entities[entity_id].disabled_by
+                if mode == ZONE_DIAGNOSTICS_ENABLED:
+                    if disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+                        registry.async_remove(entity_id)
+                elif (
+                    mode == ZONE_DIAGNOSTICS_ATTRIBUTES
+                    and domain == Platform.BINARY_SENSOR
+                ):
+                    registry.async_remove(entity_id)
+                elif disabled_by is None:
+                    registry.async_update_entity(
+                        entity_id, disabled_by=er.RegistryEntryDisabler.INTEGRATION
+                    )
+            if mode != ZONE_DIAGNOSTICS_ATTRIBUTES:
+                continue
+            # Other options keep statistic sensors as they are, disabled by
+            # default, and the platforms add back those removed here
+            for domain, key in ZONE_STATISTIC_ENTITIES:
+                if entity_id := registry.async_get_entity_id(
+                    domain, DOMAIN, f"{location.location_id}_{zone.zoneid}_{key}"
+                ):
+                    registry.async_remove(entity_id)
+
+
+@callback
+def async_remove_zone_entities(
+    hass: HomeAssistant, config_entry_id: str, location_id: int, zone_id: int
+) -> None:
+    """Remove the entities and device of a zone deleted at the panel."""
+    entity_registry = er.async_get(hass)
+    prefix = f"{location_id}_{zone_id}_"
+    # Every zone has a binary sensor, its device is the zone's device
+    entity_id = entity_registry.async_get_entity_id(
+        Platform.BINARY_SENSOR, DOMAIN, f"{prefix}zone"
+    )
+    if entity_id is None:
+        return
+    if (device_id := entity_registry.entities[entity_id].device_id) is None:
+        entity_registry.async_remove(entity_id)
+        return
+    entries = er.async_entries_for_device(
+        entity_registry, device_id, include_disabled_entities=True
+    )
+    zone_entries = [entry for entry in entries if entry.unique_id.startswith(prefix)]
+    if len(zone_entries) == len(entries):
+        dr.async_get(hass).async_update_device(
+            device_id, remove_config_entry_id=config_entry_id
+        )
+        return
+    # Zones without a serial number can share a device across locations
+    for entry in zone_entries:
+        entity_registry.async_remove(entry.entity_id)
+
+
+@callback
+def async_remove_partition_entities(
+    hass: HomeAssistant, location_id: int, partition_id: int
+) -> None:
+    """Remove the entities of a partition deleted at the panel.
+
+    Partition entities belong to the device of their location, along with
+    the location's entities.
+    """
+    entity_registry = er.async_get(hass)
+    # The alarm panel of the first partition is keyed by location alone
+    panel_unique_id = (
+        str(location_id) if partition_id == 1 else f"{location_id}_{partition_id}"
+    )
+    entity_id = entity_registry.async_get_entity_id(
+        Platform.ALARM_CONTROL_PANEL, DOMAIN, panel_unique_id
+    )
+    if entity_id is None:
+        return
+    if (device_id := entity_registry.entities[entity_id].device_id) is None:
+        entity_registry.async_remove(entity_id)
+        return
+    prefix = f"{location_id}_{partition_id}_"
+    for entry in er.async_entries_for_device(
+        entity_registry, device_id, include_disabled_entities=True
+    ):
+        if entry.unique_id == panel_unique_id or entry.unique_id.startswith(prefix):
+            entity_registry.async_remove(entry.entity_id)
+
+
+@cache
+def _arming_zone_types() -> tuple[frozenset[int], frozenset[int]]:
+    """Return the zone types checked when arming away and the interior ones."""
+    from total_connect_client.zone import ZoneType
+
+    return (
+        frozenset(
+            zone_type.value
+            for zone_type in (
+                ZoneType.SECURITY,
+                ZoneType.ENTRY_EXIT1,
+                ZoneType.ENTRY_EXIT2,
+                ZoneType.PERIMETER,
+                ZoneType.INTERIOR_FOLLOWER,
+                ZoneType.TROUBLE_ALARM,
+                ZoneType.INTERIOR_DELAY,
+            )
+        ),
+        # Interior zones are inactive when armed stay or night
+        frozenset((ZoneType.INTERIOR_FOLLOWER.value, ZoneType.INTERIOR_DELAY.value)),
+    )
+
+
+def is_command_confirmed(command: str, arming_state: ArmingState) -> bool:
+    """Return true if the arming state shows that the command took effect."""
+    if command == DISARM:
+        return arming_state.is_disarmed()
+    if arming_state.is_arming():
+        # The panel accepted the command and is counting down the exit delay
+        return True
+    if command in (ARM_AWAY, ARM_AWAY_INSTANT):
+        return arming_state.is_armed_away()
+    if command in (ARM_HOME, ARM_HOME_INSTANT):
+        return arming_state.is_armed_home()
+    if command == ARM_NIGHT:
+        return arming_state.is_armed_night()
+    return False
+
+def get_blocking_zones(
+    command: str,
+    location: LocationSnapshot,
+    partition_id: int,
+    auto_bypass: bool,
+) -> list[ZoneSnapshot]:
+    """Return the zones of a partition that would stop an arm command.
+
+    A zone blocks arming when it is faulted and not bypassed, unless it is a
+    button or an interior zone that the arm mode ignores. With auto bypass,
+    which is the location's auto_bypass_low_battery, the client bypasses low
+    battery zones that can be bypassed as it parses each status, but does
+    not mark them bypassed until a later status says so. Those zones are
+    not counted as blocking.
+    """
+    stay = command in (ARM_HOME, ARM_HOME_INSTANT, ARM_NIGHT)
+    arming_zone_types, interior_zone_types = _arming_zone_types()
+    return [
+        zone
+        for zone in location.zones.values()
+        if zone.partition_id == partition_id
+        and zone.is_faulted
+        and not zone.is_bypassed
+        and not zone.is_button
+        and zone.zone_type_id in arming_zone_types
+        and not (stay and zone.zone_type_id in interior_zone_types)
+        and not (auto_bypass and zone.can_be_bypassed and zone.is_low_battery)
+    ]
 
 def get_location_device_manufacturer(location: TotalConnectLocation) -> str | None:
     """Return location device name."""
@@ -0,0 +1,203 @@
+"""Per-zone open time and openings for Resideo Total Connect."""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .models import SnapshotDiff
+from .summary import OPEN, SUMMARY_PREDICATES
+
+SAVE_DELAY = 60
+STORAGE_VERSION = 1
+
+ZoneKey = tuple[int, int]
+
+_is_open = SUMMARY_PREDICATES[OPEN]
+
+
+class ZoneStatistics:
+    """Time open and closed and openings of a zone in the current period."""
+
+    __slots__ = ("closed_seconds", "is_open", "open_seconds", "openings", "since")
+
+    def __init__(
+        self,
+        is_open: bool,
+        since: datetime,
+        open_seconds: float = 0,
+        closed_seconds: float = 0,
+        openings: int = 0,
+    ) -> None:
+        """Initialize the statistics of a zone that is open or closed since."""
+        self.is_open = is_open
+        self.since = since
+        self.open_seconds = open_seconds
+        self.closed_seconds = closed_seconds
+        self.openings = openings
+
+    def open_time(self, now: datetime) -> float:
+        """Return the seconds the zone was open in the period until now."""
+        if not self.is_open:
+            return self.open_seconds
+        return self.open_seconds + (now - self.since).total_seconds()
+
+    def closed_time(self, now: datetime) -> float:
+        """Return the seconds the zone was closed in the period until now."""
+        if self.is_open:
+            return self.closed_seconds
+        return self.closed_seconds + (now - self.since).total_seconds()
+
+    def update(self, is_open: bool, now: datetime) -> None:
+        """Account for the time since the last change and the new state."""
+        self.open_seconds = self.open_time(now)
+        self.closed_seconds = self.closed_time(now)
+        if is_open and not self.is_open:
+            self.openings += 1
+        self.is_open = is_open
+        self.since = now
+
+
+class ZoneStatisticsTracker:
+    """Track how long each zone is open and how often it opens, per day.
+
+    Statistics are updated from the zone changes of each refresh, so a
+    refresh only visits the zones that changed. Periods start at local
+    midnight. Totals are saved shortly after they change and restored on
+    startup during the same day, time while Home Assistant was stopped is
+    not counted. Zones no enabled entity follows are not kept up to date
+    by refreshes, so they are dropped when saving and at midnight.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zones_of_interest: Callable[[int], Collection[int] | None] | None = None,
+    ) -> None:
+        """Initialize the tracker."""
+        self.period_start = dt_util.start_of_local_day()
+        self.changed: set[ZoneKey] = set()
+        self._zones: dict[ZoneKey, ZoneStatistics] = {}
+        self._restored: dict[ZoneKey, tuple[float, float, int]] = {}
+        self._zones_of_interest = zones_of_interest
+        self._save_pending = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.zone_statistics"
+        )
+
+    async def async_load(self) -> None:
+        """Restore the totals saved earlier today."""
+        if (data := await self._store.async_load()) is None:
+            return
+        if datetime.fromisoformat(data["period_start"]) != self.period_start:
+            return
+        self._restored = {
+            (location_id, zone_id): (open_seconds, closed_seconds, openings)
+            for location_id, zone_id, open_seconds, closed_seconds, openings in data[
+                "zones"
+            ]
+        }
+
+    async def async_remove(self) -> None:
+        """Remove the saved totals."""
+        await self._store.async_remove()
+
+    def get(self, location_id: int, zone_id: int) -> ZoneStatistics | None:
+        """Return the statistics of a zone, if tracked."""
+        return self._zones.get((location_id, zone_id))
+
+    @callback
+    def async_apply(self, diff: SnapshotDiff) -> set[ZoneKey]:
+        """Apply zone changes and return the zones whose statistics changed."""
+        now = dt_util.utcnow()
+        changed: set[ZoneKey] = set()
+        for location_id, old, new in diff.zones:
+            key = (location_id, (new or old).zone_id)
+            if new is None:
+                self._zones.pop(key, None)
+                self._restored.pop(key, None)
+                changed.add(key)
+            elif (statistics := self._zones.get(key)) is None:
+                # A zone seen for the first time since startup is not an
+                # opening, whatever its state
+                self._zones[key] = ZoneStatistics(
+                    _is_open(new), now, *self._restored.pop(key, ())
+                )
+                changed.add(key)
+            elif _is_open(new) != statistics.is_open:
+                statistics.update(_is_open(new), now)
+                changed.add(key)
+        self.changed = changed
+        if changed:
+            self.async_schedule_save()
+        return changed
+
+    @callback
+    def async_reset(self, now: datetime) -> set[ZoneKey]:
+        """Start a new period and return the zones whose statistics reset."""
+        self.period_start = dt_util.start_of_local_day(now)
+        self._restored.clear()
+        self._zones = {
+            key: ZoneStatistics(statistics.is_open, self.period_start)
+            for key, statistics in self._zones.items()
+            if self._is_followed(key)
+        }
+        self.changed = set(self._zones)
+        self.async_schedule_save()
+        return self.changed
+
+    def _is_followed(self, key: ZoneKey) -> bool:
+        """Return if refreshes keep the statistics of a zone up to date."""
+        if self._zones_of_interest is None:
+            return True
+        zone_ids = self._zones_of_interest(key[0])
+        return zone_ids is None or key[1] in zone_ids
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the totals after a delay, coalescing frequent changes."""
+        # Delaying again would postpone a pending save with every change
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        self._save_pending = False
+        now = dt_util.utcnow()
+        return {
+            "period_start": self.period_start.isoformat(),
+            "zones": [
+                [
+                    *key,
+                    statistics.open_time(now),
+                    statistics.closed_time(now),
+                    statistics.openings,
+                ]
+                for key, statistics in self._zones.items()
+                if self._is_followed(key)
+            ],
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary for diagnostics."""
+        now = dt_util.utcnow()
+        return {
+            "period_start": self.period_start.isoformat(),
+            "zones": len(self._zones),
+            "open_zones": sum(
+                statistics.is_open for statistics in self._zones.values()
+            ),
+            "openings": sum(
+                statistics.openings for statistics in self._zones.values()
+            ),
+            "open_seconds": sum(
+                statistics.open_time(now) for statistics in self._zones.values()
+            ),
+        }
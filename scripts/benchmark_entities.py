@@ -0,0 +1,134 @@
+"""Benchmark the entity footprint of each zone diagnostics option.
+
+A synthetic account is set up once per value of the zone_diagnostics
+option against FakeTotalConnectServer. For each, the entity registry
+entries, state objects and memory allocated by the setup are reported,
+then zones are toggled between polls and the state_changed events that
+the recorder would write are counted, for example:
+
+    python scripts/benchmark_entities.py --zones 200 --polls 50
+
+Starting Home Assistant outside of its bootstrap requires
+pytest-homeassistant-custom-component.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import tracemalloc
+
+from fake_total_connect import FakeTotalConnectServer, synthetic_fixture
+from harness import async_home_assistant, async_setup_account
+from total_connect_client.zone import ZoneStatus
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import JSONEncoder
+
+MODES = ("enabled", "disabled", "attributes")
+
+# Zone changes toggled between polls, with their relative weight
+ZONE_CHANGES = (
+    (ZoneStatus.FAULT, 8),
+    (ZoneStatus.BYPASSED, 1),
+    (ZoneStatus.LOW_BATTERY, 1),
+)
+
+
+async def async_measure(
+    hass: HomeAssistant, mode: str, args: argparse.Namespace
+) -> dict[str, float]:
+    """Set up the account with a zone diagnostics option and measure it."""
+    server = FakeTotalConnectServer(
+        synthetic_fixture(args.locations, args.partitions, args.zones)
+    )
+    states_before = len(hass.states.async_all())
+    tracemalloc.start()
+    async with async_setup_account(
+        hass, server, {"zone_diagnostics": mode}
+    ) as entry:
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        entries = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        events = 0
+        size = 0
+
+        @callback
+        def count(event: Event) -> None:
+            nonlocal events, size
+            if (state := event.data["new_state"]) is not None:
+                events += 1
+                size += len(json.dumps(state.as_dict(), cls=JSONEncoder))
+
+        unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, count)
+        coordinator = entry.runtime_data.coordinator
+        # Every mode sees the same zone changes
+        rng = random.Random(0)
+        for _ in range(args.polls):
+            _toggle_zones(server, rng, args.toggle)
+            await coordinator.async_refresh_all()
+            await hass.async_block_till_done()
+        unsubscribe()
+        return {
+            "registry entries": len(entries),
+            "enabled entities": sum(not entity.disabled for entity in entries),
+            "states": len(hass.states.async_all()) - states_before,
+            "setup memory KiB": memory / 1024,
+            "state changes": events,
+            "state change KiB": size / 1024,
+        }
+
+
+def _toggle_zones(
+    server: FakeTotalConnectServer, rng: random.Random, share: float
+) -> None:
+    """Toggle a share of the zones of every location."""
+    changes, weights = zip(*ZONE_CHANGES, strict=True)
+    for location in server.locations.values():
+        zones = list(location["zones"].values())
+        for zone in rng.sample(zones, max(1, int(len(zones) * share))):
+            change = rng.choices(changes, weights)[0]
+            zone["status"] = int(zone["status"]) ^ change.value
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Measure every mode and print the results side by side."""
+    results = {}
+    async with async_home_assistant() as hass:
+        for mode in MODES:
+            results[mode] = await async_measure(hass, mode, args)
+    print(f"{'':<20}" + "".join(f"{mode:>12}" for mode in MODES))
+    for metric in results[MODES[0]]:
+        print(
+            f"{metric:<20}"
+            + "".join(f"{results[mode][metric]:>12.0f}" for mode in MODES)
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--locations", type=int, default=1, help="synthetic locations"
+    )
+    parser.add_argument(
+        "--partitions", type=int, default=2, help="synthetic partitions per location"
+    )
+    parser.add_argument(
+        "--zones", type=int, default=200, help="synthetic zones per location"
+    )
+    parser.add_argument("--polls", type=int, default=50, help="polls to count")
+    parser.add_argument(
+        "--toggle", type=float, default=0.05, help="share of zones changed per poll"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(async_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark the import time of the integration and its platforms.
+
+Each module is imported in a fresh interpreter with -X importtime, after the
+Home Assistant modules that are already loaded when Home Assistant bootstraps
+an integration. The time reported is what importing the module adds on top,
+which is what slows down startup on small hardware such as a Raspberry Pi.
+
+    python scripts/benchmark_import.py --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PACKAGE = "custom_components.resideo_total_connect"
+MODULES = [
+    "",
+    ".config_flow",
+    ".alarm_control_panel",
+    ".binary_sensor",
+    ".button",
+    ".sensor",
+    ".diagnostics",
+]
+
+# Imported before measuring, Home Assistant has loaded these by the time it
+# imports a custom integration and its platforms
+PRELOADED = [
+    "homeassistant.components.alarm_control_panel",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.components.button",
+    "homeassistant.components.diagnostics",
+    "homeassistant.components.sensor",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.importlib",
+    "homeassistant.helpers.service",
+    "homeassistant.helpers.update_coordinator",
+]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str) -> tuple[int, bool]:
+    """Return the microseconds to import module and if the client was imported."""
+    code = f"import {', '.join(PRELOADED)}; import {module}"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    cumulative = 0
+    client = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        if name.strip() == "total_connect_client":
+            client = True
+        if name.strip() == module:
+            cumulative = int(cumulative_us)
+    return cumulative, client
+
+
+def main() -> None:
+    """Print the median import time of each module."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="imports per module")
+    args = parser.parse_args()
+
+    print(f"{'module':<60} {'median ms':>10} {'client':>7}")
+    for suffix in MODULES:
+        module = f"{PACKAGE}{suffix}"
+        samples = [measure(module) for _ in range(args.runs)]
+        median = statistics.median(sample[0] for sample in samples) / 1000
+        client = any(sample[1] for sample in samples)
+        print(f"{module:<60} {median:>10.1f} {'yes' if client else 'no':>7}")
+
+    samples = [measure("total_connect_client")[0] for _ in range(args.runs)]
+    print(
+        f"{'total_connect_client (deferred)':<60} "
+        f"{statistics.median(samples) / 1000:>10.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark polls of a quiet account, with and without the unchanged fast path.
+
+The integration is set up against FakeTotalConnectServer, then the panel
+is polled repeatedly while nothing changes but the time of each response.
+The coordinator fingerprints the parsed fields of each location's status
+payload and skips parsing, snapshots and entity updates when they are
+unchanged. For the baseline, fingerprints are made to
+never match so every poll takes the full path, for example:
+
+    python scripts/benchmark_poll.py --zones 500 --polls 200
+
+Pass a fixture written by the export_fixture service to poll the recorded
+payload of a production account instead of a synthetic one. Starting Home
+Assistant outside of its bootstrap requires
+pytest-homeassistant-custom-component.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from itertools import count
+import json
+import logging
+import statistics
+import time
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from fake_total_connect import FakeTotalConnectServer, synthetic_fixture
+from harness import async_home_assistant, async_setup_account
+
+from homeassistant.core import HomeAssistant
+
+if TYPE_CHECKING:
+    from custom_components.resideo_total_connect.coordinator import (
+        TotalConnectDataUpdateCoordinator,
+    )
+
+COORDINATOR = "custom_components.resideo_total_connect.coordinator"
+
+
+async def async_time_polls(
+    hass: HomeAssistant, coordinator: TotalConnectDataUpdateCoordinator, polls: int
+) -> list[float]:
+    """Return the duration of each poll, including entity updates."""
+    durations = []
+    for _ in range(polls):
+        start = time.perf_counter()
+        await coordinator.async_refresh_all()
+        await hass.async_block_till_done()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Poll with and without the fast path and print the results."""
+    if args.fixture:
+        server = FakeTotalConnectServer.from_file(args.fixture)
+    else:
+        server = FakeTotalConnectServer(
+            synthetic_fixture(args.locations, args.partitions, args.zones)
+        )
+    # The status payload the coordinator fingerprints for each location
+    payload_size = sum(
+        len(
+            json.dumps(
+                server.handle(
+                    "GET", f"api/v3/locations/{location_id}/partitions/fullStatus"
+                )
+            )
+        )
+        for location_id in server.locations
+    )
+    results = {}
+    async with (
+        async_home_assistant() as hass,
+        async_setup_account(hass, server) as entry,
+    ):
+        coordinator = entry.runtime_data.coordinator
+        # Warm up, the first polls after setup parse the payload
+        await async_time_polls(hass, coordinator, 2)
+        results["fast path"] = await async_time_polls(hass, coordinator, args.polls)
+        fingerprints = count()
+        with patch(f"{COORDINATOR}.payload_fingerprint", lambda _: next(fingerprints)):
+            results["full path"] = await async_time_polls(
+                hass, coordinator, args.polls
+            )
+
+    print(
+        f"{len(server.locations)} locations, "
+        f"{sum(len(location['zones']) for location in server.locations.values())} "
+        f"zones, {payload_size / 1024:.0f} KiB of status payload per poll\n"
+    )
+    print(f"{'':<12} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for name, durations in results.items():
+        print(
+            f"{name:<12} {statistics.fmean(durations) * 1000:>9.2f} "
+            f"{statistics.median(durations) * 1000:>9.2f} "
+            f"{statistics.quantiles(durations, n=100)[98] * 1000:>9.2f}"
+        )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", nargs="?", help="fixture written by export_fixture")
+    parser.add_argument(
+        "--locations", type=int, default=1, help="synthetic locations"
+    )
+    parser.add_argument(
+        "--partitions", type=int, default=2, help="synthetic partitions per location"
+    )
+    parser.add_argument(
+        "--zones", type=int, default=500, help="synthetic zones per location"
+    )
+    parser.add_argument("--polls", type=int, default=100, help="polls to time")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(async_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,496 @@
+"""Fake Total Connect server backed by a fixture exported by the integration.
+
+The fake answers the Total Connect web API requests made by
+total_connect_client, so the real client parses real-shaped responses
+without network access. Use the resideo_total_connect.export_fixture
+service to capture the shape of a production account, then reproduce it
+offline, for example:
+
+    python scripts/fake_total_connect.py resideo_total_connect_fixture_<entry_id>_<timestamp>.json
+
+FakeTotalConnectClient can be passed anywhere the integration expects a
+TotalConnectClient, such as in a profiling or load test harness.
+"""
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+import json
+import random
+import re
+import threading
+import time
+from typing import Any
+
+from total_connect_client import ArmingState, ArmType, TotalConnectClient
+from total_connect_client.const import _ResultCode
+from total_connect_client.zone import ZoneStatus, ZoneType
+
+# Must match FIXTURE_VERSION in custom_components/resideo_total_connect/fixture.py
+FIXTURE_VERSION = 1
+# .NET ticks, 100 ns since 0001-01-01, at the Unix epoch
+DOTNET_EPOCH_TICKS = 621_355_968_000_000_000
+
+ARM_STATES = {
+    ArmType.AWAY.value: ArmingState.ARMED_AWAY,
+    ArmType.STAY.value: ArmingState.ARMED_STAY,
+    ArmType.STAY_INSTANT.value: ArmingState.ARMED_STAY_INSTANT,
+    ArmType.AWAY_INSTANT.value: ArmingState.ARMED_AWAY_INSTANT,
+    ArmType.STAY_NIGHT.value: ArmingState.ARMED_STAY_NIGHT,
+}
+
+ROUTES = [
+    (
+        "GET",
+        re.compile(r"api/v3/authentication/sessiondetails$"),
+        "_session_details",
+    ),
+    (
+        "POST",
+        re.compile(r"api/v3/authentication/logout$"),
+        "_logout",
+    ),
+    (
+        "GET",
+        re.compile(r"api/v3/locations/(\d+)/partitions/fullStatus$"),
+        "_full_status",
+    ),
+    (
+        "GET",
+        re.compile(r"api/v1/locations/(\d+)/partitions/zones/0$"),
+        "_zone_details",
+    ),
+    (
+        "GET",
+        re.compile(r"api/v1/locations/(\d+)/devices/\w+/partitions/config$"),
+        "_partition_details",
+    ),
+    (
+        "PUT",
+        re.compile(r"api/v3/locations/(\d+)/devices/\w+/partitions/arm$"),
+        "_arm",
+    ),
+    (
+        "PUT",
+        re.compile(r"api/v3/locations/(\d+)/devices/\w+/partitions/disArm$"),
+        "_disarm",
+    ),
+    (
+        "PUT",
+        re.compile(r"api/v1/locations/(\d+)/devices/\w+/bypass$"),
+        "_bypass",
+    ),
+    (
+        "PUT",
+        re.compile(r"api/v2/locations/(\d+)/devices/\w+/clearBypass$"),
+        "_clear_bypass",
+    ),
+]
+
+SUCCESS = {"ResultCode": _ResultCode.SUCCESS.value, "ResultData": "Success"}
+COMMAND_SUCCESS = {
+    "ResultCode": _ResultCode.ARM_SUCCESS.value,
+    "ResultData": "Success",
+}
+COMMAND_FAILED = {
+    "ResultCode": _ResultCode.COMMAND_FAILED.value,
+    "ResultData": "Panel busy",
+}
+
+
+class FakeTotalConnectServer:
+    """In-process Total Connect API backed by a fixture.
+
+    latency is the mean response time of each request in seconds. A panel
+    handles one command at a time, so a command that arrives while another
+    is running at the same location fails as busy. busy_rate adds random
+    busy failures to commands.
+    """
+
+    def __init__(
+        self,
+        fixture: dict[str, Any],
+        latency: float = 0.0,
+        busy_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server from a fixture."""
+        if fixture.get("version") != FIXTURE_VERSION:
+            raise ValueError(f"Unsupported fixture version {fixture.get('version')}")
+        self.latency = latency
+        self.busy_rate = busy_rate
+        self.requests: Counter[str] = Counter()
+        self.busy: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._commands: set[int] = set()
+        fields = fixture["zone_fields"]
+        self.locations: dict[int, dict[str, Any]] = {}
+        for location in fixture["locations"]:
+            self.locations[location["location_id"]] = {
+                **location,
+                "partitions": {
+                    partition["partition_id"]: dict(partition)
+                    for partition in location["partitions"]
+                },
+                "zones": {
+                    zone[0]: dict(zip(fields, zone, strict=True))
+                    for zone in location["zones"]
+                },
+            }
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> FakeTotalConnectServer:
+        """Load a fixture file."""
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file), **kwargs)
+
+    def handle(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Answer a request the way the Total Connect API does."""
+        for route_method, pattern, handler in ROUTES:
+            if method == route_method and (match := pattern.search(endpoint)):
+                self.requests[handler.lstrip("_")] += 1
+                arguments = [int(group) for group in match.groups()]
+                if method != "PUT":
+                    self._sleep()
+                    return getattr(self, handler)(*arguments, data or {})
+                return self._command(handler, arguments[0], data or {})
+        raise ValueError(f"Unknown request {method} {endpoint}")
+
+    def _sleep(self) -> None:
+        """Wait for a jittered response time."""
+        if self.latency:
+            time.sleep(self.latency * self._random.uniform(0.5, 1.5))
+
+    def _command(
+        self, handler: str, location_id: int, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run a panel command, failing as busy if one is already running."""
+        with self._lock:
+            busy = location_id in self._commands or (
+                self._random.random() < self.busy_rate
+            )
+            if not busy:
+                self._commands.add(location_id)
+        if busy:
+            self._sleep()
+            self.busy[handler.lstrip("_")] += 1
+            return COMMAND_FAILED
+        try:
+            self._sleep()
+            with self._lock:
+                return getattr(self, handler)(location_id, data)
+        finally:
+            with self._lock:
+                self._commands.discard(location_id)
+
+    def _session_details(self, data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **SUCCESS,
+            "SessionDetailsResult": {
+                "ModuleFlags": "Fake=1",
+                "UserInfo": {
+                    "UserID": 1,
+                    "Username": "fake",
+                    "UserFeatureList": (
+                        "Master=0,User Administration=0,Configuration Administration=0"
+                    ),
+                },
+                "Locations": [
+                    {
+                        "LocationID": location_id,
+                        "LocationName": f"Location {location_id}",
+                        "PhotoURL": "",
+                        "LocationModuleFlags": "Fake=1",
+                        "SecurityDeviceID": location_id,
+                        "DeviceList": [
+                            {
+                                "DeviceID": location_id,
+                                "DeviceName": "Security Panel",
+                                "DeviceClassID": 1,
+                                "DeviceSerialNumber": "",
+                                "SecurityPanelTypeID": 0,
+                                "DeviceSerialText": "",
+                                "DeviceFlags": None,
+                            }
+                        ],
+                    }
+                    for location_id in self.locations
+                ],
+            },
+        }
+
+    def _logout(self, data: dict[str, Any]) -> dict[str, Any]:
+        return SUCCESS
+
+    def _full_status(self, location_id: int, data: dict[str, Any]) -> dict[str, Any]:
+        location = self.locations[location_id]
+        return {
+            **SUCCESS,
+            "ArmingState": location["arming_state"],
+            "PanelStatus": {
+                "IsInACLoss": location["ac_loss"],
+                "IsInLowBattery": location["low_battery"],
+                "IsCoverTampered": location["cover_tampered"],
+                # Like the real service, the time of the response
+                "LastUpdatedTimestampTicks": int(time.time() * 10_000_000)
+                + DOTNET_EPOCH_TICKS,
+                "ConfigurationSequenceNumber": 1,
+                "Partitions": [
+                    {
+                        "PartitionID": partition["partition_id"],
+                        "ArmingState": partition["arming_state"],
+                    }
+                    for partition in location["partitions"].values()
+                ],
+                "Zones": [
+                    _zone_status(zone) for zone in location["zones"].values()
+                ],
+            },
+        }
+
+    def _zone_details(self, location_id: int, data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            **SUCCESS,
+            "ZoneStatus": {
+                "Zones": [
+                    {
+                        **_zone_status(zone),
+                        "Batterylevel": zone["battery_level"],
+                        "Signalstrength": zone["signal_strength"],
+                    }
+                    for zone in self.locations[location_id]["zones"].values()
+                ]
+            },
+        }
+
+    def _partition_details(
+        self, location_id: int, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            **SUCCESS,
+            "Partitions": [
+                {
+                    "PartitionID": partition["partition_id"],
+                    "PartitionName": partition["name"],
+                    "ArmingState": partition["arming_state"],
+                    "ExitDelayTimer": partition["exit_delay_timer"],
+                }
+                for partition in self.locations[location_id]["partitions"].values()
+            ],
+        }
+
+    def _arm(self, location_id: int, data: dict[str, Any]) -> dict[str, Any]:
+        location = self.locations[location_id]
+        partition_ids = set(data["partitions"])
+        # Like a real panel, refuse to arm with faulted zones that are not bypassed
+        for zone in location["zones"].values():
+            if (
+                zone["partition_id"] in partition_ids
+                and zone["status"] & ZoneStatus.FAULT
+                and not zone["status"] & ZoneStatus.BYPASSED
+            ):
+                return {**COMMAND_FAILED, "ResultData": "Zone faulted"}
+        self._set_arming_state(
+            location, partition_ids, ARM_STATES[data["armType"]].value
+        )
+        return COMMAND_SUCCESS
+
+    def _disarm(self, location_id: int, data: dict[str, Any]) -> dict[str, Any]:
+        self._set_arming_state(
+            self.locations[location_id],
+            set(data["partitions"]),
+            ArmingState.DISARMED.value,
+        )
+        return COMMAND_SUCCESS
+
+    def _bypass(self, location_id: int, data: dict[str, Any]) -> dict[str, Any]:
+        zones = self.locations[location_id]["zones"]
+        for zone_id in data["ZoneIds"]:
+            if not zones[zone_id]["can_be_bypassed"]:
+                return {
+                    "ResultCode": _ResultCode.FAILED_TO_BYPASS_ZONE.value,
+                    "ResultData": "Failed to bypass zone",
+                }
+        for zone_id in data["ZoneIds"]:
+            zones[zone_id]["status"] |= ZoneStatus.BYPASSED
+        return SUCCESS
+
+    def _clear_bypass(self, location_id: int, data: dict[str, Any]) -> dict[str, Any]:
+        for zone in self.locations[location_id]["zones"].values():
+            zone["status"] &= ~ZoneStatus.BYPASSED
+        return SUCCESS
+
+    @staticmethod
+    def _set_arming_state(
+        location: dict[str, Any], partition_ids: set[int], arming_state: int
+    ) -> None:
+        """Set the arming state of partitions and derive the location's."""
+        partitions = location["partitions"]
+        for partition_id in partition_ids:
+            partitions[partition_id]["arming_state"] = arming_state
+        # A location with mixed partition states reports its first partition
+        location["arming_state"] = next(iter(partitions.values()))["arming_state"]
+
+
+def _zone_status(zone: dict[str, Any]) -> dict[str, Any]:
+    """Return the zone fields reported by the status endpoints."""
+    return {
+        "ZoneID": zone["zone_id"],
+        "ZoneDescription": zone["description"],
+        "PartitionID": zone["partition_id"],
+        "ZoneStatus": int(zone["status"]),
+        "ZoneTypeId": zone["zone_type_id"],
+        "CanBeBypassed": zone["can_be_bypassed"],
+    }
+
+
+def synthetic_fixture(
+    locations: int = 1, partitions: int = 1, zones: int = 8
+) -> dict[str, Any]:
+    """Return a fixture of disarmed locations with closed zones.
+
+    Zones are spread over the partitions of each location and cycle through
+    a door, a window and a motion sensor, so arming away and arming stay
+    meet the same kinds of zones as on a real panel.
+    """
+    zone_types = (
+        ("Door", ZoneType.ENTRY_EXIT1),
+        ("Window", ZoneType.PERIMETER),
+        ("Motion", ZoneType.INTERIOR_FOLLOWER),
+    )
+    disarmed = ArmingState.DISARMED.value
+    fixture_locations = []
+    for location_index in range(locations):
+        fixture_zones = []
+        for zone_id in range(1, zones + 1):
+            name, zone_type = zone_types[zone_id % len(zone_types)]
+            fixture_zones.append(
+                [
+                    zone_id,
+                    zone_id % partitions + 1,
+                    f"{name} {zone_id}",
+                    ZoneStatus.NORMAL.value,
+                    zone_type.value,
+                    True,
+                    # Battery and signal levels of 0 to 5 bars
+                    5,
+                    5,
+                ]
+            )
+        fixture_locations.append(
+            {
+                "location_id": 1000 + location_index,
+                "arming_state": disarmed,
+                "ac_loss": False,
+                "low_battery": False,
+                "cover_tampered": False,
+                "partitions": [
+                    {
+                        "partition_id": partition_id,
+                        "name": f"Partition {partition_id}",
+                        "arming_state": disarmed,
+                        "exit_delay_timer": 60,
+                    }
+                    for partition_id in range(1, partitions + 1)
+                ],
+                "zones": fixture_zones,
+            }
+        )
+    return {
+        "version": FIXTURE_VERSION,
+        "zone_fields": [
+            "zone_id",
+            "partition_id",
+            "description",
+            "status",
+            "zone_type_id",
+            "can_be_bypassed",
+            "battery_level",
+            "signal_strength",
+        ],
+        "locations": fixture_locations,
+    }
+
+
+class FakeTotalConnectClient(TotalConnectClient):
+    """TotalConnectClient that sends its requests to a fake server."""
+
+    def __init__(
+        self,
+        server: FakeTotalConnectServer,
+        usercodes: dict[str, str] | None = None,
+        auto_bypass_battery: bool = False,
+        load_details: bool = True,
+    ) -> None:
+        """Initialize the client and load the fixture's locations."""
+        self.server = server
+        super().__init__(
+            "fake",
+            "fake",
+            usercodes or {"default": "1234"},
+            auto_bypass_battery,
+            retry_delay=0,
+            load_details=load_details,
+        )
+
+    def authenticate(self) -> None:
+        """Log in without credentials."""
+        self._invalid_credentials = False
+        self._logged_in = True
+
+    def http_request(
+        self,
+        endpoint: str,
+        method: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request to the fake server, with the client's retries."""
+        return self._request_with_retries(
+            lambda: self.server.handle(method, endpoint, params, data),
+            f"{method} {endpoint}",
+        )
+
+
+def main() -> None:
+    """Load a fixture and time polling it through the real client."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", help="fixture written by export_fixture")
+    parser.add_argument("--polls", type=int, default=10, help="number of polls")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="mean response time in seconds"
+    )
+    args = parser.parse_args()
+
+    server = FakeTotalConnectServer.from_file(args.fixture, latency=args.latency)
+    start = time.perf_counter()
+    client = FakeTotalConnectClient(server)
+    loaded = time.perf_counter() - start
+    print(
+        f"Loaded {len(client.locations)} locations, "
+        f"{sum(len(location.partitions) for location in client.locations.values())} "
+        f"partitions and "
+        f"{sum(len(location.zones) for location in client.locations.values())} "
+        f"zones in {loaded:.3f}s"
+    )
+
+    start = time.perf_counter()
+    for _ in range(args.polls):
+        for location in client.locations.values():
+            location.get_panel_meta_data()
+    elapsed = time.perf_counter() - start
+    print(
+        f"{args.polls} polls in {elapsed:.3f}s "
+        f"({elapsed / args.polls * 1000:.1f} ms/poll)"
+    )
+
+
+if __name__ == "__main__":
+    main()
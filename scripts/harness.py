@@ -0,0 +1,77 @@
+"""Run the integration in process against a fake Total Connect server.
+
+Shared by the load test and benchmark scripts. Starting Home Assistant
+outside of its bootstrap requires pytest-homeassistant-custom-component.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+import os
+import shutil
+import sys
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+from fake_total_connect import FakeTotalConnectClient, FakeTotalConnectServer
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_test_home_assistant,
+)
+
+from homeassistant import loader
+from homeassistant.core import HomeAssistant
+
+DOMAIN = "resideo_total_connect"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@asynccontextmanager
+async def async_home_assistant() -> AsyncIterator[HomeAssistant]:
+    """Start Home Assistant with this repository's custom components."""
+    config_dir = tempfile.mkdtemp()
+    try:
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Find the integration in this repository's custom_components
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            yield hass
+    finally:
+        shutil.rmtree(config_dir)
+
+
+@asynccontextmanager
+async def async_setup_account(
+    hass: HomeAssistant,
+    server: FakeTotalConnectServer,
+    options: Mapping[str, Any] | None = None,
+) -> AsyncIterator[MockConfigEntry]:
+    """Set up a config entry of the fake account, unloaded on exit."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "fake",
+            "password": "fake",
+            "usercodes": {
+                str(location_id): "1234" for location_id in server.locations
+            },
+        },
+        options=dict(options or {}),
+        unique_id="fake",
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "total_connect_client.client.TotalConnectClient",
+        lambda *_args, load_details=True: FakeTotalConnectClient(
+            server, load_details=load_details
+        ),
+    ):
+        if not await hass.config_entries.async_setup(entry.entry_id):
+            raise SystemExit("Failed to set up the integration")
+    await hass.async_block_till_done()
+    try:
+        yield entry
+    finally:
+        await hass.config_entries.async_unload(entry.entry_id)
+        await hass.config_entries.async_remove(entry.entry_id)
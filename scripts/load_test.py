@@ -0,0 +1,210 @@
+"""Load test concurrent panel commands against a fake Total Connect panel.
+
+Home Assistant is started in process with the integration set up against
+FakeTotalConnectServer, then many arm, disarm and bypass commands are run
+at once as service calls and button presses. The calls go through the real
+alarm control panel and button entities, so the results include the
+integration's own locking, refreshes and error handling, for example:
+
+    python scripts/load_test.py --commands 500 --concurrency 20 \
+        --latency 0.2 --busy-rate 0.05
+
+Pass a fixture written by the export_fixture service to load test the shape
+of a production account instead of a synthetic one. Starting Home Assistant
+outside of its bootstrap requires pytest-homeassistant-custom-component.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+import logging
+import random
+import statistics
+import time
+
+from fake_total_connect import FakeTotalConnectServer, synthetic_fixture
+from harness import async_home_assistant, async_setup_account
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+# Operation name: (service domain, service)
+OPERATIONS = {
+    "arm_away": ("alarm_control_panel", "alarm_arm_away"),
+    "arm_home": ("alarm_control_panel", "alarm_arm_home"),
+    "disarm": ("alarm_control_panel", "alarm_disarm"),
+    "bypass": ("button", "press"),
+    "clear_bypass": ("button", "press"),
+}
+
+
+@dataclass
+class OperationResults:
+    """Latencies and errors of one operation."""
+
+    latencies: list[float] = field(default_factory=list)
+    errors: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def calls(self) -> int:
+        """Return the number of calls."""
+        return len(self.latencies)
+
+    def percentile(self, percent: int) -> float:
+        """Return a latency percentile in milliseconds."""
+        if len(self.latencies) < 2:
+            return sum(self.latencies) * 1000
+        return statistics.quantiles(self.latencies, n=100)[percent - 1] * 1000
+
+
+def _targets(hass: HomeAssistant, entry_id: str) -> dict[str, list[str]]:
+    """Return the entities each operation is run against."""
+    targets: dict[str, list[str]] = defaultdict(list)
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), entry_id):
+        if entity.domain == "alarm_control_panel":
+            for operation in ("arm_away", "arm_home", "disarm"):
+                targets[operation].append(entity.entity_id)
+        elif entity.domain == "button" and entity.unique_id.endswith("_bypass"):
+            key = "clear_bypass" if "clear_bypass" in entity.unique_id else "bypass"
+            targets[key].append(entity.entity_id)
+    return targets
+
+
+async def _async_call(
+    hass: HomeAssistant,
+    operation: str,
+    entity_id: str,
+    results: dict[str, OperationResults],
+) -> None:
+    """Run one operation and record its latency and error."""
+    domain, service = OPERATIONS[operation]
+    start = time.perf_counter()
+    try:
+        await hass.services.async_call(
+            domain, service, {"entity_id": entity_id}, blocking=True
+        )
+    except Exception as error:  # noqa: BLE001
+        name = type(error).__name__
+        if key := getattr(error, "translation_key", None):
+            name = f"{name}({key})"
+        results[operation].errors[name] += 1
+    results[operation].latencies.append(time.perf_counter() - start)
+
+
+async def async_run(args: argparse.Namespace) -> None:
+    """Set up the integration and run the load."""
+    options = {"latency": args.latency, "busy_rate": args.busy_rate, "seed": args.seed}
+    if args.fixture:
+        server = FakeTotalConnectServer.from_file(args.fixture, **options)
+    else:
+        server = FakeTotalConnectServer(
+            synthetic_fixture(args.locations, args.partitions, args.zones), **options
+        )
+    async with (
+        async_home_assistant() as hass,
+        async_setup_account(hass, server) as entry,
+    ):
+        await _async_load(hass, entry.entry_id, server, args)
+
+
+async def _async_load(
+    hass: HomeAssistant,
+    entry_id: str,
+    server: FakeTotalConnectServer,
+    args: argparse.Namespace,
+) -> None:
+    """Run the commands with bounded concurrency and print the report."""
+    targets = _targets(hass, entry_id)
+    operations = [operation for operation in args.operations if targets[operation]]
+    rng = random.Random(args.seed)
+    queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+    for _ in range(args.commands):
+        operation = rng.choice(operations)
+        queue.put_nowait((operation, rng.choice(targets[operation])))
+
+    results: dict[str, OperationResults] = defaultdict(OperationResults)
+    requests_before = sum(server.requests.values())
+
+    async def worker() -> None:
+        while not queue.empty():
+            operation, entity_id = queue.get_nowait()
+            await _async_call(hass, operation, entity_id, results)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    _print_report(results, elapsed)
+    print(
+        f"\n{sum(server.requests.values()) - requests_before} API requests, "
+        f"panel busy responses: {dict(server.busy) or 0}"
+    )
+
+
+def _print_report(results: dict[str, OperationResults], elapsed: float) -> None:
+    """Print throughput, error rate and latency percentiles per operation."""
+    print(
+        f"{'operation':<14} {'calls':>6} {'errors':>7} {'error %':>8} "
+        f"{'p50 ms':>9} {'p99 ms':>9}"
+    )
+    total = OperationResults()
+    for operation, result in sorted(results.items()):
+        total.latencies.extend(result.latencies)
+        total.errors.update(result.errors)
+        _print_row(operation, result)
+    _print_row("total", total)
+    print(f"\n{total.calls} calls in {elapsed:.2f}s ({total.calls / elapsed:.1f}/s)")
+    for name, count in total.errors.most_common():
+        print(f"  {count:>6} {name}")
+
+
+def _print_row(name: str, result: OperationResults) -> None:
+    """Print the report line of an operation."""
+    errors = sum(result.errors.values())
+    print(
+        f"{name:<14} {result.calls:>6} {errors:>7} "
+        f"{errors / result.calls * 100 if result.calls else 0:>7.1f}% "
+        f"{result.percentile(50):>9.1f} {result.percentile(99):>9.1f}"
+    )
+
+
+def main() -> None:
+    """Parse the arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", nargs="?", help="fixture written by export_fixture")
+    parser.add_argument("--commands", type=int, default=200, help="calls to run")
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="calls in flight at once"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.05, help="mean response time in seconds"
+    )
+    parser.add_argument(
+        "--busy-rate", type=float, default=0.0, help="share of commands failing busy"
+    )
+    parser.add_argument(
+        "--operations",
+        nargs="+",
+        choices=OPERATIONS,
+        default=list(OPERATIONS),
+        help="operations to mix",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument(
+        "--locations", type=int, default=1, help="synthetic locations"
+    )
+    parser.add_argument(
+        "--partitions", type=int, default=2, help="synthetic partitions per location"
+    )
+    parser.add_argument(
+        "--zones", type=int, default=16, help="synthetic zones per location"
+    )
+    args = parser.parse_args()
+    # Failed commands are expected under load, only report them once
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(async_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Tests for the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from dataclasses import replace
+from types import MappingProxyType
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from total_connect_client import ArmingState
+
+from custom_components.resideo_total_connect.models import (
+    LocationSnapshot,
+    PartitionSnapshot,
+    TotalConnectSnapshot,
+    ZoneSnapshot,
+)
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass
+from homeassistant.core import HomeAssistant
+
+LOCATION_ID = 1
+PANEL = "alarm_control_panel.location_1_security_panel"
+PANEL_PARTITION_2 = "alarm_control_panel.location_1_security_panel_partition_2"
+# The second location of the fixture has a single partition
+OTHER_PANEL = "alarm_control_panel.location_2_security_panel"
+
+
+async def async_poll(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Poll every location now, whether due or not."""
+    await entry.runtime_data.coordinator.async_refresh_all()
+    await hass.async_block_till_done()
+
+
+def zone_snapshot(zone_id: int, **changes: object) -> ZoneSnapshot:
+    """Return a closed entry/exit zone of partition 1, with changes."""
+    zone = ZoneSnapshot(
+        zone_id=zone_id,
+        partition_id=1,
+        description=f"Zone {zone_id}",
+        status=0,
+        zone_type_id=1,
+        can_be_bypassed=True,
+        is_bypassed=False,
+        is_faulted=False,
+        is_triggered=False,
+        is_tampered=False,
+        is_low_battery=False,
+        is_button=False,
+        device_class=BinarySensorDeviceClass.DOOR,
+    )
+    return replace(zone, **changes)
+
+
+def partition_snapshot(
+    partition_id: int, arming_state: ArmingState, exit_delay_timer: int = 30
+) -> PartitionSnapshot:
+    """Return a partition."""
+    return PartitionSnapshot(
+        partition_id=partition_id,
+        name=f"Partition {partition_id}",
+        arming_state=arming_state,
+        exit_delay_timer=exit_delay_timer,
+    )
+
+
+def location_snapshot(
+    zones: list[ZoneSnapshot],
+    partitions: list[PartitionSnapshot] | None = None,
+) -> LocationSnapshot:
+    """Return a location, with a disarmed partition 1 by default."""
+    if partitions is None:
+        partitions = [partition_snapshot(1, ArmingState.DISARMED)]
+    return LocationSnapshot(
+        location_id=LOCATION_ID,
+        arming_state=ArmingState.DISARMED,
+        is_ac_loss=False,
+        is_low_battery=False,
+        is_cover_tampered=False,
+        partitions=MappingProxyType(
+            {partition.partition_id: partition for partition in partitions}
+        ),
+        zones=MappingProxyType({zone.zone_id: zone for zone in zones}),
+    )
+
+
+def snapshot(
+    zones: list[ZoneSnapshot],
+    partitions: list[PartitionSnapshot] | None = None,
+) -> TotalConnectSnapshot:
+    """Return a snapshot of a single location."""
+    return TotalConnectSnapshot(
+        locations=MappingProxyType({LOCATION_ID: location_snapshot(zones, partitions)})
+    )
@@ -0,0 +1,78 @@
+"""Fixtures for the Resideo Total Connect tests."""
+from __future__ import annotations
+
+from collections.abc import Generator
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.resideo_total_connect.const import DOMAIN
+from homeassistant.core import HomeAssistant
+
+# The tests share the fake server of the load test and benchmark scripts
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "scripts")
+)
+
+from fake_total_connect import (  # noqa: E402
+    FakeTotalConnectClient,
+    FakeTotalConnectServer,
+)
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "total_connect.json")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    enable_custom_integrations: None,
+) -> Generator[None]:
+    """Enable the integration in every test."""
+    yield
+
+
+@pytest.fixture
+def server() -> FakeTotalConnectServer:
+    """Return a fake Total Connect account with two locations."""
+    return FakeTotalConnectServer.from_file(FIXTURE)
+
+
+@pytest.fixture
+def mock_client(server: FakeTotalConnectServer) -> Generator[None]:
+    """Make clients send their requests to the fake server."""
+    with patch(
+        "total_connect_client.client.TotalConnectClient",
+        lambda *_args, load_details=True: FakeTotalConnectClient(
+            server, load_details=load_details
+        ),
+    ):
+        yield
+
+
+@pytest.fixture
+def config_entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return the config entry of the fake account."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "username": "fake",
+            "password": "fake",
+            "usercodes": {str(location_id): "1234" for location_id in (1, 2)},
+        },
+        unique_id="fake",
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def init_integration(
+    hass: HomeAssistant, config_entry: MockConfigEntry, mock_client: None
+) -> MockConfigEntry:
+    """Set up the integration with the fake account."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
+
@@ -0,0 +1,209 @@
+"""Tests for the alarm control panels of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from collections.abc import Generator
+from dataclasses import replace
+from typing import Any
+from unittest.mock import patch
+
+from fake_total_connect import FakeTotalConnectServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from total_connect_client import ArmingState
+from total_connect_client.exceptions import ServiceUnavailable
+
+from custom_components.resideo_total_connect.const import ARM_PRECHECK
+from custom_components.resideo_total_connect.retry import COMMAND_RETRY_POLICIES
+from homeassistant.components.alarm_control_panel import (
+    DOMAIN as ALARM_DOMAIN,
+    AlarmControlPanelState,
+)
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    SERVICE_ALARM_ARM_AWAY,
+    SERVICE_ALARM_DISARM,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from . import LOCATION_ID, PANEL, PANEL_PARTITION_2, async_poll
+
+
+@pytest.fixture
+def fast_retries() -> Generator[None]:
+    """Retry commands without waiting."""
+    with patch.dict(
+        COMMAND_RETRY_POLICIES,
+        {
+            command: replace(policy, base_delay=0, max_delay=0)
+            for command, policy in COMMAND_RETRY_POLICIES.items()
+        },
+    ):
+        yield
+
+
+def _fail_commands(
+    server: FakeTotalConnectServer, failures: int, applied: bool = False
+) -> list[str]:
+    """Make the first commands fail as unavailable and return those sent.
+
+    With applied, the panel runs the failed commands and only their
+    response is lost.
+    """
+    handle = server.handle
+    sent: list[str] = []
+
+    def failing_handle(
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        if method != "PUT":
+            return handle(method, endpoint, params, data)
+        sent.append(endpoint)
+        if len(sent) > failures:
+            return handle(method, endpoint, params, data)
+        if applied:
+            handle(method, endpoint, params, data)
+        raise ServiceUnavailable("Connection lost")
+
+    server.handle = failing_handle  # type: ignore[method-assign]
+    return sent
+
+
+async def _async_arm_away(hass: HomeAssistant, entity_id: str) -> None:
+    """Arm a partition away."""
+    await hass.services.async_call(
+        ALARM_DOMAIN,
+        SERVICE_ALARM_ARM_AWAY,
+        {ATTR_ENTITY_ID: entity_id},
+        blocking=True,
+    )
+
+
+async def test_precheck_blocks_faulted_zones(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test arming with the precheck is refused without calling the panel."""
+    hass.config_entries.async_update_entry(
+        init_integration, options={ARM_PRECHECK: True}
+    )
+    await hass.async_block_till_done()
+
+    with pytest.raises(HomeAssistantError) as error:
+        await _async_arm_away(hass, PANEL)
+
+    assert error.value.translation_key == "arm_blocked"
+    assert error.value.translation_placeholders["zones"] == "Motion"
+    assert server.requests["arm"] == 0
+    assert hass.states.get(PANEL).state == AlarmControlPanelState.DISARMED
+
+
+async def test_no_precheck_sends_command(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test arming without the precheck leaves the decision to the panel."""
+    with pytest.raises(HomeAssistantError) as error:
+        await _async_arm_away(hass, PANEL)
+
+    assert error.value.translation_key == "arm_away_failed"
+    assert server.requests["arm"] == 1
+
+
+@pytest.mark.usefixtures("fast_retries")
+async def test_command_retried_while_unavailable(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a command that did not reach the panel is sent again."""
+    sent = _fail_commands(server, 1)
+    polls = server.requests["full_status"]
+
+    await _async_arm_away(hass, PANEL_PARTITION_2)
+
+    assert len(sent) == 2
+    # The retry is confirmed first, and the command is refreshed after
+    assert server.requests["full_status"] == polls + 2
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.ARMED_AWAY
+
+
+@pytest.mark.usefixtures("fast_retries")
+async def test_command_with_lost_response_not_sent_again(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a command the panel ran is not sent again to retry it."""
+    sent = _fail_commands(server, 1, applied=True)
+
+    await _async_arm_away(hass, PANEL_PARTITION_2)
+
+    assert len(sent) == 1
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.ARMED_AWAY
+
+
+@pytest.mark.usefixtures("fast_retries")
+async def test_command_fails_after_last_attempt(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a command fails once its attempts are used up."""
+    sent = _fail_commands(server, 10)
+
+    with pytest.raises(HomeAssistantError) as error:
+        await _async_arm_away(hass, PANEL_PARTITION_2)
+
+    assert error.value.translation_key == "arm_away_failed"
+    assert len(sent) == COMMAND_RETRY_POLICIES["arm_away"].attempts
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.DISARMED
+
+
+@pytest.mark.usefixtures("fast_retries")
+async def test_unavailable_confirmation_is_retried(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a retry whose confirming poll fails is an attempt that failed."""
+    location = server.locations[LOCATION_ID]
+    location["arming_state"] = ArmingState.ARMED_AWAY.value
+    location["partitions"][2]["arming_state"] = ArmingState.ARMED_AWAY.value
+    await async_poll(hass, init_integration)
+    sent = _fail_commands(server, 1)
+    handle = server.handle
+    polls: list[str] = []
+
+    def failing_poll(
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        if endpoint.endswith("fullStatus"):
+            polls.append(endpoint)
+            # The poll confirming the first retry fails
+            if len(polls) == 1:
+                raise ServiceUnavailable("Connection lost")
+        return handle(method, endpoint, params, data)
+
+    server.handle = failing_poll  # type: ignore[method-assign]
+
+    await hass.services.async_call(
+        ALARM_DOMAIN,
+        SERVICE_ALARM_DISARM,
+        {ATTR_ENTITY_ID: PANEL_PARTITION_2},
+        blocking=True,
+    )
+
+    # The second attempt ends with the failed poll, the third confirms the
+    # partition is still armed and sends the command again
+    assert len(sent) == 2
+    assert len(polls) == 3
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.DISARMED
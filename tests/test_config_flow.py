@@ -0,0 +1,56 @@
+"""Tests for the config flow of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+import requests
+from total_connect_client.exceptions import AuthenticationError, ServiceUnavailable
+
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+
+@pytest.mark.parametrize(
+    ("exception", "error"),
+    [
+        (AuthenticationError("bad password"), "invalid_auth"),
+        (ServiceUnavailable("down"), "cannot_connect"),
+        (requests.exceptions.ConnectionError("reset"), "unknown"),
+    ],
+)
+async def test_reauth_failure_restores_credentials(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    exception: Exception,
+    error: str,
+) -> None:
+    """Test a failed reauth keeps the credentials of the running client."""
+    client = init_integration.runtime_data.client
+    # Reauthentication follows a login that failed
+    client._invalid_credentials = True
+    result = await init_integration.start_reauth_flow(hass)
+
+    with patch.object(client, "authenticate", side_effect=exception):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {CONF_PASSWORD: "new"}
+        )
+
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": error}
+    assert client.password == "fake"
+    assert client._invalid_credentials is True
+    assert init_integration.data[CONF_PASSWORD] == "fake"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {CONF_PASSWORD: "new"}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reauth_successful"
+    assert client.password == "new"
+    assert client._invalid_credentials is False
+    assert init_integration.data[CONF_PASSWORD] == "new"
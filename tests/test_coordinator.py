@@ -0,0 +1,104 @@
+"""Tests for the coordinator of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from fake_total_connect import FakeTotalConnectServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from total_connect_client import ArmingState
+
+from custom_components.resideo_total_connect.coordinator import TOPOLOGY_REMOVE_POLLS
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from . import LOCATION_ID, async_poll
+
+GARAGE_DOOR = "binary_sensor.garage_door"
+PANEL_PARTITION_3 = "alarm_control_panel.location_1_security_panel_partition_3"
+
+
+def _entity_ids(hass: HomeAssistant, entry: MockConfigEntry) -> set[str]:
+    """Return the registered entities of a config entry."""
+    return {
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+    }
+
+
+async def test_zone_added_and_removed(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test entities of zones added and removed at the panel follow them."""
+    before = _entity_ids(hass, init_integration)
+    zones = server.locations[LOCATION_ID]["zones"]
+    garage_door = {
+        "zone_id": 5,
+        "partition_id": 1,
+        "description": "Garage Door",
+        "status": 2,
+        "zone_type_id": 1,
+        "can_be_bypassed": True,
+        "battery_level": 5,
+        "signal_strength": 5,
+    }
+    zones[5] = garage_door
+
+    await async_poll(hass, init_integration)
+
+    assert hass.states.get(GARAGE_DOOR).state == STATE_ON
+    added = _entity_ids(hass, init_integration) - before
+    assert GARAGE_DOOR in added
+    device_registry = dr.async_get(hass)
+    device_id = er.async_get(hass).async_get(GARAGE_DOOR).device_id
+    assert device_registry.async_get(device_id) is not None
+
+    # A zone missing from a few polls is kept, it may be a glitch
+    del zones[5]
+    for _ in range(TOPOLOGY_REMOVE_POLLS - 1):
+        await async_poll(hass, init_integration)
+    assert GARAGE_DOOR in _entity_ids(hass, init_integration)
+
+    zones[5] = {**garage_door, "status": 0}
+    await async_poll(hass, init_integration)
+    assert hass.states.get(GARAGE_DOOR).state == STATE_OFF
+
+    del zones[5]
+    for _ in range(TOPOLOGY_REMOVE_POLLS):
+        await async_poll(hass, init_integration)
+
+    assert _entity_ids(hass, init_integration) == before
+    assert hass.states.get(GARAGE_DOOR) is None
+    assert device_registry.async_get(device_id) is None
+
+
+async def test_partition_added_and_removed(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test entities of partitions added and removed at the panel follow them."""
+    before = _entity_ids(hass, init_integration)
+    partitions = server.locations[LOCATION_ID]["partitions"]
+    partitions[3] = {
+        "partition_id": 3,
+        "name": "Barn",
+        "arming_state": ArmingState.DISARMED.value,
+        "exit_delay_timer": 10,
+    }
+
+    await async_poll(hass, init_integration)
+
+    assert hass.states.get(PANEL_PARTITION_3) is not None
+    added = _entity_ids(hass, init_integration) - before
+    assert PANEL_PARTITION_3 in added
+    assert all("partition_3" in entity_id for entity_id in added)
+
+    del partitions[3]
+    for _ in range(TOPOLOGY_REMOVE_POLLS):
+        await async_poll(hass, init_integration)
+
+    assert _entity_ids(hass, init_integration) == before
+    assert hass.states.get(PANEL_PARTITION_3) is None
@@ -0,0 +1,104 @@
+"""Tests for the exit delay countdowns of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from total_connect_client import ArmingState
+
+from custom_components.resideo_total_connect.exit_delay import (
+    COMMAND_GRACE,
+    ExitDelayTracker,
+)
+from homeassistant.components.alarm_control_panel import DOMAIN as ALARM_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_ALARM_ARM_AWAY
+from homeassistant.core import HomeAssistant
+import homeassistant.util.dt as dt_util
+
+from . import LOCATION_ID, PANEL_PARTITION_2, partition_snapshot, snapshot
+
+EXIT_DELAY = "sensor.location_1_security_panel_partition_2_exit_delay"
+KEY = (LOCATION_ID, 1)
+
+
+def _snapshot(arming_state: ArmingState, exit_delay_timer: int = 30):
+    """Return a snapshot of partition 1 in arming_state."""
+    return snapshot([], [partition_snapshot(1, arming_state, exit_delay_timer)])
+
+
+async def test_start(hass: HomeAssistant, freezer: FrozenDateTimeFactory) -> None:
+    """Test an accepted arm command starts the countdown."""
+    tracker = ExitDelayTracker()
+
+    assert tracker.async_start(LOCATION_ID, 1, 30)
+
+    assert tracker.changed == {KEY}
+    assert tracker.ends_at(LOCATION_ID, 1) == dt_util.utcnow() + timedelta(seconds=30)
+    freezer.tick(timedelta(seconds=10.5))
+    assert tracker.remaining(LOCATION_ID, 1) == 20
+    freezer.tick(timedelta(seconds=60))
+    assert tracker.remaining(LOCATION_ID, 1) == 0
+
+
+async def test_start_without_delay(hass: HomeAssistant) -> None:
+    """Test partitions without an exit delay have no countdown."""
+    tracker = ExitDelayTracker()
+
+    assert not tracker.async_start(LOCATION_ID, 1, 0)
+    assert not tracker.async_start(LOCATION_ID, 1, None)
+
+    assert tracker.ends_at(LOCATION_ID, 1) is None
+    assert tracker.remaining(LOCATION_ID, 1) == 0
+
+
+async def test_sync_starts_arming_partitions(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a refresh that shows a partition arming starts its countdown."""
+    tracker = ExitDelayTracker()
+
+    assert tracker.async_sync(_snapshot(ArmingState.ARMING, 45)) == {KEY}
+    assert tracker.remaining(LOCATION_ID, 1) == 45
+
+    # Later refreshes while arming keep the countdown going
+    freezer.tick(timedelta(seconds=20))
+    assert tracker.async_sync(_snapshot(ArmingState.ARMING, 45)) == set()
+    assert tracker.remaining(LOCATION_ID, 1) == 25
+
+
+async def test_sync_keeps_command_countdown_during_grace(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a refresh that does not show arming yet keeps a new countdown."""
+    tracker = ExitDelayTracker()
+    tracker.async_start(LOCATION_ID, 1, 30)
+
+    freezer.tick(COMMAND_GRACE / 2)
+    assert tracker.async_sync(_snapshot(ArmingState.DISARMED)) == set()
+    assert tracker.ends_at(LOCATION_ID, 1) is not None
+
+    freezer.tick(COMMAND_GRACE)
+    assert tracker.async_sync(_snapshot(ArmingState.ARMED_AWAY)) == {KEY}
+    assert tracker.ends_at(LOCATION_ID, 1) is None
+    assert tracker.changed == {KEY}
+
+
+async def test_sensor_counts_down_after_command(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the countdown shows once the panel accepts an arm command."""
+    assert hass.states.get(EXIT_DELAY).state == "0"
+
+    await hass.services.async_call(
+        ALARM_DOMAIN,
+        SERVICE_ALARM_ARM_AWAY,
+        {ATTR_ENTITY_ID: PANEL_PARTITION_2},
+        blocking=True,
+    )
+
+    # The fake panel reports the partition armed at once, the countdown of
+    # the command survives that refresh
+    assert hass.states.get(EXIT_DELAY).state == "30"
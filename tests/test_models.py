@@ -0,0 +1,104 @@
+"""Tests for the snapshot models of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from total_connect_client import ArmingState
+
+from custom_components.resideo_total_connect.models import (
+    SnapshotDiff,
+    TotalConnectSnapshot,
+)
+
+from . import LOCATION_ID, partition_snapshot, snapshot, zone_snapshot
+
+
+def test_first_snapshot_adds_everything() -> None:
+    """Test every zone and partition is added without a previous snapshot."""
+    current = snapshot([zone_snapshot(1), zone_snapshot(2)])
+
+    diff = SnapshotDiff.between(None, current, lambda location_id: set())
+
+    assert sorted(new.zone_id for _, old, new in diff.zones if old is None) == [1, 2]
+    assert diff.partitions == (
+        (LOCATION_ID, None, current.locations[LOCATION_ID].partitions[1]),
+    )
+
+
+def test_shared_location_is_skipped() -> None:
+    """Test a location shared with the previous snapshot is not compared."""
+    previous = snapshot([zone_snapshot(1)])
+    current = TotalConnectSnapshot(locations=previous.locations)
+
+    diff = SnapshotDiff.between(previous, current)
+
+    assert diff == SnapshotDiff(zones=(), partitions=())
+
+
+def test_zones_of_interest() -> None:
+    """Test only the zones of interest are compared."""
+    previous = snapshot([zone_snapshot(1), zone_snapshot(2)])
+    current = snapshot(
+        [zone_snapshot(1, is_faulted=True), zone_snapshot(2, is_faulted=True)]
+    )
+
+    diff = SnapshotDiff.between(previous, current, lambda location_id: {2})
+
+    assert diff.zones == (
+        (
+            LOCATION_ID,
+            previous.locations[LOCATION_ID].zones[2],
+            current.locations[LOCATION_ID].zones[2],
+        ),
+    )
+
+
+def test_no_zones_of_interest_compares_all() -> None:
+    """Test None as the zones of interest compares every zone."""
+    previous = snapshot([zone_snapshot(1), zone_snapshot(2)])
+    current = snapshot(
+        [zone_snapshot(1, is_faulted=True), zone_snapshot(2, is_faulted=True)]
+    )
+
+    diff = SnapshotDiff.between(previous, current, lambda location_id: None)
+
+    assert sorted(new.zone_id for _, _, new in diff.zones) == [1, 2]
+
+
+def test_added_and_removed_zones_are_always_reported() -> None:
+    """Test zones added or removed are reported even if not of interest."""
+    previous = snapshot([zone_snapshot(1), zone_snapshot(2)])
+    current = snapshot([zone_snapshot(1), zone_snapshot(3)])
+
+    diff = SnapshotDiff.between(previous, current, lambda location_id: set())
+
+    assert sorted(
+        ((old or new).zone_id, old is None, new is None) for _, old, new in diff.zones
+    ) == [(2, False, True), (3, True, False)]
+
+
+def test_interest_in_missing_zone_is_ignored() -> None:
+    """Test a zone of interest that does not exist is not reported."""
+    previous = snapshot([zone_snapshot(1)])
+    current = snapshot([zone_snapshot(1)])
+
+    diff = SnapshotDiff.between(previous, current, lambda location_id: {1, 5})
+
+    assert diff.zones == ()
+
+
+def test_partition_changes_ignore_zones_of_interest() -> None:
+    """Test partitions are always compared."""
+    previous = snapshot([zone_snapshot(1)])
+    current = snapshot(
+        [zone_snapshot(1)],
+        [
+            partition_snapshot(1, ArmingState.ARMED_AWAY),
+            partition_snapshot(2, ArmingState.DISARMED),
+        ],
+    )
+
+    diff = SnapshotDiff.between(previous, current, lambda location_id: set())
+
+    assert diff.zones == ()
+    assert sorted(
+        (new.partition_id, old is None) for _, old, new in diff.partitions
+    ) == [(1, False), (2, True)]
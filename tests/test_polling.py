@@ -0,0 +1,137 @@
+"""Tests for the polling schedule of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+
+from fake_total_connect import FakeTotalConnectServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.resideo_total_connect.const import (
+    LOCATION_PRIORITIES,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_ON_DEMAND,
+)
+from custom_components.resideo_total_connect.polling import (
+    MIN_POLL_PERIOD,
+    PollScheduler,
+)
+from homeassistant.core import HomeAssistant
+
+from . import async_poll
+
+INTERVAL = timedelta(seconds=30)
+
+
+def _scheduler(priorities: dict[str, str] | None = None) -> PollScheduler:
+    """Return a scheduler polling every 30 seconds."""
+    scheduler = PollScheduler()
+    scheduler.configure(INTERVAL, priorities or {})
+    return scheduler
+
+
+def test_new_locations_are_due() -> None:
+    """Test locations never polled are due."""
+    assert _scheduler().due([1, 2], INTERVAL) == {1, 2}
+
+
+def test_polled_locations_wait_for_their_period() -> None:
+    """Test a polled location is due again after its period."""
+    scheduler = _scheduler()
+    now = time.monotonic()
+    scheduler.polled([1], now)
+    scheduler.polled([2], now - INTERVAL.total_seconds())
+
+    assert scheduler.due([1, 2], INTERVAL) == {2}
+
+
+def test_due_within_half_a_tick() -> None:
+    """Test a location due before the next tick is polled now."""
+    scheduler = _scheduler()
+    now = time.monotonic()
+    # Due in a third of a tick, it would be polled a tick late otherwise
+    scheduler.polled([1], now - INTERVAL.total_seconds() * 2 / 3)
+    # Due in two thirds of a tick, the next tick is closer
+    scheduler.polled([2], now - INTERVAL.total_seconds() / 3)
+
+    assert scheduler.due([1, 2], INTERVAL) == {1}
+
+
+def test_priorities() -> None:
+    """Test each priority polls at its own period."""
+    scheduler = _scheduler(
+        {"1": PRIORITY_HIGH, "2": PRIORITY_LOW, "3": PRIORITY_ON_DEMAND}
+    )
+
+    assert scheduler.periods([1, 2, 3, 4]) == {
+        1: INTERVAL / 2,
+        2: INTERVAL * 5,
+        4: INTERVAL,
+    }
+    # Only high priority locations are polled at every tick
+    tick, calls_per_tick = scheduler.tick([1, 2, 3, 4])
+    assert tick == INTERVAL / 2
+    assert calls_per_tick == 1 + 0.1 + 0.5
+    # On demand locations are never due
+    assert scheduler.due([3], tick) == set()
+
+
+def test_minimum_period() -> None:
+    """Test high priority locations are not polled too often."""
+    scheduler = PollScheduler()
+    scheduler.configure(timedelta(seconds=10), {"1": PRIORITY_HIGH})
+
+    assert scheduler.periods([1]) == {1: MIN_POLL_PERIOD}
+
+
+def test_stretch() -> None:
+    """Test a stretched schedule delays the next polls alike."""
+    scheduler = _scheduler()
+    scheduler.stretch = 2
+    scheduler.polled([1], time.monotonic() - INTERVAL.total_seconds())
+
+    assert scheduler.due([1], INTERVAL) == set()
+
+
+def test_configure_resets_schedule() -> None:
+    """Test new options poll every location at the next tick."""
+    scheduler = _scheduler()
+    scheduler.polled([1], time.monotonic())
+
+    scheduler.configure(INTERVAL, {"1": PRIORITY_HIGH})
+
+    assert scheduler.due([1], INTERVAL / 2) == {1}
+
+
+async def test_refresh_polls_due_locations(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a refresh right after a poll polls no location."""
+    coordinator = init_integration.runtime_data.coordinator
+    polls = server.requests["full_status"]
+
+    await coordinator.async_refresh()
+
+    assert server.requests["full_status"] == polls
+
+
+async def test_refresh_all_polls_every_location(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a forced refresh polls every location, due or not."""
+    hass.config_entries.async_update_entry(
+        init_integration,
+        options={LOCATION_PRIORITIES: {"2": PRIORITY_ON_DEMAND}},
+    )
+    await hass.async_block_till_done()
+    polls = server.requests["full_status"]
+
+    await async_poll(hass, init_integration)
+    await async_poll(hass, init_integration)
+
+    assert server.requests["full_status"] == polls + 4
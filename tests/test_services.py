@@ -0,0 +1,178 @@
+"""Tests for the services of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from fake_total_connect import FakeTotalConnectServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from total_connect_client import ArmingState
+
+from custom_components.resideo_total_connect.alarm_control_panel import (
+    TotalConnectAlarmControlPanelEntity,
+)
+from custom_components.resideo_total_connect.const import DOMAIN
+from homeassistant.components.alarm_control_panel import AlarmControlPanelState
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from . import LOCATION_ID, OTHER_PANEL, PANEL, PANEL_PARTITION_2, async_poll
+
+
+async def test_arm_partitions_refreshes_once(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test partitions of a location are armed with a single refresh."""
+    # Close the motion sensor so that partition 1 can be armed away
+    server.locations[LOCATION_ID]["zones"][2]["status"] = 0
+    polls = server.requests["full_status"]
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "arm_partitions",
+        {"entity_id": [PANEL, PANEL_PARTITION_2], "mode": "away"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {
+        "results": {PANEL: {"success": True}, PANEL_PARTITION_2: {"success": True}}
+    }
+    assert server.requests["arm"] == 2
+    assert server.requests["full_status"] == polls + 1
+    assert hass.states.get(PANEL).state == AlarmControlPanelState.ARMED_AWAY
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.ARMED_AWAY
+
+
+async def test_arm_partitions_refreshes_locations_together(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test the locations of a config entry are refreshed in a single call."""
+    server.locations[LOCATION_ID]["zones"][2]["status"] = 0
+    coordinator = init_integration.runtime_data.coordinator
+    refresh_locations = coordinator.async_refresh_locations
+    refreshed: list[set[int]] = []
+
+    async def async_refresh_locations(location_ids):
+        refreshed.append(set(location_ids))
+        await refresh_locations(location_ids)
+
+    with patch.object(coordinator, "async_refresh_locations", async_refresh_locations):
+        await hass.services.async_call(
+            DOMAIN,
+            "arm_partitions",
+            {"entity_id": [PANEL, PANEL_PARTITION_2, OTHER_PANEL], "mode": "away"},
+            blocking=True,
+        )
+
+    assert refreshed == [{1, 2}]
+    assert hass.states.get(OTHER_PANEL).state == AlarmControlPanelState.ARMED_AWAY
+
+
+async def test_disarm_partitions_refreshes_once(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test partitions of a location are disarmed with a single refresh."""
+    location = server.locations[LOCATION_ID]
+    for partition in location["partitions"].values():
+        partition["arming_state"] = ArmingState.ARMED_AWAY.value
+    location["arming_state"] = ArmingState.ARMED_AWAY.value
+    await async_poll(hass, init_integration)
+    polls = server.requests["full_status"]
+
+    await hass.services.async_call(
+        DOMAIN,
+        "disarm_partitions",
+        {"entity_id": [PANEL, PANEL_PARTITION_2]},
+        blocking=True,
+    )
+
+    assert server.requests["disarm"] == 2
+    assert server.requests["full_status"] == polls + 1
+    assert hass.states.get(PANEL).state == AlarmControlPanelState.DISARMED
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.DISARMED
+
+
+async def test_arm_partitions_reports_failures(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+) -> None:
+    """Test a partition the panel refuses to arm does not stop the others."""
+    polls = server.requests["full_status"]
+
+    # The faulted motion sensor stops partition 1 from arming away
+    response = await hass.services.async_call(
+        DOMAIN,
+        "arm_partitions",
+        {"entity_id": [PANEL, PANEL_PARTITION_2], "mode": "away"},
+        blocking=True,
+        return_response=True,
+    )
+
+    result = response["results"][PANEL]
+    assert result["success"] is False
+    assert result["error"] == "arm_away_failed"
+    assert result["message"].startswith("Failed to arm away")
+    assert response["results"][PANEL_PARTITION_2] == {"success": True}
+    assert server.requests["full_status"] == polls + 1
+    assert hass.states.get(PANEL).state == AlarmControlPanelState.DISARMED
+    assert hass.states.get(PANEL_PARTITION_2).state == AlarmControlPanelState.ARMED_AWAY
+
+
+async def test_arm_partitions_reports_unexpected_errors(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    server: FakeTotalConnectServer,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test an unexpected error is reported as the command's failure."""
+    server.locations[LOCATION_ID]["zones"][2]["status"] = 0
+    send_command = TotalConnectAlarmControlPanelEntity._async_send_command
+
+    async def fail_partition_2(entity, trace, command):
+        if entity.entity_id == PANEL_PARTITION_2:
+            raise RuntimeError("secret details")
+        await send_command(entity, trace, command)
+
+    with patch.object(
+        TotalConnectAlarmControlPanelEntity, "_async_send_command", fail_partition_2
+    ):
+        response = await hass.services.async_call(
+            DOMAIN,
+            "arm_partitions",
+            {"entity_id": [PANEL, PANEL_PARTITION_2], "mode": "home"},
+            blocking=True,
+            return_response=True,
+        )
+
+    result = response["results"][PANEL_PARTITION_2]
+    assert result["success"] is False
+    assert result["error"] == "arm_home_failed"
+    assert result["message"].startswith("Failed to arm home")
+    assert "secret details" not in result["message"]
+    assert "Unexpected error running arm_home" in caplog.text
+    assert response["results"][PANEL] == {"success": True}
+
+
+async def test_arm_partitions_raises_without_response(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+) -> None:
+    """Test failed partitions are raised when no response is requested."""
+    with pytest.raises(HomeAssistantError) as error:
+        await hass.services.async_call(
+            DOMAIN,
+            "arm_partitions",
+            {"entity_id": [PANEL, PANEL_PARTITION_2], "mode": "away"},
+            blocking=True,
+        )
+
+    assert error.value.translation_key == "partition_command_failed"
+    assert error.value.translation_placeholders == {"entities": PANEL}
@@ -0,0 +1,97 @@
+"""Tests for the utilities of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+import pytest
+from total_connect_client.zone import ZoneType
+
+from custom_components.resideo_total_connect.const import (
+    ARM_AWAY,
+    ARM_AWAY_INSTANT,
+    ARM_HOME,
+    ARM_NIGHT,
+)
+from custom_components.resideo_total_connect.util import get_blocking_zones
+
+from . import location_snapshot, zone_snapshot
+
+
+def _blocking(command: str, *zones, auto_bypass: bool = False) -> list[int]:
+    """Return the ids of the zones of partition 1 that block command."""
+    return [
+        zone.zone_id
+        for zone in get_blocking_zones(
+            command, location_snapshot(list(zones)), 1, auto_bypass
+        )
+    ]
+
+
+@pytest.mark.parametrize("command", [ARM_AWAY, ARM_AWAY_INSTANT, ARM_HOME, ARM_NIGHT])
+def test_faulted_zone_blocks(command: str) -> None:
+    """Test a faulted perimeter zone blocks every arm mode."""
+    assert _blocking(
+        command,
+        zone_snapshot(1, is_faulted=True, zone_type_id=ZoneType.PERIMETER.value),
+        zone_snapshot(2),
+    ) == [1]
+
+
+def test_zones_that_do_not_block() -> None:
+    """Test zones that are closed, bypassed or not armed do not block."""
+    assert not _blocking(
+        ARM_AWAY,
+        # Closed
+        zone_snapshot(1),
+        # Bypassed
+        zone_snapshot(2, is_faulted=True, is_bypassed=True),
+        # Another partition
+        zone_snapshot(3, is_faulted=True, partition_id=2),
+        # A button
+        zone_snapshot(4, is_faulted=True, is_button=True),
+        # A 24 hour zone, not part of arming
+        zone_snapshot(5, is_faulted=True, zone_type_id=ZoneType.FIRE_SMOKE.value),
+    )
+
+
+@pytest.mark.parametrize(
+    ("command", "blocking"), [(ARM_AWAY, [1, 2]), (ARM_HOME, []), (ARM_NIGHT, [])]
+)
+def test_interior_zones(command: str, blocking: list[int]) -> None:
+    """Test interior zones only block arming away."""
+    assert (
+        sorted(
+            _blocking(
+                command,
+                zone_snapshot(
+                    1,
+                    is_faulted=True,
+                    zone_type_id=ZoneType.INTERIOR_FOLLOWER.value,
+                ),
+                zone_snapshot(
+                    2, is_faulted=True, zone_type_id=ZoneType.INTERIOR_DELAY.value
+                ),
+            )
+        )
+        == blocking
+    )
+
+
+@pytest.mark.parametrize(("auto_bypass", "blocking"), [(False, [1]), (True, [])])
+def test_auto_bypass_low_battery(auto_bypass: bool, blocking: list[int]) -> None:
+    """Test low battery zones the client bypasses itself do not block."""
+    assert (
+        _blocking(
+            ARM_AWAY,
+            zone_snapshot(1, is_faulted=True, is_low_battery=True),
+            auto_bypass=auto_bypass,
+        )
+        == blocking
+    )
+
+
+def test_auto_bypass_needs_bypassable_zone() -> None:
+    """Test a low battery zone that cannot be bypassed still blocks."""
+    assert _blocking(
+        ARM_AWAY,
+        zone_snapshot(1, is_faulted=True, is_low_battery=True, can_be_bypassed=False),
+        auto_bypass=True,
+    ) == [1]
@@ -0,0 +1,137 @@
+"""Tests for the zone statistics of the Resideo Total Connect integration."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from fake_total_connect import FakeTotalConnectServer
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.resideo_total_connect.const import (
+    ZONE_DIAGNOSTICS,
+    ZONE_DIAGNOSTICS_ATTRIBUTES,
+)
+from custom_components.resideo_total_connect.models import SnapshotDiff
+from custom_components.resideo_total_connect.zone_statistics import (
+    ZoneStatistics,
+    ZoneStatisticsTracker,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+import homeassistant.util.dt as dt_util
+
+from . import LOCATION_ID, async_poll, zone_snapshot
+
+KEY = (LOCATION_ID, 1)
+
+
+def _diff(*changes) -> SnapshotDiff:
+    """Return a diff of zone changes of the location."""
+    return SnapshotDiff(
+        zones=tuple((LOCATION_ID, old, new) for old, new in changes), partitions=()
+    )
+
+
+async def test_statistics_update(hass: HomeAssistant) -> None:
+    """Test open and closed time are split at each change."""
+    start = dt_util.utcnow()
+    statistics = ZoneStatistics(False, start)
+
+    statistics.update(True, start + timedelta(seconds=10))
+    statistics.update(False, start + timedelta(seconds=40))
+    statistics.update(False, start + timedelta(seconds=50))
+
+    now = start + timedelta(seconds=60)
+    assert statistics.openings == 1
+    assert statistics.open_time(now) == 30
+    assert statistics.closed_time(now) == 30
+
+
+async def test_tracker_counts_openings(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test openings and open time follow the zone changes of refreshes."""
+    tracker = ZoneStatisticsTracker(hass, "entry")
+    closed = zone_snapshot(1)
+    faulted = zone_snapshot(1, is_faulted=True)
+
+    # A zone seen for the first time is not an opening, even if open
+    assert tracker.async_apply(_diff((None, faulted))) == {KEY}
+    assert tracker.get(*KEY).openings == 0
+    freezer.tick(timedelta(seconds=20))
+    assert tracker.async_apply(_diff((faulted, closed))) == {KEY}
+    freezer.tick(timedelta(seconds=5))
+    tracker.async_apply(_diff((closed, faulted)))
+    freezer.tick(timedelta(seconds=10))
+
+    statistics = tracker.get(*KEY)
+    assert statistics.openings == 1
+    assert statistics.open_time(dt_util.utcnow()) == 30
+
+    # Changes that do not open or close the zone are not counted
+    assert tracker.async_apply(
+        _diff((faulted, zone_snapshot(1, is_faulted=True, is_low_battery=True)))
+    ) == set()
+
+    assert tracker.async_apply(_diff((faulted, None))) == {KEY}
+    assert tracker.get(*KEY) is None
+
+
+async def test_tracker_reset(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test a new period keeps followed zones and drops the others."""
+    tracker = ZoneStatisticsTracker(hass, "entry", lambda location_id: {1})
+    tracker.async_apply(_diff((None, zone_snapshot(1)), (None, zone_snapshot(2))))
+    tracker.async_apply(
+        _diff(
+            (zone_snapshot(1), zone_snapshot(1, is_faulted=True)),
+            (zone_snapshot(2), zone_snapshot(2, is_faulted=True)),
+        )
+    )
+    midnight = dt_util.start_of_local_day() + timedelta(days=1)
+    freezer.move_to(midnight + timedelta(seconds=15))
+
+    assert tracker.async_reset(dt_util.now()) == {KEY}
+
+    statistics = tracker.get(*KEY)
+    assert tracker.period_start == midnight
+    assert statistics.is_open
+    assert statistics.openings == 0
+    assert statistics.open_time(dt_util.utcnow()) == 15
+    assert tracker.get(LOCATION_ID, 2) is None
+
+
+async def test_statistics_as_attributes(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+    mock_client: None,
+    server: FakeTotalConnectServer,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test zone statistics are attributes of the zone with the option."""
+    hass.config_entries.async_update_entry(
+        config_entry, options={ZONE_DIAGNOSTICS: ZONE_DIAGNOSTICS_ATTRIBUTES}
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    zone = server.locations[LOCATION_ID]["zones"][1]
+
+    zone["status"] = 2
+    await async_poll(hass, config_entry)
+    freezer.tick(timedelta(seconds=90))
+    zone["status"] = 0
+    await async_poll(hass, config_entry)
+
+    state = hass.states.get("binary_sensor.front_door")
+    assert state.attributes["openings"] == 1
+    assert state.attributes["open_time"] == 90
+    registry = er.async_get(hass)
+    assert not [
+        entry
+        for entry in er.async_entries_for_config_entry(
+            registry, config_entry.entry_id
+        )
+        if entry.unique_id.endswith(("_open_time", "_openings"))
+    ]
+